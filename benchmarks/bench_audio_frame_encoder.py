@@ -0,0 +1,158 @@
+"""Compare AudioFrameEncoder with building AudioChunk events for every frame.
+
+Run from the repository root:
+
+    python benchmarks/bench_audio_frame_encoder.py [--seconds 30] [--runs 5]
+
+A PCM buffer is split into 1024 sample frames and serialized to wire
+buffers two ways: as wyoming does for an AudioChunk event (a copied slice,
+AudioChunk, Event and data dict per frame, then async_write_event), and by
+AudioFrameEncoder with memoryview slices of the buffer.  Time per frame is
+reported, and the memory allocated while encoding one frame, measured with
+tracemalloc as the peak above the memory held before the frame.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+from pathlib import Path
+import statistics
+import time
+import tracemalloc
+
+from wyoming.audio import AudioChunk
+from wyoming.event import async_write_event
+
+RATE = 22050
+WIDTH = 2
+CHANNELS = 1
+FRAME_BYTES = 1024 * WIDTH * CHANNELS
+
+
+def load_audio_module():
+    """Import audio.py without importing Home Assistant."""
+    path = Path(__file__).parents[1] / "custom_components" / "vaca" / "audio.py"
+    spec = importlib.util.spec_from_file_location("vaca_audio", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class NullWriter:
+    """StreamWriter stand-in that discards what is written."""
+
+    def write(self, data) -> None:
+        """Discard data."""
+
+    def writelines(self, data) -> None:
+        """Discard buffers."""
+        for _ in data:
+            pass
+
+    async def drain(self) -> None:
+        """Return at once."""
+
+
+def run_sync(coro) -> None:
+    """Run a coroutine that never suspends."""
+    try:
+        coro.send(None)
+    except StopIteration:
+        return
+    raise RuntimeError("Coroutine suspended")
+
+
+def write_events(pcm: bytes, writer: NullWriter, start: int, stop: int) -> None:
+    """Write frames as AudioChunk events, as the integration did."""
+    for offset in range(start, stop, FRAME_BYTES):
+        chunk = AudioChunk(
+            rate=RATE,
+            width=WIDTH,
+            channels=CHANNELS,
+            audio=pcm[offset : offset + FRAME_BYTES],
+            timestamp=offset // (RATE * WIDTH // 1000),
+        )
+        run_sync(async_write_event(chunk.event(), writer))
+
+
+def write_encoded(
+    encoder, pcm: bytes, writer: NullWriter, start: int, stop: int
+) -> None:
+    """Write frames encoded by AudioFrameEncoder."""
+    view = memoryview(pcm)
+    for offset in range(start, stop, FRAME_BYTES):
+        writer.writelines(
+            encoder.encode(
+                view[offset : offset + FRAME_BYTES],
+                offset // (RATE * WIDTH // 1000),
+            )
+        )
+
+
+def time_per_frame(write, pcm: bytes, runs: int) -> list[float]:
+    """Return microseconds per frame of each run."""
+    frames = len(pcm) // FRAME_BYTES
+    results = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        write(pcm, 0, frames * FRAME_BYTES)
+        results.append((time.perf_counter() - start) / frames * 1e6)
+    return results
+
+
+def allocated_per_frame(write, pcm: bytes, frames: int) -> float:
+    """Return mean bytes allocated while writing one frame."""
+    tracemalloc.start()
+    try:
+        peaks = []
+        for index in range(frames):
+            offset = index * FRAME_BYTES
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            write(pcm, offset, offset + FRAME_BYTES)
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - before)
+    finally:
+        tracemalloc.stop()
+    return statistics.mean(peaks)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=30)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    audio = load_audio_module()
+    encoder = audio.AudioFrameEncoder(RATE, WIDTH, CHANNELS)
+    writer = NullWriter()
+    pcm = bytes(range(256)) * (int(RATE * WIDTH * args.seconds) // 256)
+
+    methods = {
+        "AudioChunk events": lambda data, start, stop: write_events(
+            data, writer, start, stop
+        ),
+        "AudioFrameEncoder": lambda data, start, stop: write_encoded(
+            encoder, data, writer, start, stop
+        ),
+    }
+
+    print(
+        f"{len(pcm) // FRAME_BYTES} frames of {FRAME_BYTES} bytes, "
+        f"best of {args.runs} runs"
+    )
+    print(f"{'method':<20} {'us/frame':>10} {'median':>10} {'alloc B/frame':>14}")
+    frames = len(pcm) // FRAME_BYTES
+    for name, write in methods.items():
+        times = time_per_frame(write, pcm, args.runs)
+        allocated = allocated_per_frame(write, pcm, min(1000, frames))
+        print(
+            f"{name:<20} {min(times):>10.2f} {statistics.median(times):>10.2f} "
+            f"{allocated:>14.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,278 @@
+"""Benchmark the satellite audio path for TTS streaming and announcements.
+
+Run from the repository root, with the integration's requirements (Home
+Assistant) installed:
+
+    python benchmarks/bench_audio_path.py [--seconds 1 10 60] [--runs 3]
+        [--lead-ms 0]
+
+A simulated satellite (satellite_sim.py) runs in a subprocess, so its work
+is not counted.  For each audio length, a WAV stream is sent with the
+entity's _stream_tts, and the same audio is played as a WAV file with
+_async_play_announcements, first decoded and then from the decoded audio
+cache.  The methods run unchanged on a stand-in entity holding only the
+state they use, connected to the satellite with VAAsyncTcpClient.
+
+Reported per stream, as the median of the runs: time to first audio (call
+to the first chunk arriving at the satellite), frames per second (first to
+last chunk at the satellite), CPU time of this process, and peak Python
+memory allocated (tracemalloc, measured in an extra run).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import json
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+import wave
+
+import numpy as np
+from wyoming.snd import Played
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+# pylint: disable=wrong-import-position
+from custom_components.vaca.assist_satellite import (
+    _TTS_SAMPLE_RATE,
+    ViewAssistSatelliteEntity,
+)
+from custom_components.vaca.cache import async_get_decoded_audio_cache
+from custom_components.vaca.client import VAAsyncTcpClient
+from custom_components.vaca.const import SAMPLE_CHANNELS, SAMPLE_WIDTH
+from custom_components.vaca.decoder import (
+    async_close_decoder_pools,
+    async_get_decoder_pool,
+)
+from custom_components.vaca.playback import PlaybackController
+from homeassistant.core import HomeAssistant
+
+# pylint: enable=wrong-import-position
+
+SIMULATOR = Path(__file__).with_name("satellite_sim.py")
+# Bytes of WAV returned by each read of the TTS stream
+TTS_READ_BYTES = 4096
+
+
+def make_wav(seconds: float) -> bytes:
+    """Return a WAV file with a tone, as a TTS engine would produce."""
+    t = np.arange(int(_TTS_SAMPLE_RATE * seconds)) / _TTS_SAMPLE_RATE
+    samples = (np.sin(2 * np.pi * 440 * t) * 8000).astype("<i2")
+    with io.BytesIO() as wav_io:
+        with wave.open(wav_io, "wb") as wav_file:
+            wav_file.setframerate(_TTS_SAMPLE_RATE)
+            wav_file.setsampwidth(SAMPLE_WIDTH)
+            wav_file.setnchannels(SAMPLE_CHANNELS)
+            wav_file.writeframes(samples.tobytes())
+        return wav_io.getvalue()
+
+
+class WavResultStream:
+    """Stand-in for tts.ResultStream, yielding WAV bytes as synthesized."""
+
+    extension = "wav"
+
+    def __init__(self, wav: bytes) -> None:
+        """Initialize stream."""
+        self.wav = wav
+
+    async def async_stream_result(self):
+        """Yield the WAV in pieces, letting the event loop run in between."""
+        for offset in range(0, len(self.wav), TTS_READ_BYTES):
+            yield self.wav[offset : offset + TTS_READ_BYTES]
+            await asyncio.sleep(0)
+
+
+class BenchSatellite:
+    """Stand-in entity running the integration's audio methods.
+
+    Only the state the methods use is set up, so no config entry, device
+    or pipeline is needed.
+    """
+
+    _stream_tts = ViewAssistSatelliteEntity._stream_tts
+    _write_tts_chunk = ViewAssistSatelliteEntity._write_tts_chunk
+    _async_play_announcements = ViewAssistSatelliteEntity._async_play_announcements
+    _write_announce_chunk = ViewAssistSatelliteEntity._write_announce_chunk
+    _async_prefetch_media = ViewAssistSatelliteEntity._async_prefetch_media
+    _async_media_frames = ViewAssistSatelliteEntity._async_media_frames
+
+    def __init__(
+        self, hass: HomeAssistant, client: VAAsyncTcpClient, lead_ms: int
+    ) -> None:
+        """Initialize the stand-in entity."""
+        self.hass = hass
+        self.config_entry = self
+        self.device = SimpleNamespace(audio_lead_ms=lead_ms, metrics={})
+        self._client = client
+        self._playback = PlaybackController(
+            self.device.metrics.setdefault("playback", {})
+        )
+        self._played_event_received = asyncio.Event()
+        self._decoder_pool = async_get_decoder_pool(
+            hass, _TTS_SAMPLE_RATE, SAMPLE_WIDTH, SAMPLE_CHANNELS
+        )
+        self._run_loop_id = None
+
+    def async_create_background_task(self, hass: HomeAssistant, coro, name: str):
+        """Run a task, as ConfigEntry does."""
+        return hass.async_create_background_task(coro, name)
+
+    async def _tts_timeout(self, timeout_seconds: float, run_loop_id) -> None:
+        """Do nothing, there is no pipeline to time out."""
+
+    async def async_read_events(self) -> None:
+        """Read events from the satellite, as the pipeline loop does."""
+        while (event := await self._client.read_event()) is not None:
+            if Played.is_type(event.type):
+                self._played_event_received.set()
+
+
+class SatelliteProcess:
+    """Simulated satellites running in a subprocess."""
+
+    def __init__(self, *options: str, count: int = 1) -> None:
+        """Initialize process, with options for satellite_sim.py."""
+        self.options = options
+        self.count = count
+        self.proc: asyncio.subprocess.Process | None = None
+        self.ports: list[int] = []
+
+    async def start(self) -> list[int]:
+        """Start the satellites and return their ports."""
+        self.proc = await asyncio.create_subprocess_exec(
+            sys.executable,
+            str(SIMULATOR),
+            "--host",
+            "127.0.0.1",
+            "--port",
+            "0",
+            "--count",
+            str(self.count),
+            *self.options,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        assert self.proc.stderr is not None
+        for _ in range(self.count):
+            line = (await self.proc.stderr.readline()).decode()
+            self.ports.append(int(line.rsplit(":", 1)[1]))
+        return self.ports
+
+    async def next_stream(self) -> dict:
+        """Return the record of the next audio stream received."""
+        assert self.proc is not None and self.proc.stdout is not None
+        return json.loads(await self.proc.stdout.readline())
+
+    async def stop(self) -> None:
+        """Stop the satellite."""
+        if self.proc is not None and self.proc.returncode is None:
+            self.proc.terminate()
+            await self.proc.wait()
+
+
+async def measure(sim: SatelliteProcess, play) -> dict[str, float]:
+    """Play audio once and return its figures."""
+    # The satellite's times are also time.monotonic, a system wide clock
+    start = time.monotonic()
+    cpu = time.process_time()
+    await play()
+    cpu = time.process_time() - cpu
+    record = await sim.next_stream()
+    streaming = max(record["stopped"] - record["first_chunk"], 1e-9)
+    return {
+        "ttfa_ms": (record["first_chunk"] - start) * 1000,
+        "frames_per_s": record["frames"] / streaming,
+        "cpu_ms": cpu * 1000,
+    }
+
+
+async def peak_memory(play) -> float:
+    """Return peak KiB allocated while playing audio once."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        await play()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return (peak - before) / 1024
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, nargs="+", default=[1, 10, 60])
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--lead-ms", type=int, default=0)
+    args = parser.parse_args()
+
+    sim = SatelliteProcess("--report")
+    (port,) = await sim.start()
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        client = VAAsyncTcpClient(
+            "127.0.0.1", port, on_receive_callback=lambda event: (True, event)
+        )
+        await client.connect()
+        satellite = BenchSatellite(hass, client, args.lead_ms)
+        reader = asyncio.create_task(satellite.async_read_events())
+        pcm_cache = async_get_decoded_audio_cache(hass)
+
+        print(
+            f"{'scenario':<22} {'audio s':>8} {'ttfa ms':>8} {'frames/s':>9} "
+            f"{'cpu ms':>8} {'peak KiB':>9}"
+        )
+        try:
+            for seconds in args.seconds:
+                wav = make_wav(seconds)
+                media = Path(config_dir, f"announce_{seconds}.wav")
+                media.write_bytes(wav)
+                announcement = SimpleNamespace(
+                    preannounce_media_id=None, media_id=str(media)
+                )
+
+                async def tts(wav: bytes = wav) -> None:
+                    await satellite._stream_tts(WavResultStream(wav))
+
+                async def announce(announcement=announcement) -> None:
+                    pcm_cache.clear()
+                    await satellite._async_play_announcements([announcement])
+
+                async def announce_cached(announcement=announcement) -> None:
+                    await satellite._async_play_announcements([announcement])
+
+                scenarios = {
+                    "tts stream": tts,
+                    "announcement": announce,
+                    "announcement (cached)": announce_cached,
+                }
+                for name, play in scenarios.items():
+                    runs = [await measure(sim, play) for _ in range(args.runs)]
+                    peak = await peak_memory(play)
+                    await sim.next_stream()
+                    median = {
+                        key: statistics.median(run[key] for run in runs)
+                        for key in runs[0]
+                    }
+                    print(
+                        f"{name:<22} {seconds:>8g} {median['ttfa_ms']:>8.1f} "
+                        f"{median['frames_per_s']:>9.0f} {median['cpu_ms']:>8.1f} "
+                        f"{peak:>9.0f}"
+                    )
+        finally:
+            reader.cancel()
+            await client.disconnect()
+            await async_close_decoder_pools(hass)
+            await sim.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
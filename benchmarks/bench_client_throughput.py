@@ -0,0 +1,215 @@
+"""Measure audio throughput of VAAsyncTcpClient over a loopback socket.
+
+Run from the repository root, with the integration's requirements (Home
+Assistant) installed:
+
+    python benchmarks/bench_client_throughput.py [--seconds 60] [--runs 3]
+
+A local server reads and discards everything sent to it.  The client sends
+the given length of 22050 Hz 16-bit mono audio as 1024 sample frames, as
+fast as it can, in three ways: AudioChunk events through write_event, and
+encoded frames through write_audio_frame with and without batched writes.
+Frames per second, CPU time per frame and the writer statistics (batches
+and drains) are reported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from pathlib import Path
+import sys
+import time
+
+from wyoming.audio import AudioChunk, AudioStart, AudioStop
+from wyoming.event import Event, async_write_event
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+# pylint: disable-next=wrong-import-position
+from custom_components.vaca.audio import AudioFrameEncoder
+
+# pylint: disable-next=wrong-import-position
+from custom_components.vaca.client import VAAsyncTcpClient
+
+RATE = 22050
+WIDTH = 2
+CHANNELS = 1
+FRAME_BYTES = 1024 * WIDTH * CHANNELS
+
+
+class DiscardServer:
+    """TCP server counting the bytes it receives."""
+
+    def __init__(self) -> None:
+        """Initialize server."""
+        self.received = 0
+        self.server: asyncio.Server | None = None
+        self._waiter: tuple[int, asyncio.Future[None]] | None = None
+
+    async def start(self) -> int:
+        """Start listening and return the port."""
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self.server.sockets[0].getsockname()[1]
+
+    async def wait_for(self, total: int) -> None:
+        """Wait until a total number of bytes has been received."""
+        if self.received >= total:
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiter = (total, future)
+        await future
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Read until the client disconnects."""
+        while data := await reader.read(256 * 1024):
+            self.received += len(data)
+            if self._waiter is not None and self.received >= self._waiter[0]:
+                self._waiter[1].set_result(None)
+                self._waiter = None
+        writer.close()
+
+
+async def send_events(client: VAAsyncTcpClient, pcm: bytes) -> None:
+    """Send frames as AudioChunk events."""
+    for offset in range(0, len(pcm), FRAME_BYTES):
+        await client.write_event(
+            AudioChunk(
+                rate=RATE,
+                width=WIDTH,
+                channels=CHANNELS,
+                audio=pcm[offset : offset + FRAME_BYTES],
+                timestamp=offset // (RATE * WIDTH // 1000),
+            ).event()
+        )
+
+
+async def send_frames(client: VAAsyncTcpClient, pcm: bytes) -> None:
+    """Send frames encoded by AudioFrameEncoder."""
+    encoder = AudioFrameEncoder(RATE, WIDTH, CHANNELS)
+    view = memoryview(pcm)
+    for offset in range(0, len(pcm), FRAME_BYTES):
+        await client.write_audio_frame(
+            encoder.encode(
+                view[offset : offset + FRAME_BYTES],
+                offset // (RATE * WIDTH // 1000),
+            )
+        )
+
+
+async def run(
+    send, batch_writes: bool, pcm: bytes, stream_bytes: int
+) -> dict[str, float]:
+    """Send audio once and return throughput figures."""
+    server = DiscardServer()
+    port = await server.start()
+    stats: dict[str, float] = {}
+    client = VAAsyncTcpClient(
+        "127.0.0.1", port, write_stats=stats, batch_writes=batch_writes
+    )
+    await client.connect()
+    start = AudioStart(RATE, WIDTH, CHANNELS).event()
+    await client.write_event(start)
+    start_bytes = await event_bytes(start)
+    await server.wait_for(start_bytes)
+
+    wall = time.perf_counter()
+    cpu = time.process_time()
+    await send(client, pcm)
+    await client.write_event(AudioStop().event())
+    # The stop event is written after all audio, wait for it to arrive
+    await server.wait_for(start_bytes + stream_bytes)
+    wall = time.perf_counter() - wall
+    cpu = time.process_time() - cpu
+
+    await client.disconnect()
+    assert server.server is not None
+    server.server.close()
+
+    frames = len(pcm) // FRAME_BYTES
+    return {
+        "frames_per_s": frames / wall,
+        "cpu_us_per_frame": cpu / frames * 1e6,
+        "batches": stats["batches"],
+        "drains": stats["drains"],
+    }
+
+
+async def wire_bytes(pcm: bytes) -> int:
+    """Return the bytes on the wire for the audio and the stop event."""
+    encoder = AudioFrameEncoder(RATE, WIDTH, CHANNELS)
+    total = sum(
+        len(buffer)
+        for offset in range(0, len(pcm), FRAME_BYTES)
+        for buffer in encoder.encode(
+            pcm[offset : offset + FRAME_BYTES], offset // (RATE * WIDTH // 1000)
+        )
+    )
+    return total + await event_bytes(AudioStop().event())
+
+
+async def event_bytes(event: Event) -> int:
+    """Return the bytes on the wire for an event."""
+    counter = ByteCounter()
+    await async_write_event(event, counter)
+    return counter.written
+
+
+class ByteCounter:
+    """StreamWriter stand-in counting bytes written."""
+
+    def __init__(self) -> None:
+        """Initialize counter."""
+        self.written = 0
+
+    def write(self, data: bytes) -> None:
+        """Count data."""
+        self.written += len(data)
+
+    def writelines(self, data: list[bytes]) -> None:
+        """Count buffers."""
+        for buffer in data:
+            self.written += len(buffer)
+
+    async def drain(self) -> None:
+        """Return at once."""
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=60)
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    frames = int(RATE * args.seconds) // 1024
+    pcm = bytes(range(256)) * (frames * FRAME_BYTES // 256)
+    stream_bytes = await wire_bytes(pcm)
+    methods = {
+        "AudioChunk events": (send_events, False),
+        "frames, unbatched": (send_frames, False),
+        "frames, batched": (send_frames, True),
+    }
+
+    print(f"{frames} frames of {FRAME_BYTES} bytes, best of {args.runs} runs")
+    print(
+        f"{'method':<20} {'frames/s':>10} {'MB/s':>8} {'cpu us/frame':>13} "
+        f"{'batches':>8} {'drains':>8}"
+    )
+    for name, (send, batch_writes) in methods.items():
+        results = [
+            await run(send, batch_writes, pcm, stream_bytes) for _ in range(args.runs)
+        ]
+        best = max(results, key=lambda result: result["frames_per_s"])
+        print(
+            f"{name:<20} {best['frames_per_s']:>10.0f} "
+            f"{best['frames_per_s'] * FRAME_BYTES / 1e6:>8.1f} "
+            f"{best['cpu_us_per_frame']:>13.1f} "
+            f"{best['batches']:>8.0f} {best['drains']:>8.0f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
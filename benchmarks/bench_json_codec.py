@@ -0,0 +1,200 @@
+"""Compare wyoming's event JSON handling with the integration's codecs.
+
+Run from the repository root, with the integration's requirements (Home
+Assistant) installed:
+
+    python benchmarks/bench_json_codec.py [--payloads DIR] [--count 2000]
+
+Payloads are the data of custom events (event_type and data).  Without
+--payloads, status, settings and capabilities payloads shaped like those
+sent by the View Assist companion app are generated.  With --payloads,
+every *.json file in the directory is used, so payloads recorded from real
+devices (for example from debug logs) can be compared.
+
+For each payload, the time to read and decode the event from a stream, as
+a CustomEvent, is reported for wyoming and for each codec, with the time
+to encode it.  Encoded bytes are checked to match wyoming's.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from pathlib import Path
+import sys
+import time
+from typing import Any
+
+from wyoming.event import Event, async_read_event, async_write_event
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+# pylint: disable-next=wrong-import-position
+from custom_components.vaca import codec
+
+# pylint: disable-next=wrong-import-position
+from custom_components.vaca.custom import CustomEvent
+
+
+def generated_payloads() -> dict[str, dict[str, Any]]:
+    """Return payloads shaped like the companion app's."""
+    sensors = {
+        "light": 143.5,
+        "orientation": "landscape",
+        "battery_level": 87,
+        "battery_charging": True,
+        "screen_on": True,
+        "current_path": "/view-assist/clock",
+        "last_motion": "2026-10-17T09:12:44.512Z",
+    }
+    settings = {
+        "mic_gain": 0,
+        "volume": 0.62,
+        "screen_brightness": 0.8,
+        "screen_auto_brightness": True,
+        "screen_always_on": False,
+        "dark_mode": True,
+        "do_not_disturb": False,
+        "wake_word": "hey_jarvis",
+        "wake_word_threshold": 6,
+        "ha_url": "http://homeassistant.local:8123",
+        "ha_port": 8123,
+        "ha_dashboard": "view-assist/kitchen",
+        "integration_version": "1.4.0",
+        "min_required_apk_version": "0.4.0",
+        "settings_version": 42,
+        "settings_hash": "3f2b9c1d0e4a5b6c",
+    }
+    settings.update({f"custom_option_{index}": index * 1.5 for index in range(60)})
+    capabilities = {
+        "app_version": "0.5.2",
+        "has_battery": True,
+        "has_front_camera": True,
+        "sensors": {
+            key: {"type": type(value).__name__} for key, value in sensors.items()
+        },
+        "wake_words": [
+            {
+                "name": name,
+                "languages": ["en", "de", "fr", "ru"],
+                "model": f"{name}.tflite",
+            }
+            for name in ("hey_jarvis", "ok_nabu", "alexa", "hey_mycroft", "computer")
+        ],
+        "display": {"width": 1280, "height": 800, "density": 1.5},
+        "features": [f"feature_{index}" for index in range(40)],
+    }
+    return {
+        "status (sensor)": {
+            "event_type": "status",
+            "data": {"sensors": {"light": 152}},
+        },
+        "status (full)": {"event_type": "status", "data": {"sensors": sensors}},
+        "settings": {"event_type": "settings", "data": settings},
+        "capabilities": {"event_type": "capabilities", "data": capabilities},
+    }
+
+
+def load_payloads(directory: Path) -> dict[str, dict[str, Any]]:
+    """Return payloads recorded in a directory of JSON files."""
+    return {
+        path.stem: json.loads(path.read_text(encoding="utf-8"))
+        for path in sorted(directory.glob("*.json"))
+    }
+
+
+class BufferWriter:
+    """StreamWriter stand-in collecting what is written."""
+
+    def __init__(self) -> None:
+        """Initialize writer."""
+        self.data = bytearray()
+
+    def write(self, data: bytes) -> None:
+        """Collect data."""
+        self.data += data
+
+    def writelines(self, data: list[bytes]) -> None:
+        """Collect buffers."""
+        for buffer in data:
+            self.data += buffer
+
+    async def drain(self) -> None:
+        """Return at once."""
+
+
+async def time_decode(read, wire: bytes, count: int) -> float:
+    """Return microseconds to read and decode one event."""
+    reader = asyncio.StreamReader(limit=len(wire) * 2)
+    reader.feed_data(wire * count)
+    reader.feed_eof()
+    start = time.perf_counter()
+    for _ in range(count):
+        event = await read(reader)
+        CustomEvent.from_event(event)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+async def time_encode(write, event: Event, count: int) -> float:
+    """Return microseconds to encode one event."""
+    start = time.perf_counter()
+    for _ in range(count):
+        await write(event)
+    return (time.perf_counter() - start) / count * 1e6
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--payloads", type=Path)
+    parser.add_argument("--count", type=int, default=2000)
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.payloads) if args.payloads else generated_payloads()
+    codecs = [codec.STDLIB_CODEC]
+    if codec.ORJSON_CODEC is not None:
+        codecs.append(codec.ORJSON_CODEC)
+    else:
+        print("orjson is not installed, only the json codec is compared")
+
+    async def wyoming_encode(event: Event) -> None:
+        await async_write_event(event, BufferWriter())
+
+    async def codec_encode(event: Event) -> None:
+        BufferWriter().writelines(codec.encode_event(event))
+
+    readers = {"wyoming": async_read_event}
+    for json_codec in codecs:
+        readers[json_codec.name] = lambda reader, json_codec=json_codec: (
+            codec.async_read_event(reader, json_codec)
+        )
+
+    print(
+        f"{'payload':<18} {'bytes':>7} "
+        + " ".join(f"{f'{name} read':>14}" for name in readers)
+        + f" {'wyoming write':>14} {'codec write':>12}   (us per event)"
+    )
+    for name, payload in payloads.items():
+        event = Event(type="custom-event", data=payload)
+        writer = BufferWriter()
+        await async_write_event(event, writer)
+        wire = bytes(writer.data)
+        for json_codec in codecs:
+            if b"".join(codec.encode_event(event, json_codec)) != wire:
+                raise RuntimeError(f"{json_codec.name} output differs for {name}")
+
+        decode = [
+            await time_decode(read, wire, args.count) for read in readers.values()
+        ]
+        wyoming_write = await time_encode(wyoming_encode, event, args.count)
+        codec_write = await time_encode(codec_encode, event, args.count)
+        print(
+            f"{name:<18} {len(wire):>7} "
+            + " ".join(f"{value:>14.1f}" for value in decode)
+            + f" {wyoming_write:>14.1f} {codec_write:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,167 @@
+"""Compare the in-process WAV fast path with ffmpeg for announcement media.
+
+Run from the repository root:
+
+    python benchmarks/bench_pcm_fast_path.py [--seconds 5] [--runs 5]
+
+Test WAV files are generated in the format the fast path converts, the
+satellite format (22050 Hz, 16-bit, mono), and converted to raw PCM by
+WavFrameConverter, fed in the chunks the decoder pool reads, and, when
+ffmpeg is on the PATH, by ffmpeg with the arguments the integration uses.
+Wall time and CPU time are reported per conversion, with the time to the
+first frame of the fast path and the difference between both outputs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import io
+from pathlib import Path
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import wave
+
+import numpy as np
+
+RATE = 22050
+CHANNELS = 1
+FRAME_BYTES = 2048
+# Bytes read from the media at a time, as by DecoderPool
+CHUNK_BYTES = 64 * 1024
+INPUT_FORMATS = [(22050, 1)]
+
+
+def load_audio_module():
+    """Import audio.py without importing Home Assistant."""
+    path = Path(__file__).parents[1] / "custom_components" / "vaca" / "audio.py"
+    spec = importlib.util.spec_from_file_location("vaca_audio", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def make_wav(rate: int, channels: int, seconds: float) -> bytes:
+    """Return a WAV file with a chirp on every channel."""
+    t = np.arange(int(rate * seconds)) / rate
+    tone = np.sin(2 * np.pi * (200 + 400 * t / seconds) * t) * 12000
+    samples = np.repeat(tone.astype("<i2")[:, None], channels, axis=1)
+    with io.BytesIO() as wav_io:
+        with wave.open(wav_io, "wb") as wav_file:
+            wav_file.setframerate(rate)
+            wav_file.setsampwidth(2)
+            wav_file.setnchannels(channels)
+            wav_file.writeframes(samples.tobytes())
+        return wav_io.getvalue()
+
+
+def run_fast_path(audio, data: bytes) -> tuple[bytes, float, float, float]:
+    """Return output, wall, CPU and first frame seconds of the fast path."""
+    wall, cpu = time.perf_counter(), time.process_time()
+    converter = audio.WavFrameConverter(RATE, CHANNELS, FRAME_BYTES)
+    frames: list[bytes] = []
+    first_frame = None
+    for offset in range(0, len(data), CHUNK_BYTES):
+        frames.extend(converter.feed(data[offset : offset + CHUNK_BYTES]))
+        if first_frame is None and frames:
+            first_frame = time.perf_counter() - wall
+    frames.extend(converter.flush())
+    wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    return b"".join(frames), wall, cpu, first_frame or wall
+
+
+def run_ffmpeg(binary: str, path: Path) -> tuple[bytes, float, float]:
+    """Return output, wall and CPU seconds of an ffmpeg conversion."""
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    wall = time.perf_counter()
+    output = subprocess.run(
+        [
+            binary,
+            "-i",
+            str(path),
+            "-f",
+            "s16le",
+            "-ac",
+            str(CHANNELS),
+            "-ar",
+            str(RATE),
+            "-nostats",
+            "pipe:",
+        ],
+        capture_output=True,
+        check=True,
+    ).stdout
+    wall = time.perf_counter() - wall
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = (after.ru_utime - usage.ru_utime) + (after.ru_stime - usage.ru_stime)
+    return output, wall, cpu
+
+
+def compare(fast: bytes, reference: bytes) -> str:
+    """Describe the difference between two s16le outputs."""
+    if fast == reference:
+        return "identical"
+    a = np.frombuffer(fast, "<i2").astype(np.float64)
+    b = np.frombuffer(reference, "<i2").astype(np.float64)
+    length = min(len(a), len(b))
+    error = a[:length] - b[:length]
+    signal = np.mean(b[:length] ** 2)
+    snr = 10 * np.log10(signal / max(np.mean(error**2), 1e-12))
+    return (
+        f"{len(a) - len(b):+d} samples, "
+        f"max diff {int(np.abs(error).max())}, SNR {snr:.1f} dB"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    audio = load_audio_module()
+    binary = shutil.which("ffmpeg")
+    if binary is None:
+        print("ffmpeg not found, only the fast path is measured", file=sys.stderr)
+
+    print(f"{args.seconds:g} s of audio, median of {args.runs} runs")
+    print(
+        f"{'input':>14}  {'path':<8} {'wall ms':>8} {'cpu ms':>8} {'first ms':>8}"
+        "  output"
+    )
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rate, channels in INPUT_FORMATS:
+            data = make_wav(rate, channels, args.seconds)
+            path = Path(tmp_dir) / f"{rate}_{channels}.wav"
+            path.write_bytes(data)
+            label = f"{rate} Hz/{channels} ch"
+
+            fast_runs = [run_fast_path(audio, data) for _ in range(args.runs)]
+            fast = fast_runs[0][0]
+            print(
+                f"{label:>14}  {'fast':<8} "
+                f"{statistics.median(r[1] for r in fast_runs) * 1000:8.1f} "
+                f"{statistics.median(r[2] for r in fast_runs) * 1000:8.1f} "
+                f"{statistics.median(r[3] for r in fast_runs) * 1000:8.2f}  "
+                f"{len(fast)} bytes"
+            )
+
+            if binary is None:
+                continue
+            ffmpeg_runs = [run_ffmpeg(binary, path) for _ in range(args.runs)]
+            print(
+                f"{'':>14}  {'ffmpeg':<8} "
+                f"{statistics.median(r[1] for r in ffmpeg_runs) * 1000:8.1f} "
+                f"{statistics.median(r[2] for r in ffmpeg_runs) * 1000:8.1f} "
+                f"{'':>8}  {compare(fast, ffmpeg_runs[0][0])}"
+            )
+
+
+if __name__ == "__main__":
+    main()
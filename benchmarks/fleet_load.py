@@ -0,0 +1,354 @@
+"""Load one event loop with a fleet of simulated satellites.
+
+Run from the repository root, with the integration's requirements (Home
+Assistant) installed:
+
+    python benchmarks/fleet_load.py [--satellites 1 10 50 100 200]
+        [--duration 30] [--status-interval 2] [--pipeline-interval 30]
+
+For each fleet size, simulated satellites (satellite_sim.py) run in a
+subprocess, playing audio in real time.  They send status events at
+--status-interval, and run a pipeline with microphone audio every
+--pipeline-interval seconds, each answered with --tts-seconds of TTS audio.
+
+Each satellite is handled in this process by a stand-in entity running the
+integration's own methods for received events, the custom event queue,
+status routing and TTS streaming, connected with VAAsyncTcpClient.  Status
+sensors are stood in by write filters with the sensor entities' reporting
+policies, writing to the state machine.
+
+Reported per fleet size: event loop lag percentiles (how late a callback
+scheduled every --lag-interval seconds runs), growth of the process RSS
+per satellite, custom events handled per second with those conflated and
+dropped by the queue, state writes, pipelines and TTS streams, and the
+longest an audio frame waited to be written.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import os
+from pathlib import Path
+import resource
+import statistics
+import sys
+import tempfile
+from typing import Any
+
+from wyoming.audio import AudioChunk, AudioStop
+from wyoming.pipeline import RunPipeline
+from wyoming.snd import Played
+
+sys.path.insert(0, str(Path(__file__).parents[1]))
+
+# pylint: disable=wrong-import-position
+from bench_audio_path import SatelliteProcess, WavResultStream, make_wav
+
+from custom_components.vaca.assist_satellite import (
+    _AUDIO_BUFFER_STATUS_KEY,
+    ViewAssistSatelliteEntity,
+)
+from custom_components.vaca.binary_sensor import (
+    WyomingSatelliteBatteryChargingBinarySensor,
+    WyomingSatelliteScreenOnBinarySensor,
+)
+from custom_components.vaca.client import CustomEventQueue, VAAsyncTcpClient
+from custom_components.vaca.custom import (
+    CAPABILITIES_EVENT_TYPE,
+    CustomEvent,
+    PipelineEnded,
+)
+from custom_components.vaca.devices import VASatelliteDevice
+from custom_components.vaca.entity import StateWriteFilter
+from custom_components.vaca.playback import PlaybackController
+from custom_components.vaca.sensor import (
+    WyomingSatelliteBatteryLevelSensor,
+    WyomingSatelliteBrowserPathSensor,
+    WyomingSatelliteLightSensor,
+    WyomingSatelliteOrientationSensor,
+)
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant
+
+# pylint: enable=wrong-import-position
+
+# Status sensor entities stood in for, by sensor key
+STATUS_REPORTING = {
+    entity_class.entity_description.key: entity_class._status_reporting
+    for entity_class in (
+        WyomingSatelliteLightSensor,
+        WyomingSatelliteOrientationSensor,
+        WyomingSatelliteBatteryLevelSensor,
+        WyomingSatelliteBrowserPathSensor,
+        WyomingSatelliteBatteryChargingBinarySensor,
+        WyomingSatelliteScreenOnBinarySensor,
+    )
+}
+
+
+class FleetSatellite:
+    """Stand-in satellite entity, with its status sensors.
+
+    Only the state the entity's methods use is set up, so no config entry,
+    entity platform or pipeline is needed.  Settings are not synced.
+    """
+
+    on_receive_event_callback = ViewAssistSatelliteEntity.on_receive_event_callback
+    _async_handle_custom_events = ViewAssistSatelliteEntity._async_handle_custom_events
+    _handle_custom_event = ViewAssistSatelliteEntity._handle_custom_event
+    _audio_buffer_reported = ViewAssistSatelliteEntity._audio_buffer_reported
+    _stream_tts = ViewAssistSatelliteEntity._stream_tts
+    _write_tts_chunk = ViewAssistSatelliteEntity._write_tts_chunk
+
+    def __init__(
+        self, hass: HomeAssistant, satellite_id: str, port: int, tts_wav: bytes
+    ) -> None:
+        """Initialize the stand-in entity."""
+        self.hass = hass
+        self.config_entry = self
+        self.device = VASatelliteDevice(
+            satellite_id=satellite_id, device_id=satellite_id
+        )
+        self._playback = PlaybackController(
+            self.device.metrics.setdefault("playback", {})
+        )
+        self._played_event_received = asyncio.Event()
+        self._run_loop_id = None
+        self._custom_events = CustomEventQueue()
+        self.device.metrics["custom_events"] = self._custom_events.stats
+        self._client = VAAsyncTcpClient(
+            "127.0.0.1",
+            port,
+            on_receive_callback=self.on_receive_event_callback,
+            custom_events=self._custom_events,
+            write_stats=self.device.metrics.setdefault("writer", {}),
+        )
+        self._tts_wav = tts_wav
+        self._tasks: set[asyncio.Task] = set()
+        self._write_filters: list[StateWriteFilter] = []
+        self._unsubs: list[CALLBACK_TYPE] = []
+
+        self.stats = {"pipelines": 0, "mic_frames": 0, "tts_streams": 0}
+
+    async def async_start(self) -> None:
+        """Connect and handle events, as the entity does once added."""
+        router = self.device.status_router
+        self._unsubs.append(
+            router.async_register(_AUDIO_BUFFER_STATUS_KEY, self._audio_buffer_reported)
+        )
+        for key, reporting in STATUS_REPORTING.items():
+            write_filter = StateWriteFilter(
+                self.hass, reporting, self._state_writer(key)
+            )
+            self._write_filters.append(write_filter)
+            self._unsubs.append(
+                router.async_register_sensor(
+                    key,
+                    lambda status, key=key, write_filter=write_filter: (
+                        write_filter.async_update(status["sensors"][key])
+                    ),
+                )
+            )
+
+        await self._client.connect()
+        self._create_task(self._async_handle_custom_events())
+        self._create_task(self._async_read_events())
+        await self._client.write_event(CustomEvent(CAPABILITIES_EVENT_TYPE).event())
+
+    async def async_stop(self) -> None:
+        """Stop handling events and disconnect."""
+        for task in self._tasks:
+            task.cancel()
+        for unsub in self._unsubs:
+            unsub()
+        for write_filter in self._write_filters:
+            write_filter.async_cancel()
+        await self._client.disconnect()
+
+    @property
+    def state_writes(self) -> dict[str, int]:
+        """Return totals of the status sensors' write filter stats."""
+        totals: dict[str, int] = {}
+        for write_filter in self._write_filters:
+            for key, value in write_filter.stats.items():
+                totals[key] = totals.get(key, 0) + value
+        return totals
+
+    def _state_writer(self, key: str):
+        """Return a function writing a sensor value to the state machine."""
+        entity_id = f"sensor.{self.device.satellite_id}_{key}"
+        return lambda value: self.hass.states.async_set(entity_id, str(value))
+
+    def _settings_version_reported(self, event_data: dict[str, Any]) -> None:
+        """Do nothing, settings are not synced."""
+
+    async def _tts_timeout(self, timeout_seconds: float, run_loop_id) -> None:
+        """Do nothing, there is no pipeline to time out."""
+
+    async def _async_read_events(self) -> None:
+        """Read events from the satellite, as the pipeline loop does."""
+        mic_audio = False
+        while (event := await self._client.read_event()) is not None:
+            if RunPipeline.is_type(event.type):
+                self.stats["pipelines"] += 1
+                mic_audio = True
+            elif mic_audio and AudioChunk.is_type(event.type):
+                AudioChunk.from_event(event)
+                self.stats["mic_frames"] += 1
+            elif mic_audio and AudioStop.is_type(event.type):
+                mic_audio = False
+                self._create_task(self._async_respond())
+            elif Played.is_type(event.type):
+                self._played_event_received.set()
+
+    async def _async_respond(self) -> None:
+        """Answer a pipeline with TTS audio and end it."""
+        await self._stream_tts(WavResultStream(self._tts_wav))
+        await self._client.write_event(PipelineEnded().event())
+        self.stats["tts_streams"] += 1
+
+    def async_create_background_task(self, hass: HomeAssistant, coro, name: str):
+        """Run a task, as ConfigEntry does."""
+        return hass.async_create_background_task(coro, name)
+
+    def _create_task(self, coro) -> None:
+        """Run a task, keeping a reference until it is done."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop runs a callback due at an interval."""
+
+    def __init__(self, interval: float) -> None:
+        """Initialize monitor."""
+        self.interval = interval
+        self.lag_ms: list[float] = []
+
+    async def async_run(self) -> None:
+        """Record lag until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            due = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self.lag_ms.append((loop.time() - due) * 1000)
+
+    def percentiles(self) -> dict[str, float]:
+        """Return the p50, p90 and p99 lag, and the maximum."""
+        cuts = statistics.quantiles(self.lag_ms, n=100, method="inclusive")
+        return {
+            "p50": cuts[49],
+            "p90": cuts[89],
+            "p99": cuts[98],
+            "max": max(self.lag_ms),
+        }
+
+
+def rss_bytes() -> int:
+    """Return the resident set size of this process."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        # Peak rather than current size, in bytes on macOS and KiB elsewhere
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+async def run_fleet(
+    hass: HomeAssistant, count: int, args: argparse.Namespace, tts_wav: bytes
+) -> dict[str, Any]:
+    """Run a fleet of satellites for the duration and return its figures."""
+    sim = SatelliteProcess(
+        "--realtime",
+        "--status-interval",
+        str(args.status_interval),
+        "--pipeline-interval",
+        str(args.pipeline_interval),
+        "--pipeline-seconds",
+        str(args.pipeline_seconds),
+        count=count,
+    )
+    ports = await sim.start()
+    gc.collect()
+    rss_before = rss_bytes()
+
+    satellites = [
+        FleetSatellite(hass, f"fleet_{count}_{index}", port, tts_wav)
+        for index, port in enumerate(ports)
+    ]
+    monitor = LoopLagMonitor(args.lag_interval)
+    try:
+        await asyncio.gather(*(satellite.async_start() for satellite in satellites))
+        monitor_task = asyncio.create_task(monitor.async_run())
+        await asyncio.sleep(args.duration)
+        monitor_task.cancel()
+        gc.collect()
+        rss_after = rss_bytes()
+    finally:
+        await asyncio.gather(*(satellite.async_stop() for satellite in satellites))
+        await sim.stop()
+
+    def total(stats_of, key: str) -> int:
+        return sum(stats_of(satellite).get(key, 0) for satellite in satellites)
+
+    def custom_events(satellite: FleetSatellite) -> dict[str, int]:
+        return satellite.device.metrics["custom_events"]
+
+    return {
+        "satellites": count,
+        "lag_ms": monitor.percentiles(),
+        "rss_kib_per_satellite": (rss_after - rss_before) / 1024 / count,
+        "custom_events_per_s": total(custom_events, "received") / args.duration,
+        "conflated": total(custom_events, "conflated"),
+        "dropped": total(custom_events, "dropped"),
+        "state_writes": total(lambda satellite: satellite.state_writes, "written"),
+        "pipelines": total(lambda satellite: satellite.stats, "pipelines"),
+        "tts_streams": total(lambda satellite: satellite.stats, "tts_streams"),
+        "max_audio_latency_ms": max(
+            satellite.device.metrics["writer"]["max_audio_latency_ms"]
+            for satellite in satellites
+        ),
+    }
+
+
+async def main() -> None:
+    """Run the load harness."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--satellites", type=int, nargs="+", default=[1, 10, 50, 100, 200]
+    )
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--status-interval", type=float, default=2)
+    parser.add_argument("--pipeline-interval", type=float, default=30)
+    parser.add_argument("--pipeline-seconds", type=float, default=3)
+    parser.add_argument("--tts-seconds", type=float, default=3)
+    parser.add_argument("--lag-interval", type=float, default=0.01)
+    args = parser.parse_args()
+
+    tts_wav = make_wav(args.tts_seconds)
+    print(
+        f"{'sats':>5} {'lag p50':>8} {'p90':>7} {'p99':>7} {'max':>7} "
+        f"{'KiB/sat':>8} {'events/s':>9} {'conflated':>9} {'dropped':>8} "
+        f"{'writes':>7} {'pipelines':>9} {'tts':>5} {'audio ms':>8}"
+    )
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        for count in args.satellites:
+            result = await run_fleet(hass, count, args, tts_wav)
+            lag = result["lag_ms"]
+            print(
+                f"{count:>5} {lag['p50']:>8.2f} {lag['p90']:>7.2f} "
+                f"{lag['p99']:>7.2f} {lag['max']:>7.1f} "
+                f"{result['rss_kib_per_satellite']:>8.0f} "
+                f"{result['custom_events_per_s']:>9.1f} "
+                f"{result['conflated']:>9} {result['dropped']:>8} "
+                f"{result['state_writes']:>7} {result['pipelines']:>9} "
+                f"{result['tts_streams']:>5} {result['max_audio_latency_ms']:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,379 @@
+"""Stand-in VACA satellite speaking Wyoming and the VACA custom events.
+
+Used by the benchmarks, or run on its own and added to Home Assistant as a
+VACA device:
+
+    python benchmarks/satellite_sim.py [--port 10700] [--realtime]
+        [--status-interval 5] [--pipeline-interval 60] [--count 1] [--report]
+
+The satellite answers describe with its info and capabilities requests with
+its capabilities, records settings, and sends status events with sensor
+values.  Audio streams are received and acknowledged with a played event,
+at once or, with --realtime, after the audio would have finished playing,
+reporting its buffer fill (audio_buffer_ms) while playing.  With
+--pipeline-interval, the satellite starts a pipeline and streams
+--pipeline-seconds of microphone audio at that interval.  With --count,
+several satellites are started, on consecutive ports or, with --port 0,
+on free ones.  With --report, a JSON line is written to stdout for every
+audio stream received.
+
+Only the standard library and wyoming are used, so the satellite can run
+outside the Home Assistant environment and on another machine.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from dataclasses import asdict, dataclass, field
+import json
+import random
+import sys
+import time
+from typing import Any
+
+from wyoming.audio import AudioChunk, AudioStart, AudioStop
+from wyoming.event import Event, async_read_event, async_write_event
+from wyoming.info import Attribution, Describe, Info, Satellite
+from wyoming.pipeline import PipelineStage, RunPipeline
+from wyoming.snd import Played
+
+CUSTOM_EVENT_TYPE = "custom-event"
+PIPELINE_ENDED_TYPE = "pipeline-ended"
+
+MIC_RATE = 16000
+MIC_FRAME_BYTES = 1024 * 2
+
+# Interval of buffer fill reports while playing in real time
+_BUFFER_REPORT_INTERVAL = 0.2
+
+
+@dataclass
+class AudioStreamRecord:
+    """Timing of one audio stream received by the satellite."""
+
+    started: float
+    rate: int
+    width: int
+    channels: int
+    first_chunk: float | None = None
+    stopped: float | None = None
+    frames: int = 0
+    audio_bytes: int = 0
+
+    @property
+    def audio_seconds(self) -> float:
+        """Return the length of the audio received."""
+        return self.audio_bytes / (self.rate * self.width * self.channels)
+
+
+@dataclass
+class SatelliteStats:
+    """Counts of traffic seen by the satellite."""
+
+    connections: int = 0
+    events_received: dict[str, int] = field(default_factory=dict)
+    custom_events_received: dict[str, int] = field(default_factory=dict)
+    status_sent: int = 0
+    pipelines_run: int = 0
+    pipelines_ended: int = 0
+
+
+def default_capabilities() -> dict[str, Any]:
+    """Return capabilities like the companion app's."""
+    return {
+        "app_version": "0.5.2",
+        "has_battery": True,
+        "has_front_camera": True,
+        "sensors": {
+            "light": {"type": "float"},
+            "orientation": {"type": "str"},
+            "battery_level": {"type": "int"},
+            "battery_charging": {"type": "bool"},
+            "screen_on": {"type": "bool"},
+            "current_path": {"type": "str"},
+        },
+    }
+
+
+class SimulatedSatellite:
+    """Wyoming server behaving like a VACA companion app."""
+
+    def __init__(
+        self,
+        name: str = "Simulated satellite",
+        *,
+        realtime: bool = False,
+        status_interval: float | None = None,
+        pipeline_interval: float | None = None,
+        pipeline_seconds: float = 3,
+        on_stream=None,
+    ) -> None:
+        """Initialize satellite."""
+        self.name = name
+        self.realtime = realtime
+        self.status_interval = status_interval
+        self.pipeline_interval = pipeline_interval
+        self.pipeline_seconds = pipeline_seconds
+        self.on_stream = on_stream
+        self.capabilities = default_capabilities()
+        self.settings: dict[str, Any] = {}
+        self.settings_version: int | None = None
+        self.settings_hash: str | None = None
+
+        self.stats = SatelliteStats()
+        self.streams: list[AudioStreamRecord] = []
+        self.port: int | None = None
+
+        self._server: asyncio.Server | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._stream: AudioStreamRecord | None = None
+        self._stream_done = asyncio.Condition()
+        self._tasks: set[asyncio.Task] = set()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start listening and return the port."""
+        self._server = await asyncio.start_server(self._handle, host, port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self.port
+
+    async def stop(self) -> None:
+        """Close the connection and stop listening."""
+        for task in self._tasks:
+            task.cancel()
+        if self._writer is not None:
+            self._writer.close()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def wait_for_streams(self, count: int) -> list[AudioStreamRecord]:
+        """Wait until a number of audio streams have been received."""
+        async with self._stream_done:
+            await self._stream_done.wait_for(lambda: len(self.streams) >= count)
+        return self.streams[:count]
+
+    async def send_event(self, event: Event) -> None:
+        """Send an event to Home Assistant, if connected."""
+        if self._writer is not None and not self._writer.is_closing():
+            await async_write_event(event, self._writer)
+
+    async def send_custom_event(self, event_type: str, data: dict[str, Any]) -> None:
+        """Send a VACA custom event."""
+        await self.send_event(
+            Event(CUSTOM_EVENT_TYPE, {"event_type": event_type, "data": data})
+        )
+
+    async def send_status(self, data: dict[str, Any] | None = None) -> None:
+        """Send a status event, with changed sensor values by default."""
+        if data is None:
+            data = {
+                "sensors": {
+                    "light": round(random.uniform(50, 400), 1),
+                    "battery_level": random.randint(20, 100),
+                    "screen_on": True,
+                }
+            }
+        self.stats.status_sent += 1
+        await self.send_custom_event("status", data)
+
+    async def run_pipeline(self, seconds: float) -> None:
+        """Start a pipeline and stream microphone audio for it in real time."""
+        self.stats.pipelines_run += 1
+        await self.send_event(
+            RunPipeline(
+                start_stage=PipelineStage.ASR, end_stage=PipelineStage.TTS
+            ).event()
+        )
+        await self.send_event(AudioStart(MIC_RATE, 2, 1).event())
+        frame = bytes(MIC_FRAME_BYTES)
+        frame_seconds = MIC_FRAME_BYTES / 2 / MIC_RATE
+        start = time.monotonic()
+        for index in range(int(seconds / frame_seconds)):
+            await self.send_event(
+                AudioChunk(
+                    MIC_RATE, 2, 1, frame, timestamp=int(index * frame_seconds * 1000)
+                ).event()
+            )
+            await asyncio.sleep(
+                max(0, start + (index + 1) * frame_seconds - time.monotonic())
+            )
+        await self.send_event(AudioStop().event())
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Handle a connection from Home Assistant, replacing any previous one."""
+        if self._writer is not None:
+            self._writer.close()
+        self._writer = writer
+        self.stats.connections += 1
+        if self.status_interval:
+            self._create_task(self._send_status_periodically(writer))
+        if self.pipeline_interval:
+            self._create_task(self._run_pipelines_periodically(writer))
+
+        try:
+            while (event := await async_read_event(reader)) is not None:
+                counts = self.stats.events_received
+                counts[event.type] = counts.get(event.type, 0) + 1
+                await self._handle_event(event)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            if self._writer is writer:
+                self._writer = None
+
+    async def _handle_event(self, event: Event) -> None:
+        """Answer an event from Home Assistant."""
+        if Describe.is_type(event.type):
+            await self.send_event(self._info().event())
+        elif event.type == CUSTOM_EVENT_TYPE:
+            await self._handle_custom_event(event.data or {})
+        elif event.type == PIPELINE_ENDED_TYPE:
+            self.stats.pipelines_ended += 1
+        elif AudioStart.is_type(event.type):
+            start = AudioStart.from_event(event)
+            self._stream = AudioStreamRecord(
+                time.monotonic(), start.rate, start.width, start.channels
+            )
+            if self.realtime:
+                self._create_task(self._report_buffer(self._stream))
+        elif AudioChunk.is_type(event.type) and self._stream is not None:
+            if self._stream.first_chunk is None:
+                self._stream.first_chunk = time.monotonic()
+            self._stream.frames += 1
+            self._stream.audio_bytes += len(event.payload or b"")
+        elif AudioStop.is_type(event.type) and self._stream is not None:
+            stream, self._stream = self._stream, None
+            stream.stopped = time.monotonic()
+            self._create_task(self._finish_stream(stream))
+
+    async def _handle_custom_event(self, data: dict[str, Any]) -> None:
+        """Answer a VACA custom event."""
+        event_type = data.get("event_type", "unknown")
+        counts = self.stats.custom_events_received
+        counts[event_type] = counts.get(event_type, 0) + 1
+
+        if event_type == "capabilities":
+            await self.send_custom_event(
+                "capabilities",
+                {
+                    "capabilities": self.capabilities,
+                    "settings_version": self.settings_version,
+                    "settings_hash": self.settings_hash,
+                },
+            )
+        elif event_type == "settings":
+            # Events from Home Assistant carry their fields next to event_type
+            if not data.get("settings_delta"):
+                self.settings.clear()
+            self.settings.update(data.get("settings") or {})
+            self.settings_version = data.get("settings_version")
+            self.settings_hash = data.get("settings_hash")
+
+    async def _finish_stream(self, stream: AudioStreamRecord) -> None:
+        """Acknowledge a stream once played and record it."""
+        if self.realtime and stream.first_chunk is not None:
+            end = stream.first_chunk + stream.audio_seconds
+            await asyncio.sleep(max(0, end - time.monotonic()))
+        await self.send_event(Played().event())
+
+        async with self._stream_done:
+            self.streams.append(stream)
+            self._stream_done.notify_all()
+        if self.on_stream is not None:
+            self.on_stream(stream)
+
+    async def _report_buffer(self, stream: AudioStreamRecord) -> None:
+        """Report buffered audio while a stream plays in real time."""
+        while stream.stopped is None or (
+            stream.first_chunk is not None
+            and time.monotonic() < stream.first_chunk + stream.audio_seconds
+        ):
+            await asyncio.sleep(_BUFFER_REPORT_INTERVAL)
+            if stream.first_chunk is None:
+                continue
+            played = time.monotonic() - stream.first_chunk
+            buffered = max(0, stream.audio_seconds - played)
+            await self.send_status({"audio_buffer_ms": round(buffered * 1000)})
+
+    async def _send_status_periodically(self, writer: asyncio.StreamWriter) -> None:
+        """Send status events while a connection is open."""
+        assert self.status_interval
+        await asyncio.sleep(random.uniform(0, self.status_interval))
+        while self._writer is writer:
+            await self.send_status()
+            await asyncio.sleep(self.status_interval)
+
+    async def _run_pipelines_periodically(self, writer: asyncio.StreamWriter) -> None:
+        """Run pipelines while a connection is open."""
+        assert self.pipeline_interval
+        await asyncio.sleep(random.uniform(0, self.pipeline_interval))
+        while self._writer is writer:
+            await self.run_pipeline(self.pipeline_seconds)
+            await asyncio.sleep(self.pipeline_interval)
+
+    def _info(self) -> Info:
+        """Return Wyoming info of the satellite."""
+        return Info(
+            satellite=Satellite(
+                name=self.name,
+                attribution=Attribution(name="", url=""),
+                installed=True,
+                description=self.name,
+                version="0.5.2",
+            )
+        )
+
+    def _create_task(self, coro) -> None:
+        """Run a task, keeping a reference until it is done."""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+
+async def main() -> None:
+    """Run satellites until interrupted."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=10700)
+    parser.add_argument("--name", default="Simulated satellite")
+    parser.add_argument("--realtime", action="store_true")
+    parser.add_argument("--status-interval", type=float)
+    parser.add_argument("--pipeline-interval", type=float)
+    parser.add_argument("--pipeline-seconds", type=float, default=3)
+    parser.add_argument("--count", type=int, default=1)
+    parser.add_argument("--report", action="store_true")
+    args = parser.parse_args()
+
+    def report(stream: AudioStreamRecord) -> None:
+        print(json.dumps(asdict(stream)), flush=True)
+
+    satellites = [
+        SimulatedSatellite(
+            args.name if args.count == 1 else f"{args.name} {index + 1}",
+            realtime=args.realtime,
+            status_interval=args.status_interval,
+            pipeline_interval=args.pipeline_interval,
+            pipeline_seconds=args.pipeline_seconds,
+            on_stream=report if args.report else None,
+        )
+        for index in range(args.count)
+    ]
+    for index, satellite in enumerate(satellites):
+        port = await satellite.start(args.host, args.port and args.port + index)
+        print(f"Listening on {args.host}:{port}", file=sys.stderr, flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        for satellite in satellites:
+            await satellite.stop()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -2,9 +2,8 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from typing import Any
+import shutil
 
 from homeassistant.components.wyoming import (
     DomainDataItem,
@@ -18,10 +17,12 @@ from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
 from homeassistant.helpers import config_validation as cv, device_registry as dr
 from homeassistant.helpers.typing import ConfigType
 
-from .client import AsyncTcpClient
+from .cache import DATA_TTS_CACHES, tts_cache_dir
 from .const import ATTR_SPEAKER, DOMAIN
-from .custom import CustomEvent
+from .decoder import async_close_decoder_pools
 from .devices import VASatelliteDevice
+from .pool import async_close_connection_pool
+from .storage import VASatelliteStore
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -41,6 +42,7 @@ SATELLITE_PLATFORMS = [
 __all__ = [
     "ATTR_SPEAKER",
     "DOMAIN",
+    "async_remove_entry",
     "async_setup",
     "async_setup_entry",
     "async_unload_entry",
@@ -60,10 +62,19 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Load Wyoming."""
-    service = await WyomingService.create(entry.data["host"], entry.data["port"])
+    store = VASatelliteStore(hass, entry.entry_id)
+    await store.async_load()
 
-    if service is None:
-        raise ConfigEntryNotReady("Unable to connect")
+    if (info := store.info) is not None:
+        # Use the stored info and refresh it once setup has finished
+        service = WyomingService(entry.data["host"], entry.data["port"], info)
+    else:
+        service = await WyomingService.create(entry.data["host"], entry.data["port"])
+
+        if service is None:
+            raise ConfigEntryNotReady("Unable to connect")
+
+        store.async_set_info(service.info)
 
     item = DomainDataItem(service=service)
 
@@ -88,15 +99,51 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         item.device = VASatelliteDevice(
             satellite_id=satellite_id,
             device_id=device.id,
+            custom_settings=store.custom_settings,
+            settings_version=store.settings_version,
+            settings_hash=store.settings_hash,
+            store=store,
         )
-        item.device.capabilities = await get_device_capabilities(item)
+
+        # Use stored capabilities until the satellite reports the live ones
+        # after connecting.  Entities that depend on capabilities are added or
+        # removed when they are reported.
+        item.device.capabilities = store.capabilities
 
         # Set up satellite entity, sensors, switches, etc.
         await hass.config_entries.async_forward_entry_setups(entry, SATELLITE_PLATFORMS)
 
+    if info is not None:
+        entry.async_create_background_task(
+            hass, async_refresh_info(hass, entry, store), "refresh wyoming info"
+        )
+
     return True
 
 
+async def async_refresh_info(
+    hass: HomeAssistant, entry: ConfigEntry, store: VASatelliteStore
+) -> None:
+    """Reconcile stored Wyoming info with the live device."""
+    item: DomainDataItem = hass.data[DOMAIN][entry.entry_id]
+
+    live_service = await WyomingService.create(entry.data["host"], entry.data["port"])
+    if live_service is None or live_service.info == item.service.info:
+        return
+
+    store.async_set_info(live_service.info)
+
+    satellite_changed = (live_service.info.satellite is None) != (item.device is None)
+    if live_service.platforms != item.service.platforms or satellite_changed:
+        _LOGGER.debug("Wyoming services changed, reloading %s", entry.title)
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+
+    item.service.info = live_service.info
+    if item.device is not None:
+        item.device.info = live_service.info
+
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry):
     """Handle options update."""
     await hass.config_entries.async_reload(entry.entry_id)
@@ -112,43 +159,18 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     unload_ok = await hass.config_entries.async_unload_platforms(entry, platforms)
     if unload_ok:
+        await async_close_connection_pool(hass, item.service)
+        hass.data.get(DATA_TTS_CACHES, {}).pop(entry.entry_id, None)
         del hass.data[DOMAIN][entry.entry_id]
+        if not hass.data[DOMAIN]:
+            await async_close_decoder_pools(hass)
 
     return unload_ok
 
 
-async def get_device_capabilities(item: DomainDataItem):
-    """Get device capabilities."""
-    capabilities: dict[str, Any] | None = None
-
-    for _ in range(4):
-        try:
-            async with (
-                AsyncTcpClient(item.service.host, item.service.port) as client,
-                asyncio.timeout(1),
-            ):
-                # Describe -> Info
-                await client.write_event(CustomEvent("capabilities").event())
-                while True:
-                    event = await client.read_event()
-                    if event is None:
-                        raise WyomingError(  # noqa: TRY301
-                            "Connection closed unexpectedly",
-                        )
-
-                    if CustomEvent.is_type(event.type) and (
-                        event_data := CustomEvent.from_event(event).event_data
-                    ):
-                        capabilities = event_data.get("capabilities")
-                        break  # while
-
-                if capabilities is not None:
-                    break  # for
-        except (TimeoutError, OSError, WyomingError) as ex:
-            _LOGGER.warning(
-                "Error getting device capabilities: %s, %s", ex, capabilities
-            )
-            # Sleep and try again
-            await asyncio.sleep(2)
-
-    return capabilities
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove cached data for a deleted config entry."""
+    await hass.async_add_executor_job(
+        shutil.rmtree, tts_cache_dir(hass, entry.entry_id), True
+    )
+    await VASatelliteStore(hass, entry.entry_id).async_remove()
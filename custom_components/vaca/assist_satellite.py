@@ -3,19 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-import io
+from collections.abc import AsyncGenerator
+from dataclasses import asdict
 import logging
 import time
-from typing import Final
-import wave
+from typing import Any, Final
 
-from wyoming.audio import AudioChunk, AudioStart, AudioStop
+from wyoming.audio import AudioStart, AudioStop
 from wyoming.event import Event
 from wyoming.info import Describe
 from wyoming.pipeline import PipelineStage, RunPipeline
 from wyoming.satellite import RunSatellite
 
-from homeassistant.components import assist_pipeline, ffmpeg, tts
+from homeassistant.components import assist_pipeline, tts
 from homeassistant.components.assist_pipeline import PipelineEvent
 from homeassistant.components.assist_satellite import (
     AssistSatelliteAnnouncement,
@@ -27,24 +27,35 @@ from homeassistant.components.wyoming import DomainDataItem, WyomingService
 # pylint: disable-next=hass-component-root-import
 from homeassistant.components.wyoming.assist_satellite import WyomingAssistSatellite
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
-from .client import VAAsyncTcpClient
+from .audio import AudioFrameEncoder, FramePrefetcher, WavStreamParser
+from .cache import DECODED_AUDIO_MAX_ENTRY_BYTES, async_get_decoded_audio_cache
+from .client import CustomEventQueue, VAAsyncTcpClient
 from .const import DOMAIN, MIN_APK_VERSION, SAMPLE_CHANNELS, SAMPLE_WIDTH
 from .custom import (
     ACTION_EVENT_TYPE,
     CAPABILITIES_EVENT_TYPE,
+    SETTINGS_BASE_VERSION_KEY,
+    SETTINGS_DELTA_KEY,
     SETTINGS_EVENT_TYPE,
+    SETTINGS_HASH_KEY,
+    SETTINGS_VERSION_KEY,
     STATUS_EVENT_TYPE,
     CustomEvent,
     PipelineEnded,
     getIntegrationVersion,
+    getSettingsHash,
     getVADashboardPath,
 )
+from .decoder import DecodeError, async_get_decoder_pool
 from .devices import VASatelliteDevice
-from .entity import VASatelliteEntity
+from .entity import StatusReporting, VASatelliteEntity
+from .playback import Playback, PlaybackController, PlaybackQueue, PlaybackReplacedError
+from .pool import async_prewarm_entity_connection
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -56,7 +67,16 @@ _PING_SEND_DELAY: Final = 2
 _PIPELINE_FINISH_TIMEOUT: Final = 1
 _TTS_SAMPLE_RATE: Final = 22050
 _ANNOUNCE_CHUNK_BYTES: Final = 2048  # 1024 samples
+_ANNOUNCE_PREFETCH_FRAMES: Final = 128  # about 6 seconds
+_START_CONVERSATION_PRIORITY: Final = 1
+_AUDIO_BUFFER_STATUS_KEY: Final = "audio_buffer_ms"
+# Buffer fill reports are needed more often than the pacer trusts them for
+_AUDIO_BUFFER_REPORTING: Final = StatusReporting(min_interval=0.5)
 _TTS_TIMEOUT_EXTRA: Final = 1.0
+_SETTINGS_DEBOUNCE_SECONDS: Final = 0.5
+# Longest wait after connecting for the satellite to report its settings
+# version before settings are sent in full
+_SETTINGS_REPORT_TIMEOUT: Final = 5
 
 
 async def async_setup_entry(
@@ -103,17 +123,65 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
 
         self.device.set_custom_settings_listener(self._custom_settings_changed)
         self.device.set_custom_action_listener(self._send_custom_action)
+        self.device.set_audio_lead_listener(self._audio_lead_changed)
+        self._unregister_buffer_reporting: CALLBACK_TYPE | None = None
 
         # Make info accessible from entities
         self.device.info = service.info
         if self.device._info_listener is not None:
             self.device._info_listener()
 
-        # Init custom settings
-        self.device.custom_settings = {}
+        # Init custom settings, starting from those last published if stored
+        if self.device.custom_settings is None:
+            self.device.custom_settings = {}
 
-        # stream tts var to allow interupt and cancel remaining response
-        self.stream_tts = False
+        # TTS or announcement being played, interrupted when the satellite
+        # stops audio (e.g. wake word during playback)
+        self._playback = PlaybackController(
+            self.device.metrics.setdefault("playback", {})
+        )
+
+        # Custom events are handled off the socket read loop
+        self._custom_events = CustomEventQueue()
+        self._custom_events_task: asyncio.Task | None = None
+        self.device.metrics["custom_events"] = self._custom_events.stats
+
+        # Announcements wait their turn and are merged into one audio stream
+        self._announcements: PlaybackQueue[AssistSatelliteAnnouncement] = PlaybackQueue(
+            self._async_play_announcements,
+            lambda coro: self.config_entry.async_create_background_task(
+                self.hass, coro, f"vaca announcements {device.satellite_id}"
+            ),
+            self.device.metrics.setdefault("announcement_queue", {}),
+            self._async_stop_announcement,
+        )
+
+        # Pipeline of the current run, used to prewarm STT/TTS connections
+        self._active_pipeline_id: str | None = None
+
+        # Shared ffmpeg decoders for announcement media
+        self._decoder_pool = async_get_decoder_pool(
+            hass, _TTS_SAMPLE_RATE, SAMPLE_WIDTH, SAMPLE_CHANNELS
+        )
+
+        # Coalesce custom settings updates into a single settings event
+        self._pending_settings_changes = 0
+        # Settings published at device.settings_version
+        self._published_settings: dict[str, Any] = dict(self.device.custom_settings)
+        # Settings the satellite holds on this connection, None if unknown
+        self._synced_settings: dict[str, Any] | None = None
+        self._synced_settings_version = 0
+        # Satellite reports its settings version, so accepts delta updates
+        self._supports_settings_delta = False
+        # Satellite answered with its settings version on this connection
+        self._settings_reported = asyncio.Event()
+        self._settings_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=_SETTINGS_DEBOUNCE_SECONDS,
+            immediate=False,
+            function=self._async_send_custom_settings,
+        )
 
     async def on_restart(self) -> None:
         """Block until pipeline loop will be restarted."""
@@ -133,8 +201,49 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
         )
         await asyncio.sleep(_RECONNECT_SECONDS)
 
+    async def async_added_to_hass(self) -> None:
+        """Run when entity about to be added to hass."""
+        await super().async_added_to_hass()
+        # Start a decoder ahead of the first announcement
+        self._decoder_pool.async_prewarm()
+
+        # Satellites may report their audio buffer fill, used for pacing
+        self.async_on_remove(
+            self.device.status_router.async_register(
+                _AUDIO_BUFFER_STATUS_KEY, self._audio_buffer_reported
+            )
+        )
+        self._audio_lead_changed()
+        self.async_on_remove(self._async_stop_buffer_reporting)
+
+    @callback
+    def _audio_lead_changed(self) -> None:
+        """Ask for audio buffer reports only while audio is paced."""
+        if self.device.audio_lead_ms <= 0:
+            self._async_stop_buffer_reporting()
+        elif self._unregister_buffer_reporting is None:
+            self._unregister_buffer_reporting = (
+                self.device.async_register_status_reporting(
+                    _AUDIO_BUFFER_STATUS_KEY, asdict(_AUDIO_BUFFER_REPORTING)
+                )
+            )
+
+    @callback
+    def _async_stop_buffer_reporting(self) -> None:
+        """Stop asking for audio buffer reports."""
+        if self._unregister_buffer_reporting is not None:
+            self._unregister_buffer_reporting()
+            self._unregister_buffer_reporting = None
+
+    @callback
+    def _audio_buffer_reported(self, status: dict[str, Any]) -> None:
+        """Record the audio buffer fill reported by the satellite."""
+        if isinstance(buffered_ms := status[_AUDIO_BUFFER_STATUS_KEY], (int, float)):
+            self._playback.async_buffer_reported(buffered_ms)
+
     async def async_will_remove_from_hass(self) -> None:
         """Run when entity will be removed from hass."""
+        self._settings_debouncer.async_cancel()
         try:
             await super().async_will_remove_from_hass()
         except AssertionError as ex:
@@ -144,6 +253,12 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
         """Allow injection of events before event sent."""
 
         if RunSatellite().is_type(event.type):
+            # New connection - settings held by the satellite are unknown
+            # until it reports its settings version
+            self._synced_settings = None
+            self._supports_settings_delta = False
+            self._settings_reported.clear()
+
             # integration version
             if self.device and self.device.custom_settings:
                 self.device.custom_settings[
@@ -173,33 +288,47 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
 
     @callback
     def on_receive_event_callback(self, event: Event) -> tuple[bool, Event | None]:
-        """Handle received custom events."""
+        """Handle received events not queued as custom events."""
         if event and AudioStop.is_type(event.type):
-            self.stream_tts = False
-            return not self.stream_tts, event
+            self._playback.async_interrupt()
 
-        if event and CustomEvent.is_type(event.type):
-            # Custom event
-            evt = CustomEvent.from_event(event)
+        return True, event
 
-            if evt.event_type == CAPABILITIES_EVENT_TYPE and evt.event_data:
-                self.device.capabilities = evt.event_data.get("capabilities", {})
+    async def _async_handle_custom_events(self) -> None:
+        """Handle queued custom events until cancelled."""
+        while True:
+            evt = await self._custom_events.get()
+            try:
+                self._handle_custom_event(evt)
+            except Exception:
+                _LOGGER.exception("Error handling %s event", evt.event_type)
 
-            elif evt.event_type == STATUS_EVENT_TYPE:
-                _LOGGER.debug(
-                    "Received %s event: %s",
-                    evt.event_type,
-                    evt.event_data,
-                )
-
-            async_dispatcher_send(
-                self.hass,
-                f"{DOMAIN}_{self.device.device_id}_{evt.event_type}_update",
+    @callback
+    def _handle_custom_event(self, evt: CustomEvent) -> None:
+        """Handle a received custom event."""
+        if evt.event_type == CAPABILITIES_EVENT_TYPE and evt.event_data:
+            self.device.capabilities = evt.event_data.get("capabilities", {})
+            if self.device.store is not None:
+                self.device.store.async_set_capabilities(self.device.capabilities)
+            self._settings_version_reported(evt.event_data)
+
+        elif evt.event_type == SETTINGS_EVENT_TYPE and evt.event_data:
+            self._settings_version_reported(evt.event_data)
+
+        elif evt.event_type == STATUS_EVENT_TYPE:
+            _LOGGER.debug(
+                "Received %s event: %s",
+                evt.event_type,
                 evt.event_data,
             )
-            return False, None
+            # Only entities registered for the keys present are called
+            if evt.event_data:
+                self.device.status_router.async_route(evt.event_data)
+            return
 
-        return True, event
+        async_dispatcher_send(
+            self.hass, self.device.signal(evt.event_type), evt.event_data
+        )
 
     async def _connect(self) -> None:
         """Connect to satellite over TCP.  Uses custom TCP client to allow callbacks on send."""
@@ -216,9 +345,25 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
             before_send_callback=self.on_before_send_event_callback,
             after_send_callback=self.on_after_send_event_callback,
             on_receive_callback=self.on_receive_event_callback,
+            custom_events=self._custom_events,
+            write_stats=self.device.metrics.setdefault("writer", {}),
         )
         await self._client.connect()
 
+        self._custom_events_task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_handle_custom_events(),
+            f"vaca custom events {self.device.satellite_id}",
+        )
+
+    async def _disconnect(self) -> None:
+        """Disconnect and stop handling custom events."""
+        if self._custom_events_task is not None:
+            self._custom_events_task.cancel()
+            self._custom_events_task = None
+        self._custom_events.clear()
+        await super()._disconnect()
+
     def on_pipeline_event(self, event: PipelineEvent) -> None:
         """Handle pipeline events from the assist pipeline.
 
@@ -229,9 +374,15 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
         MSP - Added by MSP1974 2025-07-08
         """
         if event.type == assist_pipeline.PipelineEventType.RUN_START:
-            # Fix for error when running pipeline for ask question
-            if event.data and not event.data.get("tts_output"):
-                event.data["tts_output"] = {"token": ""}
+            if event.data:
+                # Fix for error when running pipeline for ask question
+                if not event.data.get("tts_output"):
+                    event.data["tts_output"] = {"token": ""}
+                self._active_pipeline_id = event.data.get("pipeline")
+            self._prewarm_pipeline_connections()
+        elif event.type == assist_pipeline.PipelineEventType.WAKE_WORD_END:
+            # Wake word detected - STT and TTS will be needed shortly
+            self._prewarm_pipeline_connections()
         elif event.type == assist_pipeline.PipelineEventType.RUN_END:
             # Pipeline ended
             if self._client is not None:
@@ -273,21 +424,61 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
 
         super().on_pipeline_event(event)
 
+    @callback
+    def _prewarm_pipeline_connections(self) -> None:
+        """Open connections to the pipeline STT and TTS services ahead of use."""
+        if self._active_pipeline_id is None:
+            return
+
+        pipeline = assist_pipeline.async_get_pipeline(
+            self.hass, self._active_pipeline_id
+        )
+        async_prewarm_entity_connection(self.hass, pipeline.stt_engine)
+        async_prewarm_entity_connection(self.hass, pipeline.tts_engine)
+
     async def async_announce(self, announcement: AssistSatelliteAnnouncement) -> None:
         """Announce media on the satellite.
 
         Should block until the announcement is done playing.
         MSP - Fixes that Wyoming announce does not play preannounce sound
         """
-        assert self._client is not None
+        try:
+            await self._announcements.async_play(
+                announcement, replace=self.device.replace_announcements
+            )
+        except PlaybackReplacedError:
+            _LOGGER.debug("Announcement replaced before playing")
+
+    @callback
+    def _async_stop_announcement(self) -> None:
+        """Stop the announcement playing, as no caller waits for it."""
+        if (playback := self._playback.current) and playback.kind == "announcement":
+            self._playback.async_interrupt()
 
-        if self._ffmpeg_manager is None:
-            self._ffmpeg_manager = ffmpeg.get_ffmpeg_manager(self.hass)
+    async def _async_play_announcements(
+        self, announcements: list[AssistSatelliteAnnouncement]
+    ) -> None:
+        """Play queued announcements in one audio stream."""
+        assert self._client is not None
 
         if self._played_event_received is None:
             self._played_event_received = asyncio.Event()
 
         self._played_event_received.clear()
+        playback = self._playback.async_start(
+            "announcement", self.device.audio_lead_ms / 1000
+        )
+        playback.async_on_interrupt(self._client.discard_audio)
+
+        media_ids = [
+            media_id
+            for announcement in announcements
+            for media_id in (announcement.preannounce_media_id, announcement.media_id)
+            if media_id
+        ]
+        prefetchers: list[FramePrefetcher] = []
+        encoder = AudioFrameEncoder(_TTS_SAMPLE_RATE, SAMPLE_WIDTH, SAMPLE_CHANNELS)
+
         await self._client.write_event(
             AudioStart(
                 rate=_TTS_SAMPLE_RATE,
@@ -298,93 +489,140 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
         )
 
         timestamp = 0
-
-        # Play preannounce sound if set
-        if announcement.preannounce_media_id:
-            preannounce_proc = await asyncio.create_subprocess_exec(
-                self._ffmpeg_manager.binary,
-                "-i",
-                announcement.preannounce_media_id,
-                "-f",
-                "s16le",
-                "-ac",
-                str(SAMPLE_CHANNELS),
-                "-ar",
-                str(_TTS_SAMPLE_RATE),
-                "-nostats",
-                "pipe:",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                close_fds=False,  # use posix_spawn in CPython < 3.13
-            )
-            assert preannounce_proc.stdout is not None
-            while True:
-                chunk_bytes = await preannounce_proc.stdout.read(_ANNOUNCE_CHUNK_BYTES)
-                if not chunk_bytes:
-                    break
-
-                chunk = AudioChunk(
-                    rate=_TTS_SAMPLE_RATE,
-                    width=SAMPLE_WIDTH,
-                    channels=SAMPLE_CHANNELS,
-                    audio=chunk_bytes,
-                    timestamp=timestamp,
-                )
-                await self._client.write_event(chunk.event())
-
-                timestamp += chunk.milliseconds
+        previous_end: float | None = None
+        metrics = self.device.metrics.setdefault("announce", {"announcements": 0})
+        metrics["announcements"] += len(announcements)
 
         try:
-            # Use ffmpeg to convert to raw PCM audio with the appropriate format
-            proc = await asyncio.create_subprocess_exec(
-                self._ffmpeg_manager.binary,
-                "-i",
-                announcement.media_id,
-                "-f",
-                "s16le",
-                "-ac",
-                str(SAMPLE_CHANNELS),
-                "-ar",
-                str(_TTS_SAMPLE_RATE),
-                "-nostats",
-                "pipe:",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                close_fds=False,  # use posix_spawn in CPython < 3.13
-            )
-            assert proc.stdout is not None
-            while True:
-                chunk_bytes = await proc.stdout.read(_ANNOUNCE_CHUNK_BYTES)
-                if not chunk_bytes:
-                    break
-
-                chunk = AudioChunk(
-                    rate=_TTS_SAMPLE_RATE,
-                    width=SAMPLE_WIDTH,
-                    channels=SAMPLE_CHANNELS,
-                    audio=chunk_bytes,
-                    timestamp=timestamp,
-                )
-                await self._client.write_event(chunk.event())
+            for index, media_id in enumerate(media_ids):
+                # Keep the next media decoding while this one plays, so it
+                # is buffered when this one ends
+                while len(prefetchers) < min(index + 2, len(media_ids)):
+                    prefetcher = self._async_prefetch_media(media_ids[len(prefetchers)])
+                    playback.async_on_interrupt(prefetcher.cancel)
+                    prefetchers.append(prefetcher)
+
+                media = prefetchers[index]
+                first_frame = True
+                async for chunk_bytes in media:
+                    if playback.interrupted:
+                        break
+                    if first_frame:
+                        first_frame = False
+                        assert media.first_frame is not None
+                        metrics["last_media_startup_ms"] = round(
+                            (media.first_frame - media.started) * 1000
+                        )
+                        if previous_end is not None:
+                            # Silence left between this and the previous media
+                            metrics["last_gap_ms"] = round(
+                                max(0, time.monotonic() - previous_end) * 1000
+                            )
+                    timestamp = await self._write_announce_chunk(
+                        playback, encoder, chunk_bytes, timestamp
+                    )
 
-                timestamp += chunk.milliseconds
+                if playback.interrupted:
+                    break
+                _LOGGER.debug("Played announcement media %s", media_id)
+                previous_end = time.monotonic()
         finally:
-            await self._client.write_event(AudioStop().event())
-            if timestamp > 0:
-                # Wait the length of the audio or until we receive a played event
+            # Stop decoding without awaiting, so the stream is ended before
+            # anything else can start one on the satellite
+            for prefetcher in prefetchers:
+                prefetcher.cancel()
+            # The client is gone if the satellite disconnected mid-announcement
+            if self._client is not None:
+                await self._client.write_event(AudioStop().event())
+            for prefetcher in prefetchers:
+                await prefetcher.async_close()
+            if playback.interrupted:
+                _LOGGER.debug("Announcement interrupted")
+            elif timestamp > 0:
+                # Wait the length of the audio, until we receive a played event
+                # or the announcement is interrupted
                 audio_seconds = timestamp / 1000
-                try:
-                    async with asyncio.timeout(audio_seconds + 0.5):
-                        await self._played_event_received.wait()
-                except TimeoutError:
+                played = await playback.async_wait(
+                    self._played_event_received, audio_seconds + 0.5
+                )
+                if not played and not playback.interrupted:
                     # Older satellite clients will wait longer than necessary
                     _LOGGER.debug("Did not receive played event for announcement")
+            self._playback.async_finish(playback)
+
+    async def _write_announce_chunk(
+        self,
+        playback: Playback,
+        encoder: AudioFrameEncoder,
+        audio: bytes,
+        timestamp: int,
+    ) -> int:
+        """Write an announcement audio chunk and return the next timestamp."""
+        assert self._client is not None
+        await playback.async_pace(encoder.seconds(audio))
+        await self._client.write_audio_frame(encoder.encode(audio, timestamp))
+        return timestamp + encoder.milliseconds(audio)
+
+    @callback
+    def _async_prefetch_media(self, media_id: str) -> FramePrefetcher:
+        """Start decoding announcement media into a prefetch buffer."""
+        return FramePrefetcher(
+            self._async_media_frames(media_id),
+            _ANNOUNCE_PREFETCH_FRAMES,
+            lambda coro: self.config_entry.async_create_background_task(
+                self.hass, coro, f"vaca decode {media_id}"
+            ),
+        )
+
+    async def _async_media_frames(self, media_id: str) -> AsyncGenerator[bytes]:
+        """Yield announcement PCM frames, decoding with ffmpeg on a cache miss."""
+        pcm_cache = async_get_decoded_audio_cache(self.hass)
+        cache_key = await pcm_cache.async_cache_key(
+            media_id, _TTS_SAMPLE_RATE, SAMPLE_WIDTH, SAMPLE_CHANNELS
+        )
+        if cache_key is not None and (frames := pcm_cache.get(cache_key)):
+            _LOGGER.debug("Playing decoded audio from cache: %s", media_id)
+            for frame in frames:
+                yield frame
+            return
+
+        decoded: list[bytes] = []
+        decoded_bytes = 0
+        try:
+            async for frame in self._decoder_pool.async_decode(
+                media_id, _ANNOUNCE_CHUNK_BYTES
+            ):
+                if cache_key is not None:
+                    decoded.append(frame)
+                    decoded_bytes += len(frame)
+                    if decoded_bytes > DECODED_AUDIO_MAX_ENTRY_BYTES:
+                        cache_key = None
+                        decoded.clear()
+
+                yield frame
+        except DecodeError as err:
+            _LOGGER.warning("Unable to play announcement media: %s", err)
+            return
+
+        if cache_key is not None and decoded:
+            pcm_cache.put(cache_key, tuple(decoded))
 
     async def async_start_conversation(
         self, start_announcement: AssistSatelliteAnnouncement
     ) -> None:
         """Start a conversation from the satellite."""
-        await self.async_announce(start_announcement)
+        # Played ahead of queued announcements, and alone since each one
+        # starts its own pipeline
+        try:
+            await self._announcements.async_play(
+                start_announcement,
+                priority=_START_CONVERSATION_PRIORITY,
+                replace=self.device.replace_announcements,
+                merge=False,
+            )
+        except PlaybackReplacedError:
+            _LOGGER.debug("Conversation replaced before starting")
+            return
         self._run_pipeline_once(
             RunPipeline(
                 start_stage=PipelineStage.ASR,
@@ -393,19 +631,115 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
             )
         )
 
+    @callback
     def _custom_settings_changed(self) -> None:
-        """Run when device screen settings change."""
-        if self._client is not None and self._client.can_write_event():
-            self.config_entry.async_create_background_task(
-                self.hass,
-                self._client.write_event(
-                    CustomEvent(
-                        SETTINGS_EVENT_TYPE,
-                        {SETTINGS_EVENT_TYPE: self.device.custom_settings},
-                    ).event()
-                ),
-                "custom settings event",
+        """Run when device screen settings change.
+
+        Changes are coalesced so a burst of updates (entity restore at
+        startup, slider drags) results in a single settings event.
+        """
+        self._pending_settings_changes += 1
+        self._settings_debouncer.async_schedule_call()
+
+    @callback
+    def _settings_version_reported(self, event_data: dict[str, Any]) -> None:
+        """Handle the settings version and hash reported by the satellite."""
+        # Older satellites answer without a version, so stop waiting either way
+        self._settings_reported.set()
+        if (version := event_data.get(SETTINGS_VERSION_KEY)) is None:
+            return
+
+        self._supports_settings_delta = True
+        if (
+            version == self.device.settings_version
+            and event_data.get(SETTINGS_HASH_KEY) == self.device.settings_hash
+        ):
+            # Satellite already has the published settings
+            self._synced_settings = dict(self._published_settings)
+            self._synced_settings_version = version
+        else:
+            _LOGGER.debug(
+                "Satellite settings version %s differs from %s, sending all settings",
+                version,
+                self.device.settings_version,
             )
+            self._synced_settings = None
+        self._custom_settings_changed()
+
+    async def _async_send_custom_settings(self) -> None:
+        """Send changed custom settings to the satellite."""
+        if self._client is None or not self._client.can_write_event():
+            return
+
+        if not self._settings_reported.is_set():
+            # Settings the satellite already holds are not resent, so wait
+            # for its report before the first send on a connection
+            try:
+                async with asyncio.timeout(_SETTINGS_REPORT_TIMEOUT):
+                    await self._settings_reported.wait()
+            except TimeoutError:
+                _LOGGER.debug("Satellite did not report its settings version")
+                self._settings_reported.set()
+            if self._client is None or not self._client.can_write_event():
+                return
+
+        settings_metrics = self.device.metrics.setdefault(
+            "settings",
+            {
+                "sends": 0,
+                "full_sends": 0,
+                "delta_sends": 0,
+                "skipped": 0,
+                "coalesced": 0,
+            },
+        )
+        settings_metrics["coalesced"] += max(0, self._pending_settings_changes - 1)
+        self._pending_settings_changes = 0
+
+        settings = dict(self.device.custom_settings or {})
+        settings_hash = getSettingsHash(settings)
+        if settings_hash != self.device.settings_hash:
+            self.device.settings_version += 1
+            self.device.settings_hash = settings_hash
+            self._published_settings = settings
+            if self.device.store is not None:
+                self.device.store.async_set_settings(
+                    settings, self.device.settings_version, settings_hash
+                )
+
+        payload = settings
+        delta = False
+        if self._synced_settings is not None:
+            changed = {
+                key: value
+                for key, value in settings.items()
+                if key not in self._synced_settings
+                or self._synced_settings[key] != value
+            }
+            if not changed:
+                settings_metrics["skipped"] += 1
+                return
+            if self._supports_settings_delta:
+                payload = changed
+                delta = True
+
+        event_data: dict[str, Any] = {
+            SETTINGS_EVENT_TYPE: payload,
+            SETTINGS_VERSION_KEY: self.device.settings_version,
+            SETTINGS_HASH_KEY: self.device.settings_hash,
+        }
+        if delta:
+            event_data[SETTINGS_DELTA_KEY] = True
+            event_data[SETTINGS_BASE_VERSION_KEY] = self._synced_settings_version
+
+        settings_metrics["sends"] += 1
+        settings_metrics["delta_sends" if delta else "full_sends"] += 1
+
+        await self._client.write_event(
+            CustomEvent(SETTINGS_EVENT_TYPE, event_data).event()
+        )
+        self._synced_settings = settings
+        self._synced_settings_version = self.device.settings_version
 
     def _send_custom_action(
         self, command: str, payload: str | float | None = None
@@ -424,7 +758,7 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
             )
 
     async def _stream_tts(self, tts_result: tts.ResultStream) -> None:
-        """Stream TTS WAV audio to satellite in chunks."""
+        """Stream TTS WAV audio to satellite in chunks as it is synthesized."""
         assert self._client is not None
 
         if tts_result.extension != "wav":
@@ -435,52 +769,83 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
         # Track the total duration of TTS audio for response timeout
         total_seconds = 0.0
         start_time = time.monotonic()
+        first_audio_time: float | None = None
+
+        parser = WavStreamParser(_SAMPLES_PER_CHUNK)
+        encoder: AudioFrameEncoder | None = None
+        audio_started = False
+        timestamp = 0
+
+        # Start audio stream, stopped if the playback is interrupted
+        playback = self._playback.async_start("tts", self.device.audio_lead_ms / 1000)
+        # Queued audio is dropped so the device goes quiet at once
+        playback.async_on_interrupt(self._client.discard_audio)
 
         try:
-            data = b"".join([chunk async for chunk in tts_result.async_stream_result()])
-
-            with io.BytesIO(data) as wav_io, wave.open(wav_io, "rb") as wav_file:
-                sample_rate = wav_file.getframerate()
-                sample_width = wav_file.getsampwidth()
-                sample_channels = wav_file.getnchannels()
-                _LOGGER.debug("Streaming %s TTS sample(s)", wav_file.getnframes())
-
-                # Start audio stream - set flag to allow streaming
-                self.stream_tts = True
-
-                timestamp = 0
-                await self._client.write_event(
-                    AudioStart(
-                        rate=sample_rate,
-                        width=sample_width,
-                        channels=sample_channels,
-                        timestamp=timestamp,
-                    ).event()
-                )
+            async for data in tts_result.async_stream_result():
+                if playback.interrupted:
+                    break
+
+                frames = parser.feed(data)
+                if not parser.header_parsed:
+                    continue
+
+                if encoder is None:
+                    _LOGGER.debug(
+                        "Streaming TTS audio: rate=%s, width=%s, channels=%s",
+                        parser.rate,
+                        parser.width,
+                        parser.channels,
+                    )
+                    await self._client.write_event(
+                        AudioStart(
+                            rate=parser.rate,
+                            width=parser.width,
+                            channels=parser.channels,
+                            timestamp=timestamp,
+                        ).event()
+                    )
+                    audio_started = True
+                    encoder = AudioFrameEncoder(
+                        parser.rate, parser.width, parser.channels
+                    )
 
-                # Stream audio chunks
-                while audio_bytes := wav_file.readframes(_SAMPLES_PER_CHUNK):
-                    # If flag set to false, stop streaming
-                    if not self.stream_tts:
-                        _LOGGER.debug("TTS streaming interrupted")
+                for audio_bytes in frames:
+                    if playback.interrupted:
                         break
-                    chunk = AudioChunk(
-                        rate=sample_rate,
-                        width=sample_width,
-                        channels=sample_channels,
-                        audio=audio_bytes,
-                        timestamp=timestamp,
+                    timestamp, seconds = await self._write_tts_chunk(
+                        playback, encoder, audio_bytes, timestamp
                     )
-                    await self._client.write_event(chunk.event())
-                    timestamp += int(chunk.seconds)
-                    total_seconds += chunk.seconds
+                    total_seconds += seconds
+                    if first_audio_time is None:
+                        first_audio_time = time.monotonic()
+            else:
+                if not playback.interrupted and (audio_bytes := parser.flush()):
+                    assert encoder is not None
+                    timestamp, seconds = await self._write_tts_chunk(
+                        playback, encoder, audio_bytes, timestamp
+                    )
+                    total_seconds += seconds
+
+            if playback.interrupted:
+                _LOGGER.debug("TTS streaming interrupted")
 
+            if audio_started:
                 await self._client.write_event(AudioStop(timestamp=timestamp).event())
-                _LOGGER.debug("TTS streaming complete")
+            _LOGGER.debug("TTS streaming complete")
         finally:
+            self._playback.async_finish(playback)
             send_duration = time.monotonic() - start_time
             timeout_seconds = max(0, total_seconds - send_duration + _TTS_TIMEOUT_EXTRA)
 
+            tts_metrics = self.device.metrics.setdefault("tts", {})
+            tts_metrics["streams"] = tts_metrics.get("streams", 0) + 1
+            tts_metrics["last_audio_seconds"] = round(total_seconds, 3)
+            if first_audio_time is not None:
+                first_audio_ms = round((first_audio_time - start_time) * 1000, 1)
+                tts_metrics["last_time_to_first_audio_ms"] = first_audio_ms
+                _LOGGER.debug("TTS time to first audio: %sms", first_audio_ms)
+
             if self._played_event_received is None:
                 self._played_event_received = asyncio.Event()
             self._played_event_received.clear()
@@ -491,6 +856,21 @@ class ViewAssistSatelliteEntity(WyomingAssistSatellite, VASatelliteEntity):
                 name="wyoming TTS timeout",
             )
 
+    async def _write_tts_chunk(
+        self,
+        playback: Playback,
+        encoder: AudioFrameEncoder,
+        audio_bytes: bytes | memoryview,
+        timestamp: int,
+    ) -> tuple[int, float]:
+        """Write a TTS audio chunk and return the new timestamp and chunk length."""
+        assert self._client is not None
+
+        seconds = encoder.seconds(audio_bytes)
+        await playback.async_pace(seconds)
+        await self._client.write_audio_frame(encoder.encode(audio_bytes, timestamp))
+        return timestamp + encoder.milliseconds(audio_bytes), seconds
+
     async def _tts_timeout(
         self, timeout_seconds: float, run_loop_id: str | None
     ) -> None:
@@ -0,0 +1,321 @@
+"""Audio helpers for streaming PCM to VACA satellites."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator, Callable, Coroutine
+from contextlib import suppress
+import json
+import struct
+import time
+from typing import Any, Final
+
+from wyoming import __version__ as WYOMING_VERSION
+
+_RIFF_HEADER_BYTES: Final = 12
+_CHUNK_HEADER_BYTES: Final = 8
+_WAVE_FORMAT_PCM: Final = 1
+_WAVE_FORMAT_EXTENSIBLE: Final = 0xFFFE
+# Streaming encoders write 0 or 0xFFFFFFFF when the data length is unknown
+_UNKNOWN_DATA_SIZES: Final = (0, 0xFFFFFFFF)
+
+AUDIO_CHUNK_TYPE: Final = "audio-chunk"
+
+# Buffers of one audio-chunk event as written to the socket
+EncodedFrame = tuple[bytes | memoryview, ...]
+
+
+class WavStreamParser:
+    """Incrementally parse a WAV byte stream into fixed size PCM frames.
+
+    Bytes are fed as they arrive from the TTS engine.  The RIFF header is
+    parsed from the first bytes and complete frames are returned as soon as
+    enough audio is buffered, so playback can start before synthesis ends.
+    """
+
+    def __init__(self, samples_per_chunk: int) -> None:
+        """Initialize parser."""
+        self.samples_per_chunk = samples_per_chunk
+        self.rate: int | None = None
+        self.width: int | None = None
+        self.channels: int | None = None
+
+        self._buffer = bytearray()
+        self._riff_checked = False
+        self._in_data = False
+        self._data_remaining: int | None = None
+        self._skip_bytes = 0
+
+    @property
+    def header_parsed(self) -> bool:
+        """Return True once the audio format is known."""
+        return self._in_data
+
+    @property
+    def frame_bytes(self) -> int:
+        """Return number of bytes in a full frame."""
+        assert self.width is not None and self.channels is not None
+        return self.samples_per_chunk * self.width * self.channels
+
+    def feed(self, data: bytes) -> list[memoryview]:
+        """Add data to the parser and return any complete frames.
+
+        Frames are slices of one copy of the buffered audio.
+        """
+        if not self._in_data:
+            self._buffer.extend(data)
+            self._parse_header()
+            if not self._in_data:
+                return []
+        else:
+            self._add_audio(data)
+
+        frame_bytes = self.frame_bytes
+        ready = len(self._buffer) - len(self._buffer) % frame_bytes
+        if not ready:
+            return []
+
+        audio = memoryview(bytes(self._buffer[:ready]))
+        del self._buffer[:ready]
+        return [audio[i : i + frame_bytes] for i in range(0, ready, frame_bytes)]
+
+    def flush(self) -> bytes:
+        """Return remaining whole samples once the stream has ended."""
+        if not self._in_data:
+            return b""
+
+        sample_bytes = self.width * self.channels  # type: ignore[operator]
+        remaining = len(self._buffer) - (len(self._buffer) % sample_bytes)
+        audio = bytes(self._buffer[:remaining])
+        self._buffer.clear()
+        return audio
+
+    def _add_audio(self, data: bytes) -> None:
+        """Buffer audio bytes, ignoring anything after the data chunk."""
+        if self._data_remaining is not None:
+            data = data[: self._data_remaining]
+            self._data_remaining -= len(data)
+        self._buffer.extend(data)
+
+    def _parse_header(self) -> None:
+        """Parse as much of the RIFF header as is buffered."""
+        if not self._riff_checked:
+            if len(self._buffer) < _RIFF_HEADER_BYTES:
+                return
+            if self._buffer[0:4] != b"RIFF" or self._buffer[8:12] != b"WAVE":
+                raise ValueError("TTS audio is not a WAV stream")
+            del self._buffer[:_RIFF_HEADER_BYTES]
+            self._riff_checked = True
+
+        while not self._in_data:
+            if self._skip_bytes:
+                skipped = min(self._skip_bytes, len(self._buffer))
+                del self._buffer[:skipped]
+                self._skip_bytes -= skipped
+                if self._skip_bytes:
+                    return
+
+            if len(self._buffer) < _CHUNK_HEADER_BYTES:
+                return
+
+            chunk_id = bytes(self._buffer[0:4])
+            (chunk_size,) = struct.unpack_from("<I", self._buffer, 4)
+
+            if chunk_id == b"data":
+                if self.rate is None:
+                    raise ValueError("WAV data chunk found before fmt chunk")
+                del self._buffer[:_CHUNK_HEADER_BYTES]
+                if chunk_size not in _UNKNOWN_DATA_SIZES:
+                    self._data_remaining = chunk_size
+                self._in_data = True
+                audio = bytes(self._buffer)
+                self._buffer.clear()
+                self._add_audio(audio)
+                return
+
+            if chunk_id == b"fmt ":
+                if len(self._buffer) < _CHUNK_HEADER_BYTES + 16:
+                    return
+                (
+                    audio_format,
+                    channels,
+                    rate,
+                    _byte_rate,
+                    _block_align,
+                    bits_per_sample,
+                ) = struct.unpack_from("<HHIIHH", self._buffer, _CHUNK_HEADER_BYTES)
+                if audio_format not in (_WAVE_FORMAT_PCM, _WAVE_FORMAT_EXTENSIBLE):
+                    raise ValueError(f"Unsupported WAV format: {audio_format}")
+                self.rate = rate
+                self.width = bits_per_sample // 8
+                self.channels = channels
+
+            # Skip chunk body, which is padded to an even number of bytes
+            del self._buffer[:_CHUNK_HEADER_BYTES]
+            self._skip_bytes = chunk_size + (chunk_size % 2)
+
+
+class AudioFrameEncoder:
+    """Encode the audio-chunk events of one stream straight to wire buffers.
+
+    The JSON of the format fields is built once per stream, and only the
+    timestamp and lengths are formatted for each frame.  Output is byte for
+    byte what wyoming writes for the same AudioChunk event.  Audio is not
+    copied, so frames can be memoryview slices of a larger buffer.
+    """
+
+    def __init__(self, rate: int, width: int, channels: int) -> None:
+        """Initialize encoder."""
+        self.rate = rate
+        self.width = width
+        self.channels = channels
+        self._sample_bytes = width * channels
+
+        audio_format = json.dumps({"rate": rate, "width": width, "channels": channels})
+        self._data_prefix = f'{audio_format[:-1]}, "timestamp": '
+        header = json.dumps({"type": AUDIO_CHUNK_TYPE, "version": WYOMING_VERSION})
+        self._header_prefix = f'{header[:-1]}, "data_length": '
+
+    def encode(self, audio: bytes | memoryview, timestamp: int | None) -> EncodedFrame:
+        """Return the header line, data and payload of an audio chunk."""
+        data = (
+            f"{self._data_prefix}{'null' if timestamp is None else timestamp}}}"
+        ).encode()
+        if not (audio_bytes := len(audio)):
+            return (f"{self._header_prefix}{len(data)}}}\n".encode(), data)
+        header = (
+            f'{self._header_prefix}{len(data)}, "payload_length": {audio_bytes}}}\n'
+        ).encode()
+        return (header, data, audio)
+
+    def seconds(self, audio: bytes | memoryview) -> float:
+        """Return the length of audio in seconds."""
+        return len(audio) // self._sample_bytes / self.rate
+
+    def milliseconds(self, audio: bytes | memoryview) -> int:
+        """Return the length of audio in whole milliseconds, as AudioChunk does."""
+        return int(self.seconds(audio) * 1_000)
+
+
+class WavFrameConverter:
+    """Convert a 16-bit PCM WAV stream to framed s16le PCM without ffmpeg.
+
+    Only audio already in the output rate and channels is converted, which
+    just strips the WAV header, so it is done as data arrives without
+    leaving the event loop.  Resampling and channel mixing are left to
+    ffmpeg.  Like ffmpeg output read in frame_bytes blocks, the last frame
+    may be short.
+    """
+
+    def __init__(self, rate: int, channels: int, frame_bytes: int) -> None:
+        """Initialize converter."""
+        self.rate = rate
+        self.channels = channels
+        self._parser = WavStreamParser(frame_bytes // (2 * channels))
+        self._checked = False
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Add WAV bytes and return the complete frames.
+
+        Raises ValueError, before any frame is returned, for audio that
+        must be decoded by ffmpeg.
+        """
+        frames = self._parser.feed(data)
+        if not self._checked and self._parser.header_parsed:
+            self._check_format()
+        return [bytes(frame) for frame in frames]
+
+    def flush(self) -> list[bytes]:
+        """Return the last, short frame once the WAV stream has ended."""
+        if not self._checked:
+            raise ValueError("WAV stream ended before its audio")
+        remaining = self._parser.flush()
+        return [remaining] if remaining else []
+
+    def _check_format(self) -> None:
+        """Raise ValueError unless the audio is in the output format."""
+        parser = self._parser
+        if (
+            parser.width != 2
+            or parser.rate != self.rate
+            or parser.channels != self.channels
+        ):
+            raise ValueError(
+                f"Unsupported WAV audio: {parser.rate} Hz, {parser.width * 8} bit, "
+                f"{parser.channels} channel(s)"
+            )
+        self._checked = True
+
+
+class FramePrefetcher:
+    """Decode frames ahead of playback into a bounded buffer.
+
+    The frame source is consumed by its own task from creation, so several
+    sources can be decoding while an earlier one is still being played.
+    Iterating yields the buffered frames in order, and re-raises any error
+    from the source.
+    """
+
+    def __init__(
+        self,
+        frames: AsyncGenerator[bytes],
+        max_frames: int,
+        create_task: Callable[[Coroutine[Any, Any, None]], asyncio.Task],
+    ) -> None:
+        """Initialize prefetcher and start consuming frames."""
+        self._queue: asyncio.Queue[bytes | None] = asyncio.Queue(max_frames)
+        self._error: BaseException | None = None
+        self._done = False
+        self.started = time.monotonic()
+        self.first_frame: float | None = None
+        self._frames = frames
+        self._task = create_task(self._async_fill())
+
+    async def _async_fill(self) -> None:
+        """Buffer frames until the source ends."""
+        try:
+            async for frame in self._frames:
+                if self.first_frame is None:
+                    self.first_frame = time.monotonic()
+                await self._queue.put(frame)
+        except Exception as err:  # noqa: BLE001
+            self._error = err
+        finally:
+            # Let the source clean up, such as stopping its decoder, when
+            # cancelled while waiting for buffer space
+            await self._frames.aclose()
+        await self._queue.put(None)
+
+    def __aiter__(self) -> FramePrefetcher:
+        """Return frame iterator."""
+        return self
+
+    async def __anext__(self) -> bytes:
+        """Return the next buffered frame."""
+        if self._done or (frame := await self._queue.get()) is None or self._done:
+            self._done = True
+            if self._error is not None:
+                raise self._error
+            raise StopAsyncIteration
+        return frame
+
+    def cancel(self) -> None:
+        """Stop consuming the frame source and end iteration."""
+        self._done = True
+        self._task.cancel()
+        # Wake a consumer waiting for the next frame
+        with suppress(asyncio.QueueFull):
+            self._queue.put_nowait(None)
+
+    async def async_close(self) -> None:
+        """Stop consuming the frame source."""
+        self._done = True
+        if not self._task.done():
+            self.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                if (task := asyncio.current_task()) and task.cancelling():
+                    raise
+        # The source is not started if the task was cancelled before running
+        await self._frames.aclose()
@@ -11,14 +11,18 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
 from .const import DOMAIN
 from .devices import VASatelliteDevice
-from .entity import VASatelliteEntity
+from .entity import (
+    VASatelliteEntity,
+    async_setup_capability_entities,
+    capability_supported,
+)
 
 if TYPE_CHECKING:
     from homeassistant.components.wyoming import DomainDataItem
@@ -38,18 +42,31 @@ async def async_setup_entry(
     # Setup is only forwarded for satellites
     assert item.device is not None
 
-    entities = []
+    async_add_entities([WyomingSatelliteScreenOnBinarySensor(device)])
 
-    entities.append(WyomingSatelliteScreenOnBinarySensor(device))
+    async_setup_capability_entities(
+        hass,
+        config_entry,
+        Platform.BINARY_SENSOR,
+        device,
+        async_add_entities,
+        _supported_entities,
+    )
 
-    if capabilities := device.capabilities:
-        if capabilities.get("has_battery"):
-            entities.append(WyomingSatelliteBatteryChargingBinarySensor(device))
-        if capabilities.get("has_front_camera"):
-            entities.append(WyomingSatelliteMotionDetectedSensor(device))
 
-    if entities:
-        async_add_entities(entities)
+def _supported_entities(
+    device: VASatelliteDevice,
+) -> dict[type[VASatelliteEntity], bool | None]:
+    """Return capability dependent entities and if the device supports them."""
+    capabilities = device.capabilities
+    return {
+        WyomingSatelliteBatteryChargingBinarySensor: capability_supported(
+            capabilities, "has_battery"
+        ),
+        WyomingSatelliteMotionDetectedSensor: capability_supported(
+            capabilities, "has_front_camera"
+        ),
+    }
 
 
 class _WyomingSatelliteDeviceBinarySensorBase(
@@ -58,7 +75,6 @@ class _WyomingSatelliteDeviceBinarySensorBase(
     """Base class for device sensors."""
 
     _attr_is_on = False
-    _listener_class = "status_update"
 
     async def async_added_to_hass(self) -> None:
         """Call when entity about to be added to hass."""
@@ -70,11 +86,10 @@ class _WyomingSatelliteDeviceBinarySensorBase(
             self._attr_is_on = bool(state.state)
             self.async_write_ha_state()
 
+        self._write_filter = self.async_create_write_filter(self._async_write_value)
         self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                f"{DOMAIN}_{self._device.device_id}_{self._listener_class}",
-                self.status_update,
+            self._device.status_router.async_register_sensor(
+                self.entity_description.key, self.status_update
             )
         )
 
@@ -87,12 +102,16 @@ class _WyomingSatelliteDeviceBinarySensorBase(
     @callback
     def status_update(self, data: dict[str, Any]) -> None:
         """Update entity."""
-        if sensors := data.get("sensors"):
-            if self.entity_description.key in sensors:
-                self._attr_is_on = self._get_binary_value(
-                    sensors[self.entity_description.key]
-                )
-                self.async_write_ha_state()
+        # Router only calls this when the payload contains our sensor key
+        self._write_filter.async_update(
+            self._get_binary_value(data["sensors"][self.entity_description.key])
+        )
+
+    @callback
+    def _async_write_value(self, value: Any) -> None:
+        """Write a status value that passed the write filter."""
+        self._attr_is_on = value
+        self.async_write_ha_state()
 
 
 class WyomingSatelliteBatteryChargingBinarySensor(
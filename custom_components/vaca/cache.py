@@ -0,0 +1,365 @@
+"""Byte budgeted caches for synthesized and decoded audio."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Callable
+import hashlib
+import json
+import logging
+import mmap
+import os
+from pathlib import Path
+import time
+from typing import Any, Final, Generic, TypeVar
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_TTS_CACHES: Final = f"{DOMAIN}_tts_caches"
+DATA_DECODED_AUDIO_CACHE: Final = f"{DOMAIN}_decoded_audio_cache"
+
+_TTS_MEMORY_CACHE_BYTES: Final = 8 * 1024 * 1024
+_TTS_DISK_CACHE_BYTES: Final = 64 * 1024 * 1024
+# Only short phrases are worth keeping, long answers are rarely repeated
+_TTS_CACHE_MAX_TEXT: Final = 100
+_TTS_CACHE_EXTENSION: Final = ".wav"
+
+_DECODED_AUDIO_CACHE_BYTES: Final = 32 * 1024 * 1024
+# Longer media (music, podcasts) is streamed but not kept
+DECODED_AUDIO_MAX_ENTRY_BYTES: Final = 4 * 1024 * 1024
+_MEDIA_VALIDATOR_TIMEOUT: Final = 2
+# HTTP validators are reused for this long, rather than requested every play
+_MEDIA_VALIDATOR_TTL: Final = 30
+# Query parameter of Home Assistant signed URLs, which changes on every call
+_AUTH_SIGNATURE_PARAM: Final = "authSig"
+
+_V = TypeVar("_V")
+
+
+class LRUByteCache(Generic[_V]):
+    """In-memory least recently used cache bounded by total size in bytes."""
+
+    def __init__(self, max_bytes: int, sizeof: Callable[[_V], int]) -> None:
+        """Initialize cache."""
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._entries: OrderedDict[str, tuple[_V, int]] = OrderedDict()
+        self.size_bytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: str) -> bool:
+        """Return True if key is cached."""
+        return key in self._entries
+
+    def __len__(self) -> int:
+        """Return number of cached entries."""
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self.size_bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def get(self, key: str) -> _V | None:
+        """Return cached value and mark it as recently used."""
+        if (entry := self._entries.get(key)) is None:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key: str, value: _V) -> None:
+        """Add value, evicting least recently used entries to stay in budget."""
+        size = self._sizeof(value)
+        if size > self.max_bytes:
+            return
+
+        self.pop(key)
+        self._entries[key] = (value, size)
+        self.size_bytes += size
+
+        while self.size_bytes > self.max_bytes:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.size_bytes -= evicted_size
+            self.evictions += 1
+
+    def pop(self, key: str) -> _V | None:
+        """Remove a value from the cache."""
+        if (entry := self._entries.pop(key, None)) is None:
+            return None
+        self.size_bytes -= entry[1]
+        return entry[0]
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self.size_bytes = 0
+
+
+def tts_cache_dir(hass: HomeAssistant, entry_id: str) -> Path:
+    """Return directory used for a config entry's disk TTS cache."""
+    return Path(hass.config.path(".cache", DOMAIN, "tts", entry_id))
+
+
+class TtsAudioCache:
+    """Two tier cache of synthesized TTS audio.
+
+    Hot phrases are held in memory.  All cached phrases are also written to
+    disk so they survive restarts, and are read back with mmap on a memory
+    miss.  Both tiers are bounded by a byte budget with LRU eviction.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        cache_dir: Path,
+        memory_bytes: int = _TTS_MEMORY_CACHE_BYTES,
+        disk_bytes: int = _TTS_DISK_CACHE_BYTES,
+    ) -> None:
+        """Initialize cache."""
+        self.hass = hass
+        self.cache_dir = cache_dir
+        self.disk_bytes = disk_bytes
+
+        self._memory: LRUByteCache[bytes] = LRUByteCache(memory_bytes, len)
+        # Disk index of key -> file size, ordered least to most recently used
+        self._disk: OrderedDict[str, int] = OrderedDict()
+        self._disk_size_bytes = 0
+
+        self.disk_hits = 0
+        self.disk_evictions = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics."""
+        return {
+            "memory": self._memory.stats,
+            "disk": {
+                "entries": len(self._disk),
+                "size_bytes": self._disk_size_bytes,
+                "max_bytes": self.disk_bytes,
+                "hits": self.disk_hits,
+                "evictions": self.disk_evictions,
+            },
+            "misses": self.misses,
+        }
+
+    @staticmethod
+    def cache_key(
+        message: str, language: str, voice: str | None, speaker: str | None
+    ) -> str | None:
+        """Return cache key for a TTS request, or None if it should not be cached."""
+        if len(message) > _TTS_CACHE_MAX_TEXT:
+            return None
+        key_data = json.dumps([message, language, voice, speaker], ensure_ascii=False)
+        return hashlib.sha256(key_data.encode("utf-8")).hexdigest()
+
+    async def async_load(self) -> None:
+        """Build the disk index from files left by a previous run."""
+        entries = await self.hass.async_add_executor_job(self._scan_disk)
+        self._disk = OrderedDict(entries)
+        self._disk_size_bytes = sum(self._disk.values())
+        _LOGGER.debug(
+            "Loaded %s cached TTS phrase(s) from %s", len(self._disk), self.cache_dir
+        )
+
+    async def async_get(self, key: str) -> bytes | None:
+        """Return cached audio from memory or disk."""
+        if (data := self._memory.get(key)) is not None:
+            return data
+
+        if key not in self._disk:
+            self.misses += 1
+            return None
+
+        try:
+            data = await self.hass.async_add_executor_job(self._read_disk, key)
+        except OSError as ex:
+            _LOGGER.debug("Unable to read cached TTS audio %s: %s", key, ex)
+            self._disk_size_bytes -= self._disk.pop(key)
+            self.misses += 1
+            return None
+
+        self._disk.move_to_end(key)
+        self.disk_hits += 1
+        self._memory.put(key, data)
+        return data
+
+    async def async_put(self, key: str, data: bytes) -> None:
+        """Add audio to both cache tiers."""
+        if not data:
+            return
+
+        self._memory.put(key, data)
+        if key in self._disk or len(data) > self.disk_bytes:
+            return
+
+        evict: list[str] = []
+        self._disk[key] = len(data)
+        self._disk_size_bytes += len(data)
+        while self._disk_size_bytes > self.disk_bytes:
+            evicted_key, evicted_size = self._disk.popitem(last=False)
+            self._disk_size_bytes -= evicted_size
+            self.disk_evictions += 1
+            evict.append(evicted_key)
+
+        try:
+            await self.hass.async_add_executor_job(self._write_disk, key, data, evict)
+        except OSError as ex:
+            _LOGGER.debug("Unable to write cached TTS audio %s: %s", key, ex)
+            if self._disk.pop(key, None) is not None:
+                self._disk_size_bytes -= len(data)
+
+    def _path(self, key: str) -> Path:
+        """Return path of a cached file."""
+        return self.cache_dir / f"{key}{_TTS_CACHE_EXTENSION}"
+
+    def _scan_disk(self) -> list[tuple[str, int]]:
+        """Return cached files ordered by last use."""
+        if not self.cache_dir.is_dir():
+            return []
+
+        files = [
+            (path.stem, path.stat())
+            for path in self.cache_dir.glob(f"*{_TTS_CACHE_EXTENSION}")
+        ]
+        files.sort(key=lambda file: file[1].st_mtime)
+        return [(key, stat.st_size) for key, stat in files]
+
+    def _read_disk(self, key: str) -> bytes:
+        """Read a cached file using mmap and mark it as used."""
+        path = self._path(key)
+        with (
+            path.open("rb") as cache_file,
+            mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            data = mapped[:]
+        os.utime(path)
+        return data
+
+    def _write_disk(self, key: str, data: bytes, evict: list[str]) -> None:
+        """Write a cached file and remove evicted ones."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for evicted_key in evict:
+            self._path(evicted_key).unlink(missing_ok=True)
+
+        path = self._path(key)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+
+class DecodedAudioCache(LRUByteCache[tuple[bytes, ...]]):
+    """Cache of decoded, already framed PCM for announcement media.
+
+    Entries are keyed by media id without its URL signature, a validator
+    (file mtime/size or HTTP ETag/Last-Modified) and the output format, so
+    changed media is decoded again.  HTTP validators are kept for a short
+    time, so repeated announcements skip the HEAD request.  Media without
+    a validator is never cached.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, max_bytes: int = _DECODED_AUDIO_CACHE_BYTES
+    ) -> None:
+        """Initialize cache."""
+        super().__init__(max_bytes, _frames_size)
+        self.hass = hass
+        # Media key -> HTTP validator and when it expires
+        self._validators: dict[str, tuple[str | None, float]] = {}
+
+    async def async_cache_key(
+        self, media_id: str, rate: int, width: int, channels: int
+    ) -> str | None:
+        """Return cache key for media, or None if it cannot be validated."""
+        media_key = _unsigned_media_id(media_id)
+        if (validator := await self._async_get_validator(media_id, media_key)) is None:
+            return None
+        return f"{media_key}|{validator}|{rate}|{width}|{channels}"
+
+    async def _async_get_validator(self, media_id: str, media_key: str) -> str | None:
+        """Return a value that changes when the media changes."""
+        if media_id.startswith(("http://", "https://")):
+            now = time.monotonic()
+            if (cached := self._validators.get(media_key)) and cached[1] > now:
+                return cached[0]
+            validator = await self._async_get_http_validator(media_id)
+            self._validators = {
+                key: cached
+                for key, cached in self._validators.items()
+                if cached[1] > now
+            }
+            self._validators[media_key] = (validator, now + _MEDIA_VALIDATOR_TTL)
+            return validator
+
+        try:
+            stat = await self.hass.async_add_executor_job(
+                os.stat, media_id.removeprefix("file://")
+            )
+        except OSError:
+            return None
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+    async def _async_get_http_validator(self, url: str) -> str | None:
+        """Return the ETag or Last-Modified of HTTP media."""
+        session = async_get_clientsession(self.hass)
+        try:
+            async with (
+                asyncio.timeout(_MEDIA_VALIDATOR_TIMEOUT),
+                session.head(url, allow_redirects=True) as response,
+            ):
+                if response.status != 200:
+                    return None
+                return response.headers.get(aiohttp.hdrs.ETAG) or response.headers.get(
+                    aiohttp.hdrs.LAST_MODIFIED
+                )
+        except (aiohttp.ClientError, TimeoutError):
+            return None
+
+
+def _unsigned_media_id(media_id: str) -> str:
+    """Return media id without the signature of a signed URL."""
+    parts = urlsplit(media_id)
+    if _AUTH_SIGNATURE_PARAM not in parts.query:
+        return media_id
+    query = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if name != _AUTH_SIGNATURE_PARAM
+    ]
+    return parts._replace(query=urlencode(query)).geturl()
+
+
+def _frames_size(frames: tuple[bytes, ...]) -> int:
+    """Return total size of cached frames."""
+    return sum(len(frame) for frame in frames)
+
+
+@callback
+def async_get_decoded_audio_cache(hass: HomeAssistant) -> DecodedAudioCache:
+    """Return the shared decoded audio cache."""
+    if (cache := hass.data.get(DATA_DECODED_AUDIO_CACHE)) is None:
+        cache = hass.data[DATA_DECODED_AUDIO_CACHE] = DecodedAudioCache(hass)
+    return cache
@@ -1,11 +1,127 @@
 """Custom AsyncTCPClient for Wyoming events."""
 
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+import time
+from typing import Any, Final
+
 from wyoming.client import AsyncTcpClient
 from wyoming.event import Event
 
+from .audio import AUDIO_CHUNK_TYPE, EncodedFrame
+from .codec import DEFAULT_CODEC, JsonCodec, async_read_event, encode_event
+from .custom import STATUS_EVENT_TYPE, CustomEvent
+
+_CUSTOM_EVENT_QUEUE_SIZE: Final = 32
+# Queued audio events before writers wait, about 1.5 seconds of 1024 sample
+# chunks at 22050 Hz
+_AUDIO_WRITE_QUEUE_SIZE: Final = 32
+# Audio frames gathered into one socket write, and transport buffer size at
+# which the writer waits for the socket to drain
+_WRITE_BATCH_BYTES: Final = 32 * 1024
+_WRITE_HIGH_WATER: Final = 64 * 1024
+
+# Audio stream events are written in order on their own lane, all other
+# events are control events written ahead of queued audio, unless queued
+# after the end of a stream
+_AUDIO_STOP_TYPE: Final = "audio-stop"
+_AUDIO_EVENT_TYPES: Final = frozenset(("audio-start", "audio-chunk", _AUDIO_STOP_TYPE))
+
+# Event type, the encoded event, time queued and the future of a control write
+_QueuedWrite = tuple[str, EncodedFrame, float, "asyncio.Future[None] | None"]
+
+
+class CustomEventQueue:
+    """Bounded queue of received custom events, handled by a separate consumer.
+
+    Status events waiting in the queue are merged, so during a burst only the
+    latest value for each key is handled.  When the queue is full the oldest
+    event is dropped rather than blocking the socket read.
+    """
+
+    def __init__(self, maxsize: int = _CUSTOM_EVENT_QUEUE_SIZE) -> None:
+        """Initialize queue."""
+        self.maxsize = maxsize
+        self._events: deque[CustomEvent] = deque()
+        # Status event still waiting in the queue, merged into by later ones
+        self._pending_status: CustomEvent | None = None
+        self._wakeup = asyncio.Event()
+
+        self.stats: dict[str, int] = {
+            "depth": 0,
+            "max_depth": 0,
+            "received": 0,
+            "conflated": 0,
+            "dropped": 0,
+        }
+
+    def put(self, event: CustomEvent) -> None:
+        """Queue a custom event without waiting."""
+        stats = self.stats
+        stats["received"] += 1
+
+        if event.event_type == STATUS_EVENT_TYPE:
+            if not event.event_data:
+                return
+            if self._pending_status is not None:
+                _merge_status(self._pending_status.event_data, event.event_data)
+                stats["conflated"] += 1
+                return
+            # Copy so merging never modifies the received payload
+            event = CustomEvent(STATUS_EVENT_TYPE, dict(event.event_data))
+            self._pending_status = event
+
+        if len(self._events) >= self.maxsize:
+            if self._events.popleft() is self._pending_status:
+                self._pending_status = None
+            stats["dropped"] += 1
+
+        self._events.append(event)
+        stats["depth"] = len(self._events)
+        stats["max_depth"] = max(stats["max_depth"], stats["depth"])
+        self._wakeup.set()
+
+    async def get(self) -> CustomEvent:
+        """Wait for and return the next custom event."""
+        while not self._events:
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+        event = self._events.popleft()
+        if event is self._pending_status:
+            self._pending_status = None
+        self.stats["depth"] = len(self._events)
+        return event
+
+    def clear(self) -> None:
+        """Drop all queued events."""
+        self._events.clear()
+        self._pending_status = None
+        self.stats["depth"] = 0
+
+
+def _merge_status(pending: dict[str, Any], status: dict[str, Any]) -> None:
+    """Merge a newer status payload into a queued one."""
+    sensors = status.get("sensors")
+    if isinstance(sensors, dict) and isinstance(pending.get("sensors"), dict):
+        pending["sensors"] = {**pending["sensors"], **sensors}
+        status = {key: value for key, value in status.items() if key != "sensors"}
+    pending.update(status)
+
 
 class VAAsyncTcpClient(AsyncTcpClient):
-    """Custom TCP client for Wyoming events."""
+    """Custom TCP client for Wyoming events.
+
+    Events are written by a single writer task.  Control events jump ahead
+    of queued audio, so settings, actions and pings are not held up by a
+    long announcement.  Once an audio stop is queued, control events are
+    written in order after it, so a stream is received in full before the
+    events that follow it, such as the end of a pipeline.  Audio is queued up to a limit, after which writers
+    wait for the queue to drain.  With batch_writes, queued audio frames are
+    written together in one vectored write.
+    """
 
     def __init__(
         self,
@@ -14,29 +130,226 @@ class VAAsyncTcpClient(AsyncTcpClient):
         before_send_callback=None,
         after_send_callback=None,
         on_receive_callback=None,
+        custom_events: CustomEventQueue | None = None,
+        write_stats: dict[str, Any] | None = None,
+        batch_writes: bool = True,
+        codec: JsonCodec = DEFAULT_CODEC,
     ) -> None:
         """Initialize the custom TCP client."""
         super().__init__(host, port)
         self._before_send_callback = before_send_callback
         self._after_send_callback = after_send_callback
         self._on_receive_callback = on_receive_callback
+        self._custom_events = custom_events
+        self._batch_writes = batch_writes
+        self._codec = codec
+
+        self._control: deque[_QueuedWrite] = deque()
+        self._audio: deque[_QueuedWrite] = deque()
+        self._audio_space = asyncio.Event()
+        self._audio_space.set()
+        self._wakeup = asyncio.Event()
+        self._writer_task: asyncio.Task | None = None
+        self._write_error: Exception | None = None
+
+        self.write_stats = write_stats if write_stats is not None else {}
+        for key in (
+            "control_high_water",
+            "audio_high_water",
+            "max_control_latency_ms",
+            "max_audio_latency_ms",
+            "backpressure_waits",
+            "discarded_audio",
+            "batches",
+            "max_batch_frames",
+            "drains",
+        ):
+            self.write_stats.setdefault(key, 0)
+
+    async def connect(self) -> None:
+        """Connect and start the writer task."""
+        await super().connect()
+        assert self._writer is not None
+        self._writer.transport.set_write_buffer_limits(high=_WRITE_HIGH_WATER)
+        self._write_error = None
+        self._writer_task = asyncio.create_task(self._async_write_loop())
+
+    async def disconnect(self) -> None:
+        """Stop the writer task and disconnect."""
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            self._writer_task = None
+        self._fail_pending(ConnectionResetError("Client disconnected"))
+        await super().disconnect()
 
     async def write_event(self, event: Event) -> None:
         """Write an event to the server."""
         if self._before_send_callback:
             await self._before_send_callback(event)
         if self.can_write_event():
-            await super().write_event(event)
+            frame = encode_event(event, self._codec)
+            if event.type in _AUDIO_EVENT_TYPES:
+                await self._async_queue_audio(event.type, frame)
+            else:
+                await self._async_queue_control(event.type, frame)
         if self._after_send_callback:
             await self._after_send_callback(event)
 
+    async def write_audio_frame(self, frame: EncodedFrame) -> None:
+        """Write an audio chunk encoded by an AudioFrameEncoder.
+
+        Send callbacks are not called for audio frames.
+        """
+        if self.can_write_event():
+            await self._async_queue_audio(AUDIO_CHUNK_TYPE, frame)
+
+    def discard_audio(self) -> None:
+        """Drop audio chunks not yet written, keeping stream start and stop."""
+        kept = [queued for queued in self._audio if queued[0] != AUDIO_CHUNK_TYPE]
+        self.write_stats["discarded_audio"] += len(self._audio) - len(kept)
+        self._audio = deque(kept)
+        self._audio_space.set()
+
+    async def _async_queue_control(self, event_type: str, frame: EncodedFrame) -> None:
+        """Queue a control event and wait until it is written."""
+        self._raise_write_error()
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        queued: _QueuedWrite = (event_type, frame, time.monotonic(), future)
+        if any(
+            queued_type == _AUDIO_STOP_TYPE or queued_future is not None
+            for queued_type, _, _, queued_future in self._audio
+        ):
+            self._audio.append(queued)
+        else:
+            self._control.append(queued)
+        self.write_stats["control_high_water"] = max(
+            self.write_stats["control_high_water"], len(self._control)
+        )
+        self._wakeup.set()
+        await future
+
+    async def _async_queue_audio(self, event_type: str, frame: EncodedFrame) -> None:
+        """Queue an audio event, waiting while the audio queue is full."""
+        while len(self._audio) >= _AUDIO_WRITE_QUEUE_SIZE:
+            self.write_stats["backpressure_waits"] += 1
+            self._audio_space.clear()
+            await self._audio_space.wait()
+            self._raise_write_error()
+
+        self._raise_write_error()
+        self._audio.append((event_type, frame, time.monotonic(), None))
+        self.write_stats["audio_high_water"] = max(
+            self.write_stats["audio_high_water"], len(self._audio)
+        )
+        self._wakeup.set()
+
+    async def _async_write_loop(self) -> None:
+        """Write queued events, control events first."""
+        try:
+            while True:
+                if self._control:
+                    await self._async_write_control(self._control.popleft())
+                elif self._audio and self._audio[0][3] is not None:
+                    # Control event queued after the end of an audio stream
+                    self._audio_space.set()
+                    await self._async_write_control(self._audio.popleft())
+                elif self._audio:
+                    await self._async_write_audio()
+                else:
+                    self._wakeup.clear()
+                    await self._wakeup.wait()
+        except Exception as err:  # noqa: BLE001
+            self._fail_pending(err)
+
+    async def _async_write_control(self, write: _QueuedWrite) -> None:
+        """Write a control event and drain, so it is sent at once."""
+        _, frame, queued, future = write
+        assert future is not None
+        self._record_latency("control_latency_ms", queued)
+        try:
+            # Events queued before the connection closed are dropped
+            if self.can_write_event():
+                assert self._writer is not None
+                self._writer.writelines(frame)
+                await self._writer.drain()
+        except BaseException as err:
+            if not future.done():
+                future.set_exception(err)
+            raise
+        if not future.done():
+            future.set_result(None)
+
+    async def _async_write_audio(self) -> None:
+        """Write queued audio, gathering frames into one write when batching.
+
+        The socket is only drained once the transport buffer reaches the
+        high-water mark, rather than after every frame.
+        """
+        buffers: list[bytes | memoryview] = []
+        batch_bytes = 0
+        frames = 0
+        while self._audio and self._audio[0][3] is None:
+            _, frame, queued, _ = self._audio.popleft()
+            self._audio_space.set()
+            self._record_latency("audio_latency_ms", queued)
+            buffers.extend(frame)
+            batch_bytes += sum(len(buffer) for buffer in frame)
+            frames += 1
+            if not self._batch_writes or batch_bytes >= _WRITE_BATCH_BYTES:
+                break
+
+        if not self.can_write_event():
+            return
+
+        assert self._writer is not None
+        self._writer.writelines(buffers)
+        stats = self.write_stats
+        stats["batches"] += 1
+        stats["max_batch_frames"] = max(stats["max_batch_frames"], frames)
+        if (
+            not self._batch_writes
+            or self._writer.transport.get_write_buffer_size() >= _WRITE_HIGH_WATER
+        ):
+            stats["drains"] += 1
+            await self._writer.drain()
+
+    def _record_latency(self, key: str, queued: float) -> None:
+        """Record how long a write waited in its queue."""
+        latency_ms = round((time.monotonic() - queued) * 1000, 1)
+        self.write_stats[f"last_{key}"] = latency_ms
+        self.write_stats[f"max_{key}"] = max(self.write_stats[f"max_{key}"], latency_ms)
+
+    def _fail_pending(self, err: Exception) -> None:
+        """Fail queued writes and wake waiting writers after a write error."""
+        self._write_error = err
+        for _, _, _, future in (*self._control, *self._audio):
+            if future is not None and not future.done():
+                future.set_exception(err)
+        self._control.clear()
+        self._audio.clear()
+        self._audio_space.set()
+
+    def _raise_write_error(self) -> None:
+        """Raise the error that stopped the writer task, if any."""
+        if self._write_error is not None:
+            raise self._write_error
+
     async def read_event(self) -> Event | None:
         """Read an event from the server."""
         modified_event = None
         forward_event = False
         while not forward_event:
             try:
-                event = await super().read_event()
+                assert self._reader is not None
+                event = await async_read_event(self._reader, self._codec)
+                if (
+                    event is not None
+                    and self._custom_events is not None
+                    and CustomEvent.is_type(event.type)
+                ):
+                    # Handled by the queue consumer, off the audio read path
+                    self._custom_events.put(CustomEvent.from_event(event))
+                    continue
                 if self._on_receive_callback:
                     forward_event, modified_event = self._on_receive_callback(event)
             except ConnectionResetError:
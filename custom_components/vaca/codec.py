@@ -0,0 +1,95 @@
+"""JSON codecs for reading and writing Wyoming events."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+import json
+from typing import Any, Final
+
+from wyoming import __version__ as WYOMING_VERSION
+from wyoming.event import Event
+
+from .audio import EncodedFrame
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_NEWLINE: Final = b"\n"
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    """Encode as wyoming does, with the default json separators."""
+    return json.dumps(obj, ensure_ascii=False).encode()
+
+
+def _orjson_loads(data: bytes) -> Any:
+    """Decode with orjson, falling back to json for input orjson rejects."""
+    try:
+        return orjson.loads(data)
+    except orjson.JSONDecodeError:
+        # NaN, Infinity and integers over 64 bits are accepted by json
+        return json.loads(data)
+
+
+@dataclass(frozen=True, slots=True)
+class JsonCodec:
+    """Functions used to decode and encode event JSON.
+
+    Output must match what wyoming writes byte for byte, and orjson has no
+    option for json's default separators, so all codecs encode with json.
+    """
+
+    name: str
+    loads: Callable[[bytes], Any]
+    dumps: Callable[[Any], bytes] = _stdlib_dumps
+
+
+STDLIB_CODEC: Final = JsonCodec("json", json.loads)
+ORJSON_CODEC: Final = JsonCodec("orjson", _orjson_loads) if orjson else None
+DEFAULT_CODEC: Final = ORJSON_CODEC or STDLIB_CODEC
+
+
+def encode_event(event: Event, codec: JsonCodec = DEFAULT_CODEC) -> EncodedFrame:
+    """Return the buffers wyoming writes for an event."""
+    header: dict[str, Any] = {"type": event.type, "version": WYOMING_VERSION}
+    data = codec.dumps(event.data) if event.data else None
+    if data:
+        header["data_length"] = len(data)
+    if event.payload:
+        header["payload_length"] = len(event.payload)
+
+    frame = [codec.dumps(header) + _NEWLINE]
+    if data:
+        frame.append(data)
+    if event.payload:
+        frame.append(event.payload)
+    return tuple(frame)
+
+
+async def async_read_event(
+    reader: asyncio.StreamReader, codec: JsonCodec = DEFAULT_CODEC
+) -> Event | None:
+    """Read an event as wyoming does, decoding JSON with a codec."""
+    try:
+        if not (header_line := await reader.readline()):
+            return None
+
+        header = codec.loads(header_line)
+        data = header.get("data")
+        if data_length := header.get("data_length"):
+            data_bytes = await reader.readexactly(data_length)
+            decoded = codec.loads(data_bytes)
+            data = {**data, **decoded} if data else decoded
+
+        payload: bytes | None = None
+        if payload_length := header.get("payload_length"):
+            payload = await reader.readexactly(payload_length)
+
+        return Event(type=header["type"], data=data, payload=payload)
+    except ValueError:
+        # Includes decode errors from json and orjson
+        return None
@@ -2,6 +2,8 @@
 
 from dataclasses import dataclass
 from enum import StrEnum
+import hashlib
+import json
 import logging
 from typing import Any
 
@@ -24,6 +26,14 @@ CAPABILITIES_EVENT_TYPE = "capabilities"
 SETTINGS_EVENT_TYPE = "settings"
 STATUS_EVENT_TYPE = "status"
 
+# Settings versioning.  Each distinct settings payload published by HA gets a
+# new version.  Satellites report the version and hash they hold, so only
+# changed keys (a delta against the base version) need to be sent.
+SETTINGS_VERSION_KEY = "settings_version"
+SETTINGS_HASH_KEY = "settings_hash"
+SETTINGS_DELTA_KEY = "settings_delta"
+SETTINGS_BASE_VERSION_KEY = "settings_base_version"
+
 
 class CustomActions(StrEnum):
     """Actions for media control."""
@@ -102,6 +112,12 @@ async def getIntegrationVersion(hass: HomeAssistant) -> str | AwesomeVersion | N
     return integration.version if integration else "0.0.0"
 
 
+def getSettingsHash(settings: dict[str, Any]) -> str:
+    """Get a stable hash of a settings dict."""
+    settings_json = json.dumps(settings, sort_keys=True, default=str)
+    return hashlib.sha256(settings_json.encode("utf-8")).hexdigest()[:16]
+
+
 def getVADashboardPath(hass: HomeAssistant, uuid: str) -> str:
     """Get the dashboard path."""
     # Look for VA and a config entry that uses this uuid for display.  Then get the dashboard path
@@ -0,0 +1,385 @@
+"""Supervised ffmpeg decoders for announcement media."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncGenerator
+from contextlib import suppress
+import logging
+import time
+from typing import Any, Final
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from homeassistant.components import ffmpeg
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .audio import WavFrameConverter
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_DECODER_POOLS: Final = f"{DOMAIN}_decoder_pools"
+
+_POOL_SIZE: Final = 1
+_INPUT_CHUNK_BYTES: Final = 64 * 1024
+_KILL_TIMEOUT: Final = 2
+
+
+class DecodeError(Exception):
+    """Media could not be decoded."""
+
+
+class FfmpegDecoder:
+    """An ffmpeg process decoding one input to raw PCM.
+
+    stderr is always drained to the debug log, so a chatty input cannot
+    fill the pipe and stall decoding, and the process is killed if the
+    consumer stops early or is cancelled.
+    """
+
+    def __init__(self, proc: asyncio.subprocess.Process) -> None:
+        """Initialize decoder."""
+        self.proc = proc
+        self.spawned = time.monotonic()
+        assert proc.stderr is not None
+        self._stderr_task = asyncio.create_task(self._async_drain_stderr(proc.stderr))
+
+    @property
+    def running(self) -> bool:
+        """Return True if the process has not exited."""
+        return self.proc.returncode is None
+
+    async def async_frames(self, frame_bytes: int) -> AsyncGenerator[bytes]:
+        """Yield decoded frames until ffmpeg closes its output."""
+        assert self.proc.stdout is not None
+        try:
+            while True:
+                try:
+                    frame = await self.proc.stdout.readexactly(frame_bytes)
+                except asyncio.IncompleteReadError as err:
+                    frame = err.partial
+                if not frame:
+                    break
+
+                yield frame
+
+                if len(frame) < frame_bytes:
+                    break
+
+            await self.proc.wait()
+        finally:
+            await self.async_kill()
+
+    async def async_kill(self) -> None:
+        """Kill the process if still running and reap it."""
+        if self.proc.returncode is None:
+            with suppress(ProcessLookupError):
+                self.proc.kill()
+            try:
+                async with asyncio.timeout(_KILL_TIMEOUT):
+                    await self.proc.wait()
+            except TimeoutError:
+                _LOGGER.warning("ffmpeg process %s did not exit", self.proc.pid)
+        await self._stderr_task
+
+    async def _async_drain_stderr(self, stderr: asyncio.StreamReader) -> None:
+        """Log ffmpeg output until the process closes stderr."""
+        while line := await stderr.readline():
+            _LOGGER.debug(
+                "ffmpeg[%s]: %s",
+                self.proc.pid,
+                line.decode(errors="replace").rstrip(),
+            )
+
+
+class DecoderPool:
+    """Pool of pre-spawned ffmpeg decoders for one output format.
+
+    16-bit PCM WAV media already in the output format is framed in
+    process as it is read.  For other media, idle decoders are started ahead of time
+    reading from stdin, so the process start-up is not paid when an
+    announcement is made.  Input is
+    fed from HTTP or a local file; media ffmpeg cannot decode from a pipe
+    (other protocols, or files that need seeking) is decoded by a new
+    process reading the media directly.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        rate: int,
+        width: int,
+        channels: int,
+        pool_size: int = _POOL_SIZE,
+    ) -> None:
+        """Initialize the pool."""
+        self.hass = hass
+        self.rate = rate
+        self.width = width
+        self.channels = channels
+        self.pool_size = pool_size
+
+        self._idle: deque[FfmpegDecoder] = deque()
+        self._spawning = 0
+        self._closed = False
+
+        self.jobs = 0
+        self.fast_path_jobs = 0
+        self.prespawned_jobs = 0
+        self.fallbacks = 0
+        self.failures = 0
+        self.last_decode_ms: int | None = None
+        self.total_decode_ms = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return pool statistics."""
+        return {
+            "idle": len(self._idle),
+            "jobs": self.jobs,
+            "fast_path_jobs": self.fast_path_jobs,
+            "prespawned_jobs": self.prespawned_jobs,
+            "fallbacks": self.fallbacks,
+            "failures": self.failures,
+            "last_decode_ms": self.last_decode_ms,
+            "total_decode_ms": self.total_decode_ms,
+        }
+
+    async def async_decode(
+        self, media_id: str, frame_bytes: int
+    ) -> AsyncGenerator[bytes]:
+        """Yield PCM frames of decoded media.
+
+        Raises DecodeError, after any frames decoded, if ffmpeg fails.
+        Decode time is only counted while waiting for frames, not while
+        the consumer holds the generator, such as when playback is paced.
+        """
+        self.jobs += 1
+        decode_seconds = 0.0
+        frames = self._async_decode(media_id, frame_bytes)
+        try:
+            while True:
+                start = time.monotonic()
+                try:
+                    frame = await anext(frames)
+                except StopAsyncIteration:
+                    break
+                finally:
+                    decode_seconds += time.monotonic() - start
+                yield frame
+        finally:
+            await frames.aclose()
+            decode_ms = round(decode_seconds * 1000)
+            self.last_decode_ms = decode_ms
+            self.total_decode_ms += decode_ms
+            _LOGGER.debug("Decoded %s in %s ms", media_id, decode_ms)
+
+    async def _async_decode(
+        self, media_id: str, frame_bytes: int
+    ) -> AsyncGenerator[bytes]:
+        """Yield PCM frames from the fast path, a pre-spawned or new decoder."""
+        decoded = False
+        if self.width == 2 and urlsplit(media_id).path.lower().endswith(".wav"):
+            try:
+                async for frame in self._async_convert_wav(media_id, frame_bytes):
+                    decoded = True
+                    yield frame
+            except (ValueError, aiohttp.ClientError, OSError) as err:
+                if decoded:
+                    self.failures += 1
+                    raise DecodeError(f"Unable to read {media_id}: {err}") from err
+                _LOGGER.debug("Decoding %s with ffmpeg: %s", media_id, err)
+            else:
+                self.fast_path_jobs += 1
+                return
+
+        if media_id.startswith(("http://", "https://", "file://", "/")) and (
+            decoder := self._async_take_idle()
+        ):
+            self.prespawned_jobs += 1
+            feed_task = self.hass.async_create_background_task(
+                self._async_feed(decoder, media_id), f"feed ffmpeg {media_id}"
+            )
+            try:
+                async for frame in decoder.async_frames(frame_bytes):
+                    decoded = True
+                    yield frame
+            finally:
+                feed_task.cancel()
+
+            if decoder.proc.returncode == 0:
+                return
+            if decoded:
+                # Failed partway, so the frames yielded are incomplete
+                self.failures += 1
+                raise DecodeError(
+                    f"ffmpeg exited with {decoder.proc.returncode} decoding {media_id}"
+                )
+            # ffmpeg could not decode the media from a pipe
+            self.fallbacks += 1
+
+        decoder = await self._async_spawn(media_id)
+        async for frame in decoder.async_frames(frame_bytes):
+            decoded = True
+            yield frame
+
+        if decoder.proc.returncode != 0:
+            self.failures += 1
+            raise DecodeError(
+                f"ffmpeg exited with {decoder.proc.returncode} decoding {media_id}"
+            )
+
+    @callback
+    def async_prewarm(self) -> None:
+        """Start decoders until the pool is full."""
+        while not self._closed and len(self._idle) + self._spawning < self.pool_size:
+            self._spawning += 1
+            self.hass.async_create_background_task(
+                self._async_spawn_idle(), "spawn ffmpeg decoder"
+            )
+
+    async def async_close(self) -> None:
+        """Stop all idle decoders."""
+        self._closed = True
+        while self._idle:
+            decoder = self._idle.popleft()
+            assert decoder.proc.stdin is not None
+            decoder.proc.stdin.close()
+            await decoder.async_kill()
+
+    @callback
+    def _async_take_idle(self) -> FfmpegDecoder | None:
+        """Return a running idle decoder and start its replacement."""
+        decoder: FfmpegDecoder | None = None
+        while self._idle:
+            if (candidate := self._idle.popleft()).running:
+                decoder = candidate
+                break
+            self.hass.async_create_background_task(
+                candidate.async_kill(), "reap ffmpeg decoder"
+            )
+        self.async_prewarm()
+        return decoder
+
+    async def _async_spawn_idle(self) -> None:
+        """Start a decoder reading from stdin and add it to the pool."""
+        try:
+            decoder = await self._async_spawn("pipe:0")
+        except OSError as err:
+            _LOGGER.warning("Unable to start ffmpeg: %s", err)
+            return
+        finally:
+            self._spawning -= 1
+
+        if self._closed:
+            await decoder.async_kill()
+            return
+        self._idle.append(decoder)
+
+    async def _async_spawn(self, media_input: str) -> FfmpegDecoder:
+        """Start ffmpeg decoding an input to raw PCM."""
+        proc = await asyncio.create_subprocess_exec(
+            ffmpeg.get_ffmpeg_manager(self.hass).binary,
+            "-i",
+            media_input,
+            "-f",
+            f"s{self.width * 8}le",
+            "-ac",
+            str(self.channels),
+            "-ar",
+            str(self.rate),
+            "-nostats",
+            "pipe:",
+            stdin=asyncio.subprocess.PIPE
+            if media_input == "pipe:0"
+            else asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            close_fds=False,  # use posix_spawn in CPython < 3.13
+        )
+        return FfmpegDecoder(proc)
+
+    async def _async_convert_wav(
+        self, media_id: str, frame_bytes: int
+    ) -> AsyncGenerator[bytes]:
+        """Yield frames of WAV media converted without ffmpeg.
+
+        Raises ValueError, before any frame, for media that ffmpeg must
+        decode, having read no more than the first chunk.
+        """
+        converter = WavFrameConverter(self.rate, self.channels, frame_bytes)
+        if media_id.startswith(("http://", "https://")):
+            session = async_get_clientsession(self.hass)
+            async with session.get(media_id) as response:
+                response.raise_for_status()
+                async for data in response.content.iter_chunked(_INPUT_CHUNK_BYTES):
+                    for frame in converter.feed(data):
+                        yield frame
+        else:
+            media_file = await self.hass.async_add_executor_job(
+                open, media_id.removeprefix("file://"), "rb"
+            )
+            try:
+                while data := await self.hass.async_add_executor_job(
+                    media_file.read, _INPUT_CHUNK_BYTES
+                ):
+                    for frame in converter.feed(data):
+                        yield frame
+            finally:
+                await self.hass.async_add_executor_job(media_file.close)
+
+        for frame in converter.flush():
+            yield frame
+
+    async def _async_feed(self, decoder: FfmpegDecoder, media_id: str) -> None:
+        """Write media to a decoder's stdin."""
+        stdin = decoder.proc.stdin
+        assert stdin is not None
+        try:
+            if media_id.startswith(("http://", "https://")):
+                session = async_get_clientsession(self.hass)
+                async with session.get(media_id) as response:
+                    response.raise_for_status()
+                    async for data in response.content.iter_chunked(_INPUT_CHUNK_BYTES):
+                        stdin.write(data)
+                        await stdin.drain()
+            else:
+                media_file = await self.hass.async_add_executor_job(
+                    open, media_id.removeprefix("file://"), "rb"
+                )
+                try:
+                    while data := await self.hass.async_add_executor_job(
+                        media_file.read, _INPUT_CHUNK_BYTES
+                    ):
+                        stdin.write(data)
+                        await stdin.drain()
+                finally:
+                    await self.hass.async_add_executor_job(media_file.close)
+        except (aiohttp.ClientError, OSError) as err:
+            _LOGGER.debug("Unable to read %s: %s", media_id, err)
+        finally:
+            stdin.close()
+
+
+@callback
+def async_get_decoder_pool(
+    hass: HomeAssistant, rate: int, width: int, channels: int
+) -> DecoderPool:
+    """Return the decoder pool for an output format."""
+    pools: dict[tuple[int, int, int], DecoderPool] = hass.data.setdefault(
+        DATA_DECODER_POOLS, {}
+    )
+    key = (rate, width, channels)
+    if (pool := pools.get(key)) is None:
+        pool = pools[key] = DecoderPool(hass, rate, width, channels)
+    return pool
+
+
+async def async_close_decoder_pools(hass: HomeAssistant) -> None:
+    """Stop all idle decoders."""
+    for pool in hass.data.pop(DATA_DECODER_POOLS, {}).values():
+        await pool.async_close()
@@ -3,16 +3,85 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+import logging
 from typing import Any
 
 from wyoming.info import Info
 
 from homeassistant.components.wyoming import SatelliteDevice
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import entity_registry as er
 
 from .const import DOMAIN
+from .storage import VASatelliteStore
+
+_LOGGER = logging.getLogger(__name__)
+
+StatusListener = Callable[[dict[str, Any]], None]
+
+
+class StatusRouter:
+    """Route status events to the entities registered for the keys present.
+
+    Entities register for a sensor key (under "sensors") or a top level key
+    of the status payload.  Each payload is routed by walking its keys, so
+    the cost scales with the keys received rather than the number of
+    entities listening.
+    """
+
+    def __init__(self) -> None:
+        """Initialize router."""
+        self._sensor_listeners: dict[str, list[StatusListener]] = {}
+        self._listeners: dict[str, list[StatusListener]] = {}
+
+    @callback
+    def async_register_sensor(
+        self, key: str, listener: StatusListener
+    ) -> CALLBACK_TYPE:
+        """Call listener with the status payload when it contains a sensor key."""
+        return self._async_register(self._sensor_listeners, key, listener)
+
+    @callback
+    def async_register(self, key: str, listener: StatusListener) -> CALLBACK_TYPE:
+        """Call listener with the status payload when it contains a key."""
+        return self._async_register(self._listeners, key, listener)
+
+    @callback
+    def async_route(self, status: dict[str, Any]) -> None:
+        """Call the listeners for the keys in a status payload."""
+        listeners: dict[StatusListener, None] = {}
+        if sensors := status.get("sensors"):
+            for key in sensors:
+                if key_listeners := self._sensor_listeners.get(key):
+                    listeners.update(dict.fromkeys(key_listeners))
+        for key in status:
+            if key_listeners := self._listeners.get(key):
+                listeners.update(dict.fromkeys(key_listeners))
+
+        for listener in listeners:
+            try:
+                listener(status)
+            except Exception:
+                _LOGGER.exception("Error handling status update in %s", listener)
+
+    @callback
+    def _async_register(
+        self,
+        index: dict[str, list[StatusListener]],
+        key: str,
+        listener: StatusListener,
+    ) -> CALLBACK_TYPE:
+        """Add listener to an index and return a function to remove it."""
+        index.setdefault(key, []).append(listener)
+
+        @callback
+        def _async_unregister() -> None:
+            index[key].remove(listener)
+            if not index[key]:
+                del index[key]
+
+        return _async_unregister
 
 
 @dataclass
@@ -22,13 +91,36 @@ class VASatelliteDevice(SatelliteDevice):
     info: Info | None = None
     custom_settings: dict[str, Any] | None = None
     capabilities: dict[str, Any] | None = None
+    settings_version: int = 0
+    settings_hash: str | None = None
+    store: VASatelliteStore | None = None
+    metrics: dict[str, Any] = field(default_factory=dict)
+    replace_announcements: bool = False
+    audio_lead_ms: int = 0
+    status_router: StatusRouter = field(default_factory=StatusRouter)
+    _signals: dict[str, str] = field(default_factory=dict, repr=False)
+    _sensor_reporting: dict[str, list[dict[str, float]]] = field(
+        default_factory=dict, repr=False
+    )
+    _status_reporting: dict[str, list[dict[str, float]]] = field(
+        default_factory=dict, repr=False
+    )
 
     _custom_settings_listener: Callable[[], None] | None = None
     _custom_action_listener: Callable[[Any, Any], None] | None = None
     _info_listener: Callable[[], None] | None = None
+    _audio_lead_listener: Callable[[], None] | None = None
     stt_listener: Callable[[str], None] | None = None
     tts_listener: Callable[[str], None] | None = None
 
+    def signal(self, event_type: str) -> str:
+        """Return the dispatcher signal for a custom event type."""
+        if (signal := self._signals.get(event_type)) is None:
+            signal = self._signals[event_type] = (
+                f"{DOMAIN}_{self.device_id}_{event_type}_update"
+            )
+        return signal
+
     def get_pipeline_entity_id(self, hass: HomeAssistant) -> str | None:
         """Return entity id for pipeline select."""
         ent_reg = er.async_get(hass)
@@ -51,7 +143,9 @@ class VASatelliteDevice(SatelliteDevice):
         )
 
     @callback
-    def set_custom_setting(self, setting: str, value: str | float) -> None:
+    def set_custom_setting(
+        self, setting: str, value: str | float | dict[str, Any]
+    ) -> None:
         """Set custom setting."""
         if self.custom_settings is None:
             self.custom_settings = {}
@@ -66,6 +160,69 @@ class VASatelliteDevice(SatelliteDevice):
         if self._custom_settings_listener is not None:
             self._custom_settings_listener()
 
+    @callback
+    def async_register_sensor_reporting(
+        self, key: str, reporting: dict[str, float]
+    ) -> CALLBACK_TYPE:
+        """Ask the satellite to report a sensor key, with its reporting policy.
+
+        The policy of all registered sensor keys is sent in the
+        sensor_reporting setting, so the satellite only reports what is used.
+        """
+        return self._async_register_reporting(
+            "sensor_reporting", self._sensor_reporting, key, reporting
+        )
+
+    @callback
+    def async_register_status_reporting(
+        self, key: str, reporting: dict[str, float]
+    ) -> CALLBACK_TYPE:
+        """Ask the satellite to report a top level status key, with its policy.
+
+        Policies of top level keys are sent in the status_reporting setting.
+        """
+        return self._async_register_reporting(
+            "status_reporting", self._status_reporting, key, reporting
+        )
+
+    @callback
+    def _async_register_reporting(
+        self,
+        setting: str,
+        index: dict[str, list[dict[str, float]]],
+        key: str,
+        reporting: dict[str, float],
+    ) -> CALLBACK_TYPE:
+        """Add a reporting policy to an index and return a function to remove it."""
+        index.setdefault(key, []).append(reporting)
+        self._async_update_reporting(setting, index)
+
+        @callback
+        def _async_unregister() -> None:
+            index[key].remove(reporting)
+            if not index[key]:
+                del index[key]
+            self._async_update_reporting(setting, index)
+
+        return _async_unregister
+
+    @callback
+    def _async_update_reporting(
+        self, setting: str, index: dict[str, list[dict[str, float]]]
+    ) -> None:
+        """Update a reporting setting from registered policies."""
+        # Where several entities use a key, the most demanding policy wins
+        self.set_custom_setting(
+            setting,
+            {
+                key: {
+                    name: min(policy[name] for policy in policies)
+                    for name in policies[0]
+                }
+                for key, policies in sorted(index.items())
+            },
+        )
+
     @callback
     def send_custom_action(
         self, command: str, payload: dict[str, Any] | None = None
@@ -93,6 +250,20 @@ class VASatelliteDevice(SatelliteDevice):
         """Listen for info updates."""
         self._info_listener = info_listener
 
+    @callback
+    def set_audio_lead(self, audio_lead_ms: int) -> None:
+        """Set how far audio is sent ahead of playback, 0 to send unpaced."""
+        if audio_lead_ms == self.audio_lead_ms:
+            return
+        self.audio_lead_ms = audio_lead_ms
+        if self._audio_lead_listener is not None:
+            self._audio_lead_listener()
+
+    @callback
+    def set_audio_lead_listener(self, audio_lead_listener: Callable[[], None]) -> None:
+        """Listen for audio lead updates."""
+        self._audio_lead_listener = audio_lead_listener
+
     @callback
     def set_stt_listener(self, stt_listener: Callable[[str], None]) -> None:
         """Listen for stt updates."""
@@ -0,0 +1,47 @@
+"""Diagnostics support for View Assist Companion App."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .cache import DATA_TTS_CACHES, async_get_decoded_audio_cache
+from .const import DOMAIN
+from .decoder import DATA_DECODER_POOLS
+from .pool import DATA_CONNECTION_POOLS
+
+if TYPE_CHECKING:
+    from homeassistant.components.wyoming import DomainDataItem
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    item: DomainDataItem = hass.data[DOMAIN][entry.entry_id]
+
+    data: dict[str, Any] = {"info": item.service.info.to_dict()}
+
+    if connection_pool := hass.data.get(DATA_CONNECTION_POOLS, {}).get(
+        (item.service.host, item.service.port)
+    ):
+        data["connection_pool"] = connection_pool.stats
+
+    data["decoded_audio_cache"] = async_get_decoded_audio_cache(hass).stats
+    data["decoder_pools"] = {
+        f"{rate}/{width}/{channels}": pool.stats
+        for (rate, width, channels), pool in hass.data.get(
+            DATA_DECODER_POOLS, {}
+        ).items()
+    }
+
+    if tts_cache := hass.data.get(DATA_TTS_CACHES, {}).get(entry.entry_id):
+        data["tts_cache"] = tts_cache.stats
+
+    if (device := item.device) is not None:
+        data["capabilities"] = device.capabilities
+        data["metrics"] = device.metrics
+
+    return data
@@ -2,18 +2,137 @@
 
 from __future__ import annotations
 
-from homeassistant.helpers import entity
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity, entity_registry as er
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
 from .const import DOMAIN
+from .custom import CAPABILITIES_EVENT_TYPE
 from .devices import VASatelliteDevice
 
 
+@dataclass(frozen=True, slots=True)
+class StatusReporting:
+    """When a changed status value is worth writing to the state machine.
+
+    A numeric value is written once it moves from the last written value by
+    more than the larger of the absolute and relative deadband.  Writes are
+    at most one per min_interval seconds; the latest value held back by the
+    interval is written when it ends.  Unchanged values are never written.
+    """
+
+    absolute_deadband: float = 0
+    relative_deadband: float = 0
+    min_interval: float = 0
+
+
+class StateWriteFilter:
+    """Suppress state writes for status values that have not really changed."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        reporting: StatusReporting,
+        write: Callable[[Any], None],
+    ) -> None:
+        """Initialize filter."""
+        self.hass = hass
+        self.reporting = reporting
+        self._write = write
+        self._last_value: Any = None
+        self._last_write = 0.0
+        self._pending_unsub: CALLBACK_TYPE | None = None
+        self._pending_value: Any = None
+
+        self.stats: dict[str, int] = {
+            "written": 0,
+            "suppressed_unchanged": 0,
+            "suppressed_deadband": 0,
+            "deferred": 0,
+        }
+
+    @callback
+    def async_update(self, value: Any) -> None:
+        """Write value now, after the minimum interval or not at all."""
+        if self._last_write and self._within_deadband(value):
+            # Back within the deadband, so a held back value is stale
+            self.async_cancel()
+            self.stats[
+                "suppressed_unchanged"
+                if value == self._last_value
+                else "suppressed_deadband"
+            ] += 1
+            return
+
+        delay = self._last_write + self.reporting.min_interval - time.monotonic()
+        if delay <= 0:
+            self.async_cancel()
+            self._async_write(value)
+            return
+
+        self.stats["deferred"] += 1
+        self._pending_value = value
+        if self._pending_unsub is None:
+            self._pending_unsub = async_call_later(
+                self.hass, delay, self._async_write_pending
+            )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop any value held back by the minimum interval."""
+        if self._pending_unsub is not None:
+            self._pending_unsub()
+            self._pending_unsub = None
+
+    def _within_deadband(self, value: Any) -> bool:
+        """Return True if value is not a change worth writing."""
+        last = self._last_value
+        if value == last:
+            return True
+        if not _is_number(value) or not _is_number(last):
+            return False
+        deadband = max(
+            self.reporting.absolute_deadband,
+            self.reporting.relative_deadband * abs(last),
+        )
+        return abs(value - last) <= deadband if deadband else False
+
+    @callback
+    def _async_write_pending(self, _now: Any) -> None:
+        """Write the value held back by the minimum interval."""
+        self._pending_unsub = None
+        self._async_write(self._pending_value)
+
+    @callback
+    def _async_write(self, value: Any) -> None:
+        """Write value to the state machine."""
+        self._last_value = value
+        self._last_write = time.monotonic()
+        self.stats["written"] += 1
+        self._write(value)
+
+
+def _is_number(value: Any) -> bool:
+    """Return True for int and float values, but not bool."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
 class VASatelliteEntity(entity.Entity):
     """Wyoming satellite entity."""
 
     _attr_has_entity_name = True
     _attr_should_poll = False
+    _status_reporting = StatusReporting()
 
     def __init__(self, device: VASatelliteDevice) -> None:
         """Initialize entity."""
@@ -23,3 +142,94 @@ class VASatelliteEntity(entity.Entity):
             identifiers={(DOMAIN, device.satellite_id)},
             entry_type=DeviceEntryType.SERVICE,
         )
+
+    @callback
+    def async_create_write_filter(
+        self, write: Callable[[Any], None]
+    ) -> StateWriteFilter:
+        """Return a write filter for the entity's status sensor value.
+
+        While the entity is in use the satellite is asked to report its
+        sensor key, with the same reporting policy, so values the filter
+        would drop are not sent at all.
+        """
+        write_filter = StateWriteFilter(self.hass, self._status_reporting, write)
+        state_writes = self._device.metrics.setdefault("state_writes", {})
+        state_writes[self.entity_id] = write_filter.stats
+        unregister_reporting = self._device.async_register_sensor_reporting(
+            self.entity_description.key, asdict(self._status_reporting)
+        )
+
+        @callback
+        def _async_remove() -> None:
+            write_filter.async_cancel()
+            state_writes.pop(self.entity_id, None)
+            unregister_reporting()
+
+        self.async_on_remove(_async_remove)
+        return write_filter
+
+
+@callback
+def async_setup_capability_entities(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    platform: Platform,
+    device: VASatelliteDevice,
+    async_add_entities: AddConfigEntryEntitiesCallback,
+    supported_entities: Callable[
+        [VASatelliteDevice], dict[type[VASatelliteEntity], bool | None]
+    ],
+) -> None:
+    """Add or remove entities that depend on device capabilities.
+
+    supported_entities returns each capability dependent entity class and
+    whether the device supports it, or None when the capabilities received
+    do not say.  It is re-evaluated whenever new capabilities are received,
+    so a device that answers after setup gets its entities without
+    reloading the config entry.  An entity is only removed from the entity
+    registry when the device reports that it lacks the capability, so a
+    partial capabilities payload keeps the user's entity customizations.
+    """
+    added: set[type[VASatelliteEntity]] = set()
+
+    @callback
+    def _async_update_entities(*_: object) -> None:
+        new_entities: list[VASatelliteEntity] = []
+        ent_reg = er.async_get(hass)
+
+        for entity_class, supported in supported_entities(device).items():
+            if supported:
+                if entity_class not in added:
+                    added.add(entity_class)
+                    new_entities.append(entity_class(device))
+                continue
+
+            if supported is None:
+                # Capability not reported, keep any existing entity
+                continue
+
+            added.discard(entity_class)
+            unique_id = f"{device.satellite_id}-{entity_class.entity_description.key}"
+            if entity_id := ent_reg.async_get_entity_id(platform, DOMAIN, unique_id):
+                ent_reg.async_remove(entity_id)
+
+        if new_entities:
+            async_add_entities(new_entities)
+
+    _async_update_entities()
+
+    config_entry.async_on_unload(
+        async_dispatcher_connect(
+            hass,
+            device.signal(CAPABILITIES_EVENT_TYPE),
+            _async_update_entities,
+        )
+    )
+
+
+def capability_supported(capabilities: dict[str, Any] | None, key: str) -> bool | None:
+    """Return if a capability is reported as supported, None if not reported."""
+    if capabilities is None or key not in capabilities:
+        return None
+    return bool(capabilities[key])
@@ -1,10 +1,11 @@
 """Media player entity for VA Wyoming."""
 
 from __future__ import annotations
-from datetime import datetime
 
+from dataclasses import asdict
+from datetime import datetime
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Final
 
 from homeassistant.components import media_source
 from homeassistant.components.media_player import (
@@ -20,18 +21,27 @@ from homeassistant.components.media_player import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.util import dt as dt_util
 
 from .const import DOMAIN
-from .custom import CustomActions, STATUS_EVENT_TYPE
+from .custom import CustomActions
 from .devices import VASatelliteDevice
-from .entity import VASatelliteEntity
+from .entity import StatusReporting, VASatelliteEntity
 
 if TYPE_CHECKING:
     from homeassistant.components.wyoming import DomainDataItem
 
 _LOGGER = logging.getLogger(__name__)
 
+# Reported position is only written when it is further than this from where
+# the frontend, extrapolating from media_position_updated_at, expects it
+_POSITION_TOLERANCE: Final = 2
+# Position is extrapolated between reports, so it is only needed on a jump
+_STATUS_REPORTING: Final = {
+    "position": StatusReporting(absolute_deadband=_POSITION_TOLERANCE),
+    "duration": StatusReporting(),
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -87,25 +97,67 @@ class WyomingMediaPlayer(VASatelliteEntity, MediaPlayerEntity):
         if getattr(self, '_attr_volume_level', None) is None:
             self._attr_volume_level = 0.9
 
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                f"{DOMAIN}_{self._device.device_id}_{STATUS_EVENT_TYPE}_update",
-                self._handle_status_update,
-            )
+        self._position_stats = self._device.metrics.setdefault(
+            "media_position", {"written": 0, "suppressed": 0}
         )
 
+        for key, reporting in _STATUS_REPORTING.items():
+            self.async_on_remove(
+                self._device.status_router.async_register(
+                    key, self._handle_status_update
+                )
+            )
+            self.async_on_remove(
+                self._device.async_register_status_reporting(key, asdict(reporting))
+            )
+
     @callback
     def _handle_status_update(self, event_data: dict[str, Any]) -> None:
         """Handle status update."""
-        if "position" in event_data:
-            self._attr_media_position = event_data["position"]
-        if "duration" in event_data:
-            self._attr_media_duration = event_data["duration"]
-        
-        self._attr_media_position_updated_at = datetime.utcnow()
+        now = dt_util.utcnow()
+        position = event_data.get("position", self._attr_media_position)
+        duration = event_data.get("duration", self._attr_media_duration)
+
+        if duration == self._attr_media_duration and not self._position_drifted(
+            position, now
+        ):
+            self._position_stats["suppressed"] += 1
+            return
+
+        self._attr_media_position = position
+        self._attr_media_duration = duration
+        self._attr_media_position_updated_at = now
+        self._position_stats["written"] += 1
         self.async_write_ha_state()
 
+    def _expected_position(self, now: datetime) -> float | None:
+        """Return the position extrapolated from the last written one."""
+        if (
+            self._attr_media_position is None
+            or self._attr_media_position_updated_at is None
+        ):
+            return None
+        if self._attr_state != MediaPlayerState.PLAYING:
+            return self._attr_media_position
+        return (
+            self._attr_media_position
+            + (now - self._attr_media_position_updated_at).total_seconds()
+        )
+
+    def _position_drifted(self, position: float | None, now: datetime) -> bool:
+        """Return True if position is not where extrapolation puts it."""
+        if (expected := self._expected_position(now)) is None or position is None:
+            return expected != position
+        return abs(position - expected) > _POSITION_TOLERANCE
+
+    @callback
+    def _anchor_position(self) -> None:
+        """Restart extrapolation from the current position on a state change."""
+        now = dt_util.utcnow()
+        if (position := self._expected_position(now)) is not None:
+            self._attr_media_position = position
+            self._attr_media_position_updated_at = now
+
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
         await self.async_media_play()
@@ -173,6 +225,7 @@ class WyomingMediaPlayer(VASatelliteEntity, MediaPlayerEntity):
             command=CustomActions.MEDIA_PLAY,
             payload={"volume": (self._attr_volume_level or 0) * 100},
         )
+        self._anchor_position()
         self._attr_state = MediaPlayerState.PLAYING
         self.async_write_ha_state()
 
@@ -182,6 +235,7 @@ class WyomingMediaPlayer(VASatelliteEntity, MediaPlayerEntity):
         self._device.send_custom_action(
             command=CustomActions.MEDIA_PAUSE,
         )
+        self._anchor_position()
         self._attr_state = MediaPlayerState.PAUSED
         self.async_write_ha_state()
 
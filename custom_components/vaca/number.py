@@ -6,13 +6,17 @@ from typing import TYPE_CHECKING, Final
 
 from homeassistant.components.number import NumberEntityDescription, RestoreNumber
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import EntityCategory
+from homeassistant.const import EntityCategory, Platform, UnitOfTime
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import DOMAIN
 from .devices import VASatelliteDevice
-from .entity import VASatelliteEntity
+from .entity import (
+    VASatelliteEntity,
+    async_setup_capability_entities,
+    capability_supported,
+)
 
 if TYPE_CHECKING:
     from homeassistant.components.wyoming import DomainDataItem
@@ -20,6 +24,7 @@ if TYPE_CHECKING:
 _MAX_MIC_GAIN: Final = 100
 _MIN_SOUND_VOLUME: Final = 0
 _MAX_SOUND_VOLUME: Final = 10
+_MAX_AUDIO_LEAD: Final = 5000
 
 
 async def async_setup_entry(
@@ -45,14 +50,32 @@ async def async_setup_entry(
             WyomingSatelliteScreenBrightnessNumber(device),
             WyomingSatelliteWakeWordThresholdNumber(device),
             WyomingSatelliteZoomLevelNumber(device),
+            WyomingSatelliteAudioLeadNumber(device),
         ]
     )
 
-    if device.capabilities and device.capabilities.get("has_front_camera"):
-        entities.append(WyomingSatelliteMotionDetectionSensitivityNumber(device))
-
     async_add_entities(entities)
 
+    async_setup_capability_entities(
+        hass,
+        config_entry,
+        Platform.NUMBER,
+        device,
+        async_add_entities,
+        _supported_entities,
+    )
+
+
+def _supported_entities(
+    device: VASatelliteDevice,
+) -> dict[type[VASatelliteEntity], bool | None]:
+    """Return capability dependent entities and if the device supports them."""
+    return {
+        WyomingSatelliteMotionDetectionSensitivityNumber: capability_supported(
+            device.capabilities, "has_front_camera"
+        ),
+    }
+
 
 class WyomingSatelliteMicGainNumber(VASatelliteEntity, RestoreNumber):
     """Entity to represent mic gain amount."""
@@ -274,6 +297,39 @@ class WyomingSatelliteZoomLevelNumber(VASatelliteEntity, RestoreNumber):
         )
 
 
+class WyomingSatelliteAudioLeadNumber(VASatelliteEntity, RestoreNumber):
+    """Entity to represent how far audio is sent ahead of playback."""
+
+    entity_description = NumberEntityDescription(
+        key="audio_lead",
+        translation_key="audio_lead",
+        icon="mdi:timer-music-outline",
+        entity_category=EntityCategory.CONFIG,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+    )
+    _attr_should_poll = False
+    _attr_native_min_value = 0
+    _attr_native_max_value = _MAX_AUDIO_LEAD
+    _attr_native_step = 100
+    _attr_native_value = 0
+
+    async def async_added_to_hass(self) -> None:
+        """When entity is added to Home Assistant."""
+        await super().async_added_to_hass()
+
+        state = await self.async_get_last_state()
+        if state is not None:
+            await self.async_set_native_value(float(state.state))
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set new value."""
+        audio_lead = int(max(0, min(_MAX_AUDIO_LEAD, value)))
+        self._attr_native_value = audio_lead
+        self.async_write_ha_state()
+        # Used by the satellite entity to pace audio, 0 sends unpaced
+        self._device.set_audio_lead(audio_lead)
+
+
 class WyomingSatelliteMotionDetectionSensitivityNumber(
     VASatelliteEntity, RestoreNumber
 ):
@@ -0,0 +1,345 @@
+"""Interruptible audio playback on a satellite."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Coroutine
+from contextlib import suppress
+from dataclasses import dataclass, field
+import heapq
+from itertools import count
+import logging
+import time
+from typing import Any, Final, Generic, TypeVar
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Buffer fill reported by the satellite is trusted for this long
+_BUFFER_REPORT_MAX_AGE: Final = 2.0
+
+
+class PlaybackReplacedError(Exception):
+    """A queued item was replaced before it was played."""
+
+
+class AudioPacer:
+    """Keep audio writes a fixed lead ahead of playback on the satellite.
+
+    The satellite's buffer is taken from its last buffer fill report when
+    recent, otherwise estimated as audio sent less time since the first
+    chunk.  Writes wait while more than the lead is buffered.
+    """
+
+    def __init__(
+        self,
+        lead: float,
+        buffer_report: Callable[[], tuple[float, float] | None],
+        stats: dict[str, Any],
+    ) -> None:
+        """Initialize pacer."""
+        self.lead = lead
+        self._buffer_report = buffer_report
+        self._start: float | None = None
+        self._sent = 0.0
+        self.stats = stats
+
+    def buffered(self, now: float) -> float:
+        """Return seconds of audio buffered on the satellite."""
+        if self._start is None:
+            return 0.0
+        if (report := self._buffer_report()) is not None:
+            buffered, reported = report
+            if reported >= self._start and now - reported < _BUFFER_REPORT_MAX_AGE:
+                return buffered - (now - reported)
+        return self._sent - (now - self._start)
+
+    async def async_pace(
+        self, seconds: float, sleep: Callable[[float], Coroutine[Any, Any, Any]]
+    ) -> None:
+        """Wait until a chunk of seconds length should be written."""
+        now = time.monotonic()
+        if self._start is None:
+            self._start = now
+
+        buffered = self.buffered(now)
+        if buffered <= 0 and self._sent:
+            # Playback caught up with us, it restarts from the next chunk
+            self.stats["underruns"] += 1
+            self._start = now - self._sent
+            buffered = 0.0
+
+        lead_ms = round(buffered * 1000)
+        self.stats["last_lead_ms"] = lead_ms
+        if self._sent:
+            self.stats["min_lead_ms"] = min(
+                self.stats.get("min_lead_ms", lead_ms), lead_ms
+            )
+
+        if (delay := buffered - self.lead) > 0:
+            self.stats["paced_seconds"] = round(self.stats["paced_seconds"] + delay, 3)
+            await sleep(delay)
+        self._sent += seconds
+
+
+class Playback:
+    """An audio stream being sent to the satellite.
+
+    Writers check interrupted before each chunk.  Work that produces audio
+    (a decoder, a TTS stream) registers a callback to be stopped as soon as
+    the playback is interrupted.
+    """
+
+    def __init__(self, kind: str, pacer: AudioPacer | None = None) -> None:
+        """Initialize playback."""
+        self.kind = kind
+        self.started = time.monotonic()
+        self.interrupted = False
+        self._pacer = pacer
+        self._interrupted_event = asyncio.Event()
+        self._interrupt_callbacks: list[CALLBACK_TYPE] = []
+
+    async def async_pace(self, seconds: float) -> None:
+        """Wait until a chunk should be written, if the playback is paced."""
+        if self._pacer is not None and not self.interrupted:
+            await self._pacer.async_pace(seconds, self._async_sleep)
+
+    async def _async_sleep(self, delay: float) -> None:
+        """Sleep, returning early if the playback is interrupted."""
+        with suppress(TimeoutError):
+            async with asyncio.timeout(delay):
+                await self._interrupted_event.wait()
+
+    @callback
+    def async_on_interrupt(self, interrupt_callback: CALLBACK_TYPE) -> None:
+        """Call interrupt_callback if the playback is interrupted."""
+        if self.interrupted:
+            interrupt_callback()
+            return
+        self._interrupt_callbacks.append(interrupt_callback)
+
+    @callback
+    def async_interrupt(self) -> None:
+        """Stop the playback."""
+        if self.interrupted:
+            return
+        self.interrupted = True
+        self._interrupted_event.set()
+        while self._interrupt_callbacks:
+            self._interrupt_callbacks.pop()()
+
+    async def async_wait(self, event: asyncio.Event, timeout: float) -> bool:
+        """Wait for event, returning False on timeout or interruption."""
+        waiters = [
+            asyncio.ensure_future(event.wait()),
+            asyncio.ensure_future(self._interrupted_event.wait()),
+        ]
+        try:
+            await asyncio.wait(
+                waiters, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        return event.is_set() and not self.interrupted
+
+
+class PlaybackController:
+    """Track playback on a satellite, so TTS and announcements can be stopped."""
+
+    def __init__(self, stats: dict[str, Any] | None = None) -> None:
+        """Initialize controller."""
+        self.current: Playback | None = None
+        # Last buffer fill reported by the satellite, in seconds, and when
+        self._buffer_report: tuple[float, float] | None = None
+        self.stats = stats if stats is not None else {}
+        for key in ("interrupted", "underruns", "paced_seconds"):
+            self.stats.setdefault(key, 0)
+
+    @callback
+    def async_start(self, kind: str, lead: float = 0) -> Playback:
+        """Start a playback, interrupting any current one.
+
+        With a lead in seconds, writes are paced to stay that far ahead of
+        playback on the satellite.
+        """
+        self.async_interrupt()
+        pacer = (
+            AudioPacer(lead, lambda: self._buffer_report, self.stats)
+            if lead > 0
+            else None
+        )
+        self.current = Playback(kind, pacer)
+        return self.current
+
+    @callback
+    def async_buffer_reported(self, buffered_ms: float) -> None:
+        """Record the audio buffer fill reported by the satellite."""
+        self._buffer_report = (buffered_ms / 1000, time.monotonic())
+
+    @callback
+    def async_finish(self, playback: Playback) -> None:
+        """Mark a playback as finished."""
+        if self.current is playback:
+            self.current = None
+
+    @callback
+    def async_interrupt(self) -> None:
+        """Interrupt the current playback."""
+        if (playback := self.current) is None:
+            return
+        self.current = None
+        _LOGGER.debug("Interrupting %s playback", playback.kind)
+        self.stats["interrupted"] += 1
+        playback.async_interrupt()
+
+
+@dataclass(order=True)
+class _QueuedPlayback(Generic[_T]):
+    """An item waiting in a playback queue, ordered by priority then age."""
+
+    sort_key: tuple[int, int]
+    item: _T = field(compare=False)
+    future: asyncio.Future[None] = field(compare=False)
+    merge: bool = field(compare=False, default=True)
+    queued: float = field(compare=False, default_factory=time.monotonic)
+
+
+class PlaybackQueue(Generic[_T]):
+    """Serialize playback of announcements on a satellite.
+
+    Items are played highest priority first, then in the order queued.
+    When playback starts, every waiting item of the same priority is taken
+    and played together, so back-to-back announcements share one audio
+    stream, unless queued without merge.  Queuing with replace drops the
+    items of the same priority still waiting, which raise PlaybackReplacedError.
+    Once every caller of the items playing is cancelled, interrupt is
+    called to stop the playback.
+    """
+
+    def __init__(
+        self,
+        play: Callable[[list[_T]], Coroutine[Any, Any, None]],
+        create_task: Callable[[Coroutine[Any, Any, None]], asyncio.Task],
+        stats: dict[str, Any] | None = None,
+        interrupt: CALLBACK_TYPE | None = None,
+    ) -> None:
+        """Initialize queue."""
+        self._play = play
+        self._create_task = create_task
+        self._interrupt = interrupt
+        self._queue: list[_QueuedPlayback[_T]] = []
+        self._playing: list[_QueuedPlayback[_T]] = []
+        self._sequence = count()
+        self._worker: asyncio.Task | None = None
+
+        self.stats = stats if stats is not None else {}
+        for key in ("depth", "max_depth", "played", "merged", "replaced"):
+            self.stats.setdefault(key, 0)
+        self.stats.setdefault("last_wait_ms", None)
+        self.stats.setdefault("max_wait_ms", 0)
+
+    async def async_play(
+        self,
+        item: _T,
+        priority: int = 0,
+        replace: bool = False,
+        merge: bool = True,
+    ) -> None:
+        """Queue an item and wait until it has been played.
+
+        Raises PlaybackReplacedError if a later item replaced it.
+        """
+        if replace:
+            waiting: list[_QueuedPlayback[_T]] = []
+            for queued in self._queue:
+                if queued.sort_key[0] != -priority:
+                    waiting.append(queued)
+                elif not queued.future.done():
+                    queued.future.set_exception(PlaybackReplacedError())
+                    self.stats["replaced"] += 1
+            heapq.heapify(waiting)
+            self._queue = waiting
+
+        queued = _QueuedPlayback(
+            (-priority, next(self._sequence)),
+            item,
+            asyncio.get_running_loop().create_future(),
+            merge,
+        )
+        heapq.heappush(self._queue, queued)
+        self._update_depth()
+
+        if self._worker is None:
+            self._worker = self._create_task(self._async_run())
+
+        try:
+            await queued.future
+        except asyncio.CancelledError:
+            # A waiting item is skipped by the worker, a playing one is
+            # stopped when no other caller waits for it
+            if (
+                self._interrupt is not None
+                and queued in self._playing
+                and all(playing.future.cancelled() for playing in self._playing)
+            ):
+                self._interrupt()
+            raise
+
+    async def _async_run(self) -> None:
+        """Play queued items until the queue is empty."""
+        batch: list[_QueuedPlayback[_T]] = []
+        try:
+            while batch := self._async_take_batch():
+                now = time.monotonic()
+                for queued in batch:
+                    wait_ms = round((now - queued.queued) * 1000)
+                    self.stats["last_wait_ms"] = wait_ms
+                    self.stats["max_wait_ms"] = max(self.stats["max_wait_ms"], wait_ms)
+                self.stats["played"] += len(batch)
+                self.stats["merged"] += len(batch) - 1
+
+                self._playing = batch
+                try:
+                    await self._play([queued.item for queued in batch])
+                except Exception as err:  # noqa: BLE001
+                    for queued in batch:
+                        if not queued.future.done():
+                            queued.future.set_exception(err)
+                else:
+                    for queued in batch:
+                        if not queued.future.done():
+                            queued.future.set_result(None)
+        finally:
+            self._worker = None
+            self._playing = []
+            # Unload while playing, release every waiting caller
+            for queued in (*batch, *self._queue):
+                if not queued.future.done():
+                    queued.future.cancel()
+            self._queue.clear()
+            self._update_depth()
+
+    def _async_take_batch(self) -> list[_QueuedPlayback[_T]]:
+        """Remove and return the highest priority items to play together."""
+        batch: list[_QueuedPlayback[_T]] = []
+        while self._queue:
+            if (queued := self._queue[0]).future.done():
+                heapq.heappop(self._queue)
+                continue
+            if batch and (
+                queued.sort_key[0] != batch[0].sort_key[0]
+                or not (queued.merge and batch[0].merge)
+            ):
+                break
+            batch.append(heapq.heappop(self._queue))
+        self._update_depth()
+        return batch
+
+    def _update_depth(self) -> None:
+        """Update queue depth statistics."""
+        self.stats["depth"] = len(self._queue)
+        self.stats["max_depth"] = max(self.stats["max_depth"], len(self._queue))
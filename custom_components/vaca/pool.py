@@ -0,0 +1,248 @@
+"""Connection pool for Wyoming STT, TTS and wake word services."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Final
+
+from wyoming.client import AsyncTcpClient
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_call_later
+
+from .audio import EncodedFrame
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.components.wyoming import DomainDataItem, WyomingService
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_CONNECTION_POOLS: Final = f"{DOMAIN}_connection_pools"
+
+_POOL_MAX_SIZE: Final = 2
+_POOL_IDLE_TIMEOUT: Final = 60
+_POOL_CONNECT_TIMEOUT: Final = 5
+
+
+class PooledTcpClient(AsyncTcpClient):
+    """Wyoming TCP client that can be returned to a connection pool."""
+
+    def __init__(self, host: str, port: int) -> None:
+        """Initialize the pooled client."""
+        super().__init__(host, port)
+        self.reusable = True
+        self.last_used = time.monotonic()
+
+    async def write_audio_frame(self, frame: EncodedFrame) -> None:
+        """Write an audio chunk encoded by an AudioFrameEncoder."""
+        assert self._writer is not None
+        self._writer.writelines(frame)
+        await self._writer.drain()
+
+    def is_healthy(self) -> bool:
+        """Return True if the connection is still open in both directions."""
+        return (
+            self._reader is not None
+            and self._writer is not None
+            and not self._reader.at_eof()
+            and not self._writer.is_closing()
+        )
+
+
+class WyomingConnectionPool:
+    """Pool of warm connections to a single Wyoming service."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        port: int,
+        max_size: int = _POOL_MAX_SIZE,
+        idle_timeout: float = _POOL_IDLE_TIMEOUT,
+    ) -> None:
+        """Initialize the pool."""
+        self.hass = hass
+        self.host = host
+        self.port = port
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+
+        self._idle: deque[PooledTcpClient] = deque()
+        self._in_use = 0
+        self._evict_unsub: CALLBACK_TYPE | None = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.health_failures = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return pool statistics."""
+        return {
+            "host": self.host,
+            "port": self.port,
+            "idle": len(self._idle),
+            "in_use": self._in_use,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "health_failures": self.health_failures,
+        }
+
+    @asynccontextmanager
+    async def connection(self) -> AsyncIterator[PooledTcpClient]:
+        """Borrow a connection, returning it to the pool on success."""
+        client = await self._async_acquire()
+        self._in_use += 1
+        try:
+            yield client
+        except BaseException:
+            client.reusable = False
+            raise
+        finally:
+            self._in_use -= 1
+            await self._async_release(client)
+
+    async def async_prewarm(self) -> None:
+        """Open a connection ahead of time if none are idle."""
+        self._evict_idle()
+        if self._idle:
+            return
+
+        try:
+            client = await self._async_connect()
+        except (OSError, TimeoutError) as ex:
+            _LOGGER.debug(
+                "Unable to prewarm connection to %s:%s: %s", self.host, self.port, ex
+            )
+            return
+
+        await self._async_release(client)
+
+    async def async_close(self) -> None:
+        """Close all idle connections."""
+        if self._evict_unsub is not None:
+            self._evict_unsub()
+            self._evict_unsub = None
+
+        while self._idle:
+            await self._idle.popleft().disconnect()
+
+    async def _async_acquire(self) -> PooledTcpClient:
+        """Return a healthy idle connection or open a new one."""
+        self._evict_idle()
+        while self._idle:
+            client = self._idle.pop()
+            if client.is_healthy():
+                self.hits += 1
+                return client
+
+            self.health_failures += 1
+            await client.disconnect()
+
+        self.misses += 1
+        return await self._async_connect()
+
+    async def _async_connect(self) -> PooledTcpClient:
+        """Open a new connection to the service."""
+        client = PooledTcpClient(self.host, self.port)
+        async with asyncio.timeout(_POOL_CONNECT_TIMEOUT):
+            await client.connect()
+        return client
+
+    async def _async_release(self, client: PooledTcpClient) -> None:
+        """Return a connection to the pool or close it."""
+        if (
+            not client.reusable
+            or not client.is_healthy()
+            or len(self._idle) >= self.max_size
+        ):
+            await client.disconnect()
+            return
+
+        client.last_used = time.monotonic()
+        self._idle.append(client)
+        self._schedule_eviction()
+
+    @callback
+    def _schedule_eviction(self) -> None:
+        """Schedule removal of connections that have been idle too long."""
+        if self._evict_unsub is None and self._idle:
+            self._evict_unsub = async_call_later(
+                self.hass, self.idle_timeout, self._async_evict_timer
+            )
+
+    @callback
+    def _async_evict_timer(self, _now: Any) -> None:
+        """Evict idle connections when the timer fires."""
+        self._evict_unsub = None
+        self._evict_idle()
+        self._schedule_eviction()
+
+    @callback
+    def _evict_idle(self) -> None:
+        """Close connections that have passed the idle timeout."""
+        expire_before = time.monotonic() - self.idle_timeout
+        while self._idle and self._idle[0].last_used < expire_before:
+            client = self._idle.popleft()
+            self.evictions += 1
+            self.hass.async_create_background_task(
+                client.disconnect(), "close idle wyoming connection"
+            )
+
+
+@callback
+def async_get_connection_pool(
+    hass: HomeAssistant, service: WyomingService
+) -> WyomingConnectionPool:
+    """Return the connection pool for a Wyoming service."""
+    pools: dict[tuple[str, int], WyomingConnectionPool] = hass.data.setdefault(
+        DATA_CONNECTION_POOLS, {}
+    )
+    key = (service.host, service.port)
+    if (pool := pools.get(key)) is None:
+        pool = pools[key] = WyomingConnectionPool(hass, service.host, service.port)
+    return pool
+
+
+async def async_close_connection_pool(
+    hass: HomeAssistant, service: WyomingService
+) -> None:
+    """Close and remove the connection pool for a Wyoming service."""
+    pools: dict[tuple[str, int], WyomingConnectionPool] = hass.data.get(
+        DATA_CONNECTION_POOLS, {}
+    )
+    if (pool := pools.pop((service.host, service.port), None)) is not None:
+        await pool.async_close()
+
+
+@callback
+def async_prewarm_entity_connection(hass: HomeAssistant, entity_id: str | None) -> None:
+    """Prewarm a pooled connection for a VACA provider entity."""
+    if entity_id is None:
+        return
+
+    ent_reg = er.async_get(hass)
+    if (
+        (entry := ent_reg.async_get(entity_id)) is None
+        or entry.platform != DOMAIN
+        or entry.config_entry_id is None
+    ):
+        return
+
+    item: DomainDataItem | None = hass.data.get(DOMAIN, {}).get(entry.config_entry_id)
+    if item is None:
+        return
+
+    pool = async_get_connection_pool(hass, item.service)
+    hass.async_create_background_task(
+        pool.async_prewarm(), f"prewarm wyoming connection for {entity_id}"
+    )
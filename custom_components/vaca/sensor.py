@@ -12,15 +12,21 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import LIGHT_LUX, PERCENTAGE, EntityCategory
+from homeassistant.const import LIGHT_LUX, PERCENTAGE, EntityCategory, Platform
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.util.dt import parse_datetime
 
 from .const import DOMAIN
+from .custom import CAPABILITIES_EVENT_TYPE
 from .devices import VASatelliteDevice
-from .entity import VASatelliteEntity
+from .entity import (
+    StatusReporting,
+    VASatelliteEntity,
+    async_setup_capability_entities,
+    capability_supported,
+)
 
 if TYPE_CHECKING:
     from homeassistant.components.wyoming import DomainDataItem
@@ -50,18 +56,38 @@ async def async_setup_entry(
         WyomingSatelliteBrowserPathSensor(device),
     ]
 
-    if capabilities := device.capabilities:
-        if capabilities.get("app_version"):
-            entities.append(WyomingSatelliteAppVersionSensor(device))
-        if capabilities.get("has_battery"):
-            entities.append(WyomingSatelliteBatteryLevelSensor(device))
-        if device.has_light_sensor():
-            entities.append(WyomingSatelliteLightSensor(device))
-        if capabilities.get("has_front_camera"):
-            entities.append(WyomingSatelliteLastMotionSensor(device))
-
     async_add_entities(entities)
 
+    async_setup_capability_entities(
+        hass,
+        config_entry,
+        Platform.SENSOR,
+        device,
+        async_add_entities,
+        _supported_entities,
+    )
+
+
+def _supported_entities(
+    device: VASatelliteDevice,
+) -> dict[type[VASatelliteEntity], bool | None]:
+    """Return capability dependent entities and if the device supports them."""
+    capabilities = device.capabilities
+    # Sensor based entities are only decided by a payload listing sensors
+    has_sensors = capabilities is not None and "sensors" in capabilities
+    return {
+        WyomingSatelliteAppVersionSensor: capability_supported(
+            capabilities, "app_version"
+        ),
+        WyomingSatelliteBatteryLevelSensor: capability_supported(
+            capabilities, "has_battery"
+        ),
+        WyomingSatelliteLightSensor: device.has_light_sensor() if has_sensors else None,
+        WyomingSatelliteLastMotionSensor: capability_supported(
+            capabilities, "has_front_camera"
+        ),
+    }
+
 
 class WyomingSatelliteSTTSensor(VASatelliteEntity, RestoreSensor):
     """Entity to represent STT sensor for satellite."""
@@ -197,13 +223,25 @@ class _WyomingSatelliteDeviceSensorBase(VASatelliteEntity, RestoreSensor):
                 self._attr_native_value = state.state
             self.async_write_ha_state()
 
-        self.async_on_remove(
-            async_dispatcher_connect(
-                self.hass,
-                f"{DOMAIN}_{self._device.device_id}_{self._listener_class}",
-                self.status_update,
+        if self._listener_class == "status_update":
+            self._write_filter = self.async_create_write_filter(self._async_write_value)
+            self.async_on_remove(
+                self._device.status_router.async_register_sensor(
+                    self.entity_description.key, self.status_update
+                )
             )
-        )
+        else:
+            self.async_on_remove(
+                async_dispatcher_connect(
+                    self.hass,
+                    self._device.signal(CAPABILITIES_EVENT_TYPE),
+                    self.status_update,
+                )
+            )
+            # Entities added on a capabilities update subscribe after it was
+            # dispatched, so start from the capabilities already received
+            if self._device.capabilities is not None:
+                self.status_update(self._device.capabilities)
 
     def _get_native_value(self, value: Any) -> Any:
         """Get the native value from the data."""
@@ -226,22 +264,14 @@ class _WyomingSatelliteDeviceSensorBase(VASatelliteEntity, RestoreSensor):
     def status_update(self, data: dict[str, Any]) -> None:
         """Update entity."""
         if self._listener_class == "status_update":
-            if sensors := data.get("sensors"):
-                if self.entity_description.key in sensors:
-                    if (
-                        self.entity_description.device_class
-                        == SensorDeviceClass.TIMESTAMP
-                    ):
-                        # Handle timestamp conversion
-                        timestamp_str = sensors[self.entity_description.key]
-                        self._attr_native_value = self._get_timestamp_from_string(
-                            timestamp_str
-                        )
-                    else:
-                        self._attr_native_value = self._get_native_value(
-                            sensors[self.entity_description.key]
-                        )
-                    self.async_write_ha_state()
+            # Router only calls this when the payload contains our sensor key
+            value = data["sensors"][self.entity_description.key]
+            if self.entity_description.device_class == SensorDeviceClass.TIMESTAMP:
+                # Handle timestamp conversion
+                value = self._get_timestamp_from_string(value)
+            else:
+                value = self._get_native_value(value)
+            self._write_filter.async_update(value)
         elif self._listener_class == "capabilities_update":
             if self._device.capabilities and self._device.capabilities.get(
                 self.entity_description.key
@@ -251,10 +281,21 @@ class _WyomingSatelliteDeviceSensorBase(VASatelliteEntity, RestoreSensor):
                 )
                 self.async_write_ha_state()
 
+    @callback
+    def _async_write_value(self, value: Any) -> None:
+        """Write a status value that passed the write filter."""
+        self._attr_native_value = value
+        self.async_write_ha_state()
+
 
 class WyomingSatelliteLightSensor(_WyomingSatelliteDeviceSensorBase):
     """Entity to represent light sensor for satellite."""
 
+    # Lux readings jitter constantly, only write meaningful changes
+    _status_reporting = StatusReporting(
+        absolute_deadband=5, relative_deadband=0.1, min_interval=10
+    )
+
     entity_description = SensorEntityDescription(
         key="light",
         translation_key="light_level",
@@ -276,6 +317,8 @@ class WyomingSatelliteOrientationSensor(_WyomingSatelliteDeviceSensorBase):
 class WyomingSatelliteBatteryLevelSensor(_WyomingSatelliteDeviceSensorBase):
     """Entity to represent battery level sensor for satellite."""
 
+    _status_reporting = StatusReporting(min_interval=30)
+
     entity_description = SensorEntityDescription(
         key="battery_level",
         translation_key="battery_level",
@@ -0,0 +1,91 @@
+"""Persistent storage of satellite info, capabilities and settings."""
+
+from __future__ import annotations
+
+from typing import Any, Final
+
+from wyoming.event import Event
+from wyoming.info import Info
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_STORAGE_VERSION: Final = 1
+_SAVE_DELAY: Final = 10
+
+
+class VASatelliteStore:
+    """Last known state of a satellite, so setup does not wait on the device."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, _STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._data: dict[str, Any] = {}
+
+    async def async_load(self) -> None:
+        """Load stored data."""
+        self._data = await self._store.async_load() or {}
+
+    async def async_remove(self) -> None:
+        """Remove stored data."""
+        await self._store.async_remove()
+
+    @property
+    def info(self) -> Info | None:
+        """Return stored Wyoming info."""
+        if (info := self._data.get("info")) is None:
+            return None
+        return Info.from_event(Event(type="info", data=info))
+
+    @property
+    def capabilities(self) -> dict[str, Any] | None:
+        """Return stored device capabilities."""
+        return self._data.get("capabilities")
+
+    @property
+    def custom_settings(self) -> dict[str, Any] | None:
+        """Return a copy of the last settings published to the device."""
+        if (custom_settings := self._data.get("custom_settings")) is None:
+            return None
+        return dict(custom_settings)
+
+    @property
+    def settings_version(self) -> int:
+        """Return version of the last published settings."""
+        return self._data.get("settings_version", 0)
+
+    @property
+    def settings_hash(self) -> str | None:
+        """Return hash of the last published settings."""
+        return self._data.get("settings_hash")
+
+    @callback
+    def async_set_info(self, info: Info) -> None:
+        """Store Wyoming info."""
+        self._async_update(info=info.to_dict())
+
+    @callback
+    def async_set_capabilities(self, capabilities: dict[str, Any]) -> None:
+        """Store device capabilities."""
+        self._async_update(capabilities=capabilities)
+
+    @callback
+    def async_set_settings(
+        self, custom_settings: dict[str, Any], version: int, settings_hash: str
+    ) -> None:
+        """Store the settings published to the device."""
+        self._async_update(
+            custom_settings=custom_settings,
+            settings_version=version,
+            settings_hash=settings_hash,
+        )
+
+    @callback
+    def _async_update(self, **changes: Any) -> None:
+        """Update stored data and schedule a save."""
+        self._data.update(changes)
+        self._store.async_delay_save(lambda: self._data, _SAVE_DELAY)
@@ -4,8 +4,7 @@ from collections.abc import AsyncIterable
 import logging
 
 from wyoming.asr import Transcribe, Transcript
-from wyoming.audio import AudioChunk, AudioStart, AudioStop
-from wyoming.client import AsyncTcpClient
+from wyoming.audio import AudioStart, AudioStop
 
 from homeassistant.components import stt
 from homeassistant.components.wyoming import DomainDataItem, WyomingService
@@ -16,7 +15,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
+from .audio import AudioFrameEncoder
 from .const import DOMAIN, SAMPLE_CHANNELS, SAMPLE_RATE, SAMPLE_WIDTH
+from .pool import async_get_connection_pool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -91,7 +92,9 @@ class WyomingSttProvider(stt.SpeechToTextEntity):
     ) -> stt.SpeechResult:
         """Process an audio stream to STT service."""
         try:
-            async with AsyncTcpClient(self.service.host, self.service.port) as client:
+            async with async_get_connection_pool(
+                self.hass, self.service
+            ).connection() as client:
                 # Set transcription language
                 await client.write_event(Transcribe(language=metadata.language).event())
 
@@ -104,14 +107,9 @@ class WyomingSttProvider(stt.SpeechToTextEntity):
                     ).event(),
                 )
 
+                encoder = AudioFrameEncoder(SAMPLE_RATE, SAMPLE_WIDTH, SAMPLE_CHANNELS)
                 async for audio_bytes in stream:
-                    chunk = AudioChunk(
-                        rate=SAMPLE_RATE,
-                        width=SAMPLE_WIDTH,
-                        channels=SAMPLE_CHANNELS,
-                        audio=audio_bytes,
-                    )
-                    await client.write_event(chunk.event())
+                    await client.write_audio_frame(encoder.encode(audio_bytes, None))
 
                 # End audio stream
                 await client.write_event(AudioStop().event())
@@ -125,6 +123,9 @@ class WyomingSttProvider(stt.SpeechToTextEntity):
                     if Transcript.is_type(event.type):
                         transcript = Transcript.from_event(event)
                         text = transcript.text
+                        # Events such as a streaming transcript-stop may still
+                        # follow, so the connection is not reused
+                        client.reusable = False
                         break
 
         except (OSError, WyomingError):
@@ -7,15 +7,20 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import STATE_ON, EntityCategory
+from homeassistant.const import STATE_ON, EntityCategory, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import restore_state
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 from .const import DOMAIN
+from .custom import SETTINGS_EVENT_TYPE
 from .devices import VASatelliteDevice
-from .entity import VASatelliteEntity
+from .entity import (
+    VASatelliteEntity,
+    async_setup_capability_entities,
+    capability_supported,
+)
 
 if TYPE_CHECKING:
     from homeassistant.components.wyoming import DomainDataItem
@@ -44,24 +49,40 @@ async def async_setup_entry(
         WyomingSatelliteContinueConversationSwitch(device),
         WyomingSatelliteAlarmSwitch(device),
         WyomingSatelliteScreenOnWakeWordSwitch(device),
+        WyomingSatelliteReplaceAnnouncementsSwitch(device),
     ]
 
-    if capabilities := device.capabilities:
-        if capabilities.get("has_dnd"):
-            entities.append(WyomingSatelliteDNDSwitch(device))
+    async_add_entities(entities)
 
-    if device.supportBump():
-        entities.append(WyomingSatelliteScreenOnBumpSwitch(device))
-
-    if device.supportProximity():
-        entities.append(WyomingSatelliteScreenOnProximitySwitch(device))
+    async_setup_capability_entities(
+        hass,
+        config_entry,
+        Platform.SWITCH,
+        device,
+        async_add_entities,
+        _supported_entities,
+    )
 
-    if device.capabilities and device.capabilities.get("has_front_camera"):
-        entities.append(WyomingSatelliteEnableMotionDetectionSwitch(device))
-        entities.append(WyomingSatelliteScreenOnMotionSwitch(device))
 
-    if entities:
-        async_add_entities(entities)
+def _supported_entities(
+    device: VASatelliteDevice,
+) -> dict[type[VASatelliteEntity], bool | None]:
+    """Return capability dependent entities and if the device supports them."""
+    capabilities = device.capabilities
+    has_front_camera = capability_supported(capabilities, "has_front_camera")
+    # Sensor based entities are only decided by a payload listing sensors
+    has_sensors = capabilities is not None and "sensors" in capabilities
+    return {
+        WyomingSatelliteDNDSwitch: capability_supported(capabilities, "has_dnd"),
+        WyomingSatelliteScreenOnBumpSwitch: (
+            device.supportBump() if has_sensors else None
+        ),
+        WyomingSatelliteScreenOnProximitySwitch: (
+            device.supportProximity() if has_sensors else None
+        ),
+        WyomingSatelliteEnableMotionDetectionSwitch: has_front_camera,
+        WyomingSatelliteScreenOnMotionSwitch: has_front_camera,
+    }
 
 
 class BaseSwitch(VASatelliteEntity, restore_state.RestoreEntity, SwitchEntity):
@@ -105,8 +126,6 @@ class BaseSwitch(VASatelliteEntity, restore_state.RestoreEntity, SwitchEntity):
 class BaseFeedbackSwitch(BaseSwitch):
     """Base class for switches that receive feedback from device."""
 
-    _listener_class = "settings_update"
-
     async def async_added_to_hass(self) -> None:
         """Call when entity about to be added to hass."""
         await super().async_added_to_hass()
@@ -114,7 +133,7 @@ class BaseFeedbackSwitch(BaseSwitch):
         self.async_on_remove(
             async_dispatcher_connect(
                 self.hass,
-                f"{DOMAIN}_{self._device.device_id}_{self._listener_class}",
+                self._device.signal(SETTINGS_EVENT_TYPE),
                 self.status_update,
             )
         )
@@ -309,3 +328,22 @@ class WyomingSatelliteScreenOnMotionSwitch(BaseSwitch):
         entity_category=EntityCategory.CONFIG,
     )
     default_on = False
+
+
+class WyomingSatelliteReplaceAnnouncementsSwitch(BaseSwitch):
+    """Entity to control if a new announcement replaces queued ones."""
+
+    entity_description = SwitchEntityDescription(
+        key="replace_announcements",
+        translation_key="replace_announcements",
+        icon="mdi:playlist-remove",
+        entity_category=EntityCategory.CONFIG,
+    )
+    default_on = False
+
+    async def do_switch(self, value: bool, send_to_device: bool = True) -> None:
+        """Perform the switch action."""
+        self._attr_is_on = value
+        self.async_write_ha_state()
+        # Used by the satellite entity only, not sent to the device
+        self._device.replace_announcements = value
@@ -6,7 +6,6 @@ import logging
 import wave
 
 from wyoming.audio import AudioChunk, AudioStop
-from wyoming.client import AsyncTcpClient
 from wyoming.tts import Synthesize, SynthesizeVoice
 
 from homeassistant.components import tts
@@ -18,7 +17,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
+from .cache import DATA_TTS_CACHES, TtsAudioCache, tts_cache_dir
 from .const import ATTR_SPEAKER, DOMAIN
+from .pool import async_get_connection_pool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,9 +31,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up Wyoming speech-to-text."""
     item: DomainDataItem = hass.data[DOMAIN][config_entry.entry_id]
+
+    cache = TtsAudioCache(hass, tts_cache_dir(hass, config_entry.entry_id))
+    await cache.async_load()
+    hass.data.setdefault(DATA_TTS_CACHES, {})[config_entry.entry_id] = cache
+
     async_add_entities(
         [
-            WyomingTtsProvider(config_entry, item.service),
+            WyomingTtsProvider(config_entry, item.service, cache),
         ]
     )
 
@@ -44,9 +50,11 @@ class WyomingTtsProvider(tts.TextToSpeechEntity):
         self,
         config_entry: ConfigEntry,
         service: WyomingService,
+        cache: TtsAudioCache,
     ) -> None:
         """Set up provider."""
         self.service = service
+        self._cache = cache
         self._tts_service = next(tts for tts in service.info.tts if tts.installed)
 
         voice_languages: set[str] = set()
@@ -112,8 +120,16 @@ class WyomingTtsProvider(tts.TextToSpeechEntity):
         voice_name: str | None = options.get(tts.ATTR_VOICE)
         voice_speaker: str | None = options.get(ATTR_SPEAKER)
 
+        cache_key = TtsAudioCache.cache_key(
+            message, language, voice_name, voice_speaker
+        )
+        if cache_key is not None and (cached := await self._cache.async_get(cache_key)):
+            return ("wav", cached)
+
         try:
-            async with AsyncTcpClient(self.service.host, self.service.port) as client:
+            async with async_get_connection_pool(
+                self.hass, self.service
+            ).connection() as client:
                 voice: SynthesizeVoice | None = None
                 if voice_name is not None:
                     voice = SynthesizeVoice(name=voice_name, speaker=voice_speaker)
@@ -150,4 +166,7 @@ class WyomingTtsProvider(tts.TextToSpeechEntity):
         except (OSError, WyomingError):
             return (None, None)
 
+        if cache_key is not None and wav_writer is not None:
+            await self._cache.async_put(cache_key, data)
+
         return ("wav", data)
@@ -4,8 +4,7 @@ import asyncio
 from collections.abc import AsyncIterable
 import logging
 
-from wyoming.audio import AudioChunk, AudioStart
-from wyoming.client import AsyncTcpClient
+from wyoming.audio import AudioStart
 from wyoming.wake import Detect, Detection
 
 from homeassistant.components import wake_word
@@ -20,7 +19,9 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
+from .audio import AudioFrameEncoder
 from .const import DOMAIN
+from .pool import async_get_connection_pool
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -96,7 +97,9 @@ class WyomingWakeWordProvider(wake_word.WakeWordDetectionEntity):
             return None
 
         try:
-            async with AsyncTcpClient(self.service.host, self.service.port) as client:
+            async with async_get_connection_pool(
+                self.hass, self.service
+            ).connection() as client:
                 # Inform client which wake word we want to detect (None = default)
                 await client.write_event(
                     Detect(names=[wake_word_id] if wake_word_id else None).event()
@@ -110,6 +113,8 @@ class WyomingWakeWordProvider(wake_word.WakeWordDetectionEntity):
                     ).event(),
                 )
 
+                encoder = AudioFrameEncoder(16000, 2, 1)
+
                 # Read audio and wake events in "parallel"
                 audio_task = asyncio.create_task(next_chunk())
                 wake_task = asyncio.create_task(client.read_event())
@@ -170,19 +175,18 @@ class WyomingWakeWordProvider(wake_word.WakeWordDetectionEntity):
                                 break
 
                             chunk_bytes, chunk_timestamp = chunk_info
-                            chunk = AudioChunk(
-                                rate=16000,
-                                width=2,
-                                channels=1,
-                                audio=chunk_bytes,
-                                timestamp=chunk_timestamp,
+                            await client.write_audio_frame(
+                                encoder.encode(chunk_bytes, chunk_timestamp)
                             )
-                            await client.write_event(chunk.event())
 
                             # Next chunk
                             audio_task = asyncio.create_task(next_chunk())
                             pending.add(audio_task)
                 finally:
+                    # The audio stream is left open on the service, so the
+                    # connection cannot be handed to another detection
+                    client.reusable = False
+
                     # Clean up
                     if audio_task in pending:
                         # It's critical that we don't cancel the audio task or